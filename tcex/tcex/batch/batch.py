@@ -5,9 +5,17 @@ import json
 import math
 import os
 import re
-import shelve
+import shutil
+import tempfile
+import threading
 import time
 import uuid
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from itertools import islice
+
+from urllib3.filepost import choose_boundary
 
 from .indicator import (
     custom_indicator_class_factory,
@@ -36,6 +44,11 @@ from .group import (
     Signature,
     Threat,
 )
+from ..logger.trace_logger import LazyArg, TruncatedArg
+from .batch_checkpoint import BatchCheckpoint
+from .chunk_planner import ChunkPlanner
+from .chunk_sizer import ChunkSizer
+from .spill_store import SpillStore
 
 # import local modules for dynamic reference
 module = __import__(__name__)
@@ -88,11 +101,29 @@ class Batch(object):
         self._saved_indicators = None  # indicates indicators shelf file was provided
         self.enable_saved_file = False
 
+        # file upload settings
+        self.file_upload_retries = 3
+        self.file_upload_workers = 4
+
+        # chunk settings
+        self._checkpoint = None
+        self._chunk_info = {}
+        self._chunk_planner = ChunkPlanner()
+        self._chunk_sizer = ChunkSizer()
+        self._chunk_xids = []
+        # associations added to group/indicator objects in memory are added to the planner
+        self._planner_callbacks = {
+            'group': self._plan_group_association,
+            'indicator': self._plan_indicator_association,
+        }
+
         # default properties
         self._batch_data_count = None
         self._poll_interval = None
         self._poll_interval_times = []
+        self._poll_lock = threading.Lock()
         self._poll_timeout = 3600
+        self.poller = None
 
         # containers
         self._files = {}
@@ -112,6 +143,86 @@ class Batch(object):
             'would exceed the number of allowed indicators',
         ]
 
+    def _compact_shelves(self):
+        """Reclaim the shelf space of groups and indicators already added to a batch chunk."""
+        if self._groups_shelf is not None:
+            self._groups_shelf.compact()
+        if self._indicators_shelf is not None:
+            self._indicators_shelf.compact()
+
+    def _plan_chunk(self, limit):
+        """Return the Group and Indicator xids for the next chunk.
+
+        Args:
+            limit (int): The max number of groups and indicators in the chunk.
+
+        Returns:
+            tuple: The list of Group xids and the list of Indicator xids.
+        """
+        return self._planner.plan(limit)
+
+    @property
+    def _planner(self):
+        """Return the chunk planner with all groups and indicators not yet added to a chunk."""
+        if len(self._chunk_planner) != len(self):
+            # groups/indicators were added to or removed from the containers directly
+            self._chunk_planner = ChunkPlanner()
+            for entity_type, entities, shelf in [
+                ('group', self.groups, self.groups_shelf),
+                ('indicator', self.indicators, self.indicators_shelf),
+            ]:
+                for xid, resource in entities.items():
+                    self._chunk_planner.add(xid, entity_type, ChunkPlanner.associations(resource))
+                for xid in shelf.keys():
+                    self._chunk_planner.add(xid, entity_type, shelf.associations(xid))
+        return self._chunk_planner
+
+    def _plan_entity(self, xid, entity_type, resource):
+        """Add a new group or indicator in memory to the chunk planner.
+
+        Args:
+            xid (str): The xid of the group or indicator.
+            entity_type (str): The entity type (group or indicator).
+            resource (dict|obj): The Group or Indicator dict or object.
+        """
+        self._chunk_planner.add(xid, entity_type, ChunkPlanner.associations(resource))
+        if not isinstance(resource, dict):
+            # associations are commonly added to objects after they are added to the batch
+            resource.association_callback = self._planner_callbacks[entity_type]
+
+    def _plan_group_association(self, xid, group_xid):
+        """Add an association of a group object in memory to the chunk planner."""
+        if xid in self.groups:
+            self._chunk_planner.add(xid, 'group', [group_xid])
+
+    def _plan_indicator_association(self, xid, group_xid):
+        """Add an association of an indicator object in memory to the chunk planner."""
+        if xid in self.indicators:
+            self._chunk_planner.add(xid, 'indicator', [group_xid])
+
+    def _record_chunk(self, batch_id, batch_status):
+        """Record the throughput of a completed batch job submitted by this instance.
+
+        Args:
+            batch_id (str): The ID returned from the ThreatConnect API for the batch job.
+            batch_status (dict): The batchStatus of the completed batch job.
+        """
+        chunk_info = self._chunk_info.pop(batch_id, None)
+        if chunk_info is None:
+            return
+
+        self._chunk_sizer.record(
+            chunk_info.get('max_chunk'),
+            chunk_info.get('entities'),
+            chunk_info.get('bytes'),
+            time.time() - chunk_info.get('submit_time'),
+            batch_status.get('successCount', 0),
+            batch_status.get('errorCount', 0),
+        )
+        self.tcex.log.debug(
+            'Batch chunk size: %s', LazyArg(lambda: self._chunk_sizer.stats['chunk_size'])
+        )
+
     def _gen_indicator_class(self):
         """Generate Custom Indicator Classes."""
 
@@ -191,12 +302,15 @@ class Batch(object):
         if self.groups.get(xid) is not None:
             # return existing group from memory
             group_data = self.groups.get(xid)
-        elif self.groups_shelf.get(xid) is not None:
-            # return existing group from shelf
-            group_data = self.groups_shelf.get(xid)
+        elif xid in self.groups_shelf:
+            # return existing group from shelf (objects are returned as is, since the stored
+            # group is already serialized any updates to the object will not be saved)
+            if isinstance(group_data, dict):
+                group_data = self.groups_shelf.get(xid)
         else:
             # store new group
             self.groups[xid] = group_data
+            self._plan_entity(xid, 'group', group_data)
         return group_data
 
     def _indicator(self, indicator_data):
@@ -219,12 +333,15 @@ class Batch(object):
         if self.indicators.get(xid) is not None:
             # return existing indicator from memory
             indicator_data = self.indicators.get(xid)
-        elif self.indicators_shelf.get(xid) is not None:
-            # return existing indicator from shelf
-            indicator_data = self.indicators_shelf.get(xid)
+        elif xid in self.indicators_shelf:
+            # return existing indicator from shelf (objects are returned as is, since the stored
+            # indicator is already serialized any updates to the object will not be saved)
+            if isinstance(indicator_data, dict):
+                indicator_data = self.indicators_shelf.get(xid)
         else:
             # store new indicators
             self.indicators[xid] = indicator_data
+            self._plan_entity(xid, 'indicator', indicator_data)
         return indicator_data
 
     @staticmethod
@@ -260,6 +377,15 @@ class Batch(object):
 
         return indicator_list
 
+    @staticmethod
+    def _row_column(rows, column):
+        """Return the values of a column for rows of dicts or sequences, empty values as None."""
+        if isinstance(rows[0], dict):
+            values = [row.get(column) for row in rows]
+        else:
+            values = [row[column] if column < len(row) else None for row in rows]
+        return [None if v == '' else v for v in values]
+
     @property
     def action(self):
         """Return batch action."""
@@ -356,6 +482,120 @@ class Batch(object):
                 indicator_data['flag2'] = whois_active
         return self._indicator(indicator_data)
 
+    def add_indicators_from_rows(self, rows, indicator_type, mapping, chunk_size=10000, save=False):
+        """Add indicators from rows of tabular data (e.g., CSV or NDJSON) to Batch Job.
+
+        The rows are normalized a chunk at a time directly into batch indicator dicts, without
+        creating Indicator objects. Within a chunk each column is converted column-wise, with
+        each unique value converted once (confidence/rating casts and date formatting).
+
+        Empty values (None or '') are skipped. Rows without a summary are skipped. If no xid
+        column is mapped a reproducible xid is generated from the type and summary. Indicators
+        with an xid that is already in the Batch Job are skipped.
+
+        .. code-block:: python
+
+            with open('feed.csv') as fh:
+                batch.add_indicators_from_rows(
+                    csv.DictReader(fh),
+                    'File',
+                    {'md5': 'md5', 'sha256': 'sha256', 'rating': 'score', 'date_added': 'seen'},
+                )
+
+        Args:
+            rows (iterable): The rows as dicts (e.g., csv.DictReader) or sequences (e.g.,
+                csv.reader).
+            indicator_type (str): The ThreatConnect Indicator type (e.g., Address or File).
+            mapping (dict): The indicator field name to the row column key or index. The field
+                names are the batch field names or the Indicator kwargs (e.g., summary, md5, sha1,
+                sha256, value1, value2, value3, confidence, date_added, rating, xid).
+            chunk_size (int, default:10000): The number of rows normalized at a time.
+            save (bool, default:False): If True the indicators are written to the indicators
+                shelf (disk) instead of memory.
+
+        Returns:
+            int: The number of indicators added.
+        """
+        # the summary fields in the summary order (e.g., md5 : sha1 : sha256)
+        summary_fields = ['summary']
+        if 'summary' not in mapping:
+            summary_fields = [
+                f for f in ['md5', 'sha1', 'sha256', 'value1', 'value2', 'value3'] if f in mapping
+            ]
+        metadata_map = Indicator(indicator_type, None)._metadata_map
+        fields = [
+            (metadata_map.get(field, field), column)
+            for field, column in mapping.items()
+            if field not in summary_fields and field != 'xid'
+        ]
+
+        def format_datetime(value):
+            """Return the batch date format."""
+            return self.tcex.utils.format_datetime(value, date_format='%Y-%m-%dT%H:%M:%SZ')
+
+        converters = {
+            'confidence': int,
+            'dateAdded': format_datetime,
+            'lastModified': format_datetime,
+            'rating': float,
+        }
+        custom_type = indicator_type not in ['Address', 'EmailAddress', 'File', 'Host', 'URL']
+
+        count = 0
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+
+            # column-wise normalization of the chunk
+            summary_columns = [self._row_column(chunk, mapping[f]) for f in summary_fields]
+            xid_column = self._row_column(chunk, mapping['xid']) if 'xid' in mapping else None
+            columns = []
+            for field, column in fields:
+                values = self._row_column(chunk, column)
+                convert = converters.get(field)
+                if convert is not None:
+                    converted = {v: convert(v) for v in set(values) if v is not None}
+                    values = [converted.get(v) for v in values]
+                columns.append(values)
+
+            records = []
+            saved = set()
+            for i in range(len(chunk)):
+                values = [c[i] for c in summary_columns if c[i] is not None]
+                if not values:
+                    continue
+                summary = ' : '.join(values)
+
+                xid = xid_column[i] if xid_column is not None else None
+                if xid is None:
+                    xid = self.generate_xid([indicator_type, summary])
+                if xid in self.indicators or xid in saved or xid in self.indicators_shelf:
+                    continue
+
+                indicator_data = {'summary': summary, 'type': indicator_type}
+                for (field, _), values in zip(fields, columns):
+                    if values[i] is not None:
+                        indicator_data[field] = values[i]
+                indicator_data['xid'] = xid
+                if custom_type:
+                    # for custom indicator types the valueX fields are required
+                    for index, value in enumerate(self._indicator_values(summary), start=1):
+                        indicator_data['value{}'.format(index)] = value
+
+                if save:
+                    records.append(indicator_data)
+                    saved.add(xid)
+                else:
+                    self.indicators[xid] = indicator_data
+                self._chunk_planner.add(xid, 'indicator')
+                count += 1
+
+            if records:
+                self.indicators_shelf.write_many(records)
+        return count
+
     def address(self, ip, **kwargs):
         """Add Address data to Batch object.
 
@@ -448,87 +688,229 @@ class Batch(object):
 
     def close(self):
         """Cleanup batch job."""
-        self.groups_shelf.close()
-        self.indicators_shelf.close()
-        if self.debug and self.enable_saved_file:
+        saved = self.debug and self.enable_saved_file
+        # keep the saved files for debugging, otherwise delete them
+        self.groups_shelf.close(delete=not saved)
+        self.indicators_shelf.close(delete=not saved)
+        if saved:
             fqfn = os.path.join(self.tcex.args.tc_temp_path, 'xids-saved')
             if os.path.isfile(fqfn):
                 os.remove(fqfn)  # remove previous file to prevent duplicates
             with open(fqfn, 'w') as fh:
                 for xid in self.saved_xids:
                     fh.write('{}\n'.format(xid))
-        else:
-            # delete saved files
-            if os.path.isfile(self.group_shelf_fqfn):
-                os.remove(self.group_shelf_fqfn)
-            if os.path.isfile(self.group_shelf_fqfn):
-                os.remove(self.indicator_shelf_fqfn)
+
+    @property
+    def adaptive_chunk(self):
+        """Return adaptive chunk size setting."""
+        return self._chunk_sizer.adaptive
+
+    @adaptive_chunk.setter
+    def adaptive_chunk(self, adaptive):
+        """Set adaptive chunk size setting.
+
+        When enabled the number of entities per chunk (up to batch_max_chunk) is adjusted after
+        each batch job completes, moving towards the chunk size with the best throughput.
+        """
+        self._chunk_sizer.adaptive = self.tcex.utils.to_bool(adaptive)
+
+    @property
+    def batch_max_chunk(self):
+        """Return the max number of groups and indicators in a chunk."""
+        return self._batch_max_chunk
+
+    @batch_max_chunk.setter
+    def batch_max_chunk(self, value):
+        """Set the max number of groups and indicators in a chunk."""
+        self._batch_max_chunk = int(value)
+
+    @property
+    def batch_max_size(self):
+        """Return the target payload size (bytes) of a chunk."""
+        return self._chunk_sizer.max_bytes
+
+    @batch_max_size.setter
+    def batch_max_size(self, value):
+        """Set the target payload size (bytes) of a chunk.
+
+        A chunk is closed once the serialized groups and indicators reach this size. Any planned
+        groups and indicators not added are planned for the next chunk, so associated groups and
+        indicators can be split across chunks when this size is reached.
+        """
+        self._chunk_sizer.max_bytes = int(value) if value else None
+
+    @property
+    def checkpoint(self):
+        """Return the checkpoint journal for submit_all (if enabled)."""
+        return self._checkpoint
+
+    @checkpoint.setter
+    def checkpoint(self, value):
+        """Enable a durable checkpoint journal for submit_all.
+
+        After each chunk the batch id and the xids of the chunk are recorded in the journal. If
+        submit_all does not complete (e.g., the App is restarted) the next call to submit_all
+        will skip all groups and indicators already submitted and resume polling any batch jobs
+        that had not completed. The journal is removed once all batch jobs have completed.
+
+        The journal filename identifies the run and must not be shared by concurrent runs (e.g.,
+        include the name of the feed or the job being processed).
+
+        Args:
+            value (str): The filename of the journal (a relative filename is stored in the
+                tc_temp_path), or None to disable the checkpoint.
+        """
+        if value is True:
+            raise RuntimeError('The batch checkpoint requires the filename of the journal.')
+        if value:
+            value = os.path.join(self.tcex.args.tc_temp_path, value)
+        self._checkpoint = BatchCheckpoint(value) if value else None
+
+    @property
+    def chunk_stats(self):
+        """Return the chunk size and throughput stats of completed batch jobs.
+
+        .. code-block:: javascript
+
+            {
+                "adaptive": true,
+                "chunk_size": 3750,
+                "max_bytes": 5000000,
+                "chunks": [{
+                    "entities": 5000,
+                    "bytes": 2376412,
+                    "seconds": 21.552,
+                    "success_count": 4998,
+                    "error_count": 2,
+                    "entities_per_second": 231.904
+                }],
+                "total_chunks": 1,
+                "total_entities": 5000,
+                "total_bytes": 2376412,
+                "entities_per_second": 231.904
+            }
+        """
+        return self._chunk_sizer.stats
 
     @property
     def data(self):
         """Return the batch data to be sent to the ThreatConnect API.
 
         **Processing Order:**
-        * Process groups in memory up to max batch size.
-        * Process groups in shelf to max batch size.
-        * Process indicators in memory up to max batch size.
-        * Process indicators in shelf up to max batch size.
+        * Plan the groups and indicators for the chunk, keeping associated groups and
+          indicators in the same chunk (up to max batch size).
+        * Process planned groups in memory and then in shelf.
+        * Process planned indicators in memory and then in shelf.
 
         This method will remove the group/indicator from memory and/or shelf.
         """
-        entity_count = 0
         data = {'group': [], 'indicator': []}
-        # process group data
-        group_data, entity_count = self.data_groups(self.groups, entity_count)
-        data['group'].extend(group_data)
-        if entity_count >= self._batch_max_chunk:
-            return data
-        group_data, entity_count = self.data_groups(self.groups_shelf, entity_count)
-        data['group'].extend(group_data)
-        if entity_count >= self._batch_max_chunk:
-            return data
-
-        # process indicator data
-        indicator_data, entity_count = self.data_indicators(self.indicators, entity_count)
-        data['indicator'].extend(indicator_data)
-        if entity_count >= self._batch_max_chunk:
-            return data
-        indicator_data, entity_count = self.data_indicators(self.indicators_shelf, entity_count)
-        data['indicator'].extend(indicator_data)
-        if entity_count >= self._batch_max_chunk:
-            return data
+        size = {'bytes': 0}
+
+        def full():
+            """Return True if the data has reached the max payload size."""
+            return size['bytes'] >= self.batch_max_size
+
+        for entity_type, entity_data in self._data_entities(full if self.batch_max_size else None):
+            data[entity_type].append(entity_data)
+            if self.batch_max_size:
+                size['bytes'] += len(json.dumps(entity_data))
         return data
 
+    def _data_entities(self, full=None, planned_xids=None, entity_types=None):
+        """Yield each group and indicator for the next batch chunk (see :py:meth:`data`).
+
+        The groups and indicators in the chunk are planned by the
+        :py:class:`~tcex.batch.chunk_planner.ChunkPlanner`, so associated groups and indicators
+        are added to the same chunk whenever possible.
+
+        Args:
+            full (callable, optional): A method that returns True when the chunk has reached the
+                max payload size. Checked before each group and indicator, any group or indicator
+                not added to the chunk will be planned for the next chunk.
+            planned_xids (tuple, optional): The Group and Indicator xids of the chunk. Defaults to
+                the next planned chunk.
+            entity_types (list, optional): The entity types (group and/or indicator) to add to
+                the chunk. Any other planned entity will be planned for the next chunk.
+
+        Yields:
+            tuple: The entity type (group or indicator) and the entity data dict.
+        """
+        if planned_xids is None:
+            planned_xids = self._plan_chunk(self._chunk_sizer.chunk_size(self._batch_max_chunk))
+        group_xids, indicator_xids = planned_xids
+        # the xids in the chunk are recorded for the checkpoint journal
+        self._chunk_xids = []
+        planned = [
+            ('group', group_xids, self.groups, self.groups_shelf),
+            ('indicator', indicator_xids, self.indicators, self.indicators_shelf),
+        ]
+        try:
+            for entity_type, xids, entities, shelf in planned:
+                if entity_types is not None and entity_type not in entity_types:
+                    continue
+                for entity_data in self._data_planned(xids, entities, shelf, full):
+                    if entity_type == 'group':
+                        entity_data = self.data_group_type(entity_data)
+                    elif not isinstance(entity_data, dict):
+                        entity_data = entity_data.data
+                    self._chunk_xids.append(entity_data.get('xid'))
+                    yield entity_type, entity_data
+        finally:
+            if len(self._chunk_xids) < len(group_xids) + len(indicator_xids):
+                # return any planned groups/indicators not added to the chunk to the planner
+                for entity_type, xids, entities, shelf in planned:
+                    for xid in xids:
+                        if xid in entities or xid in shelf:
+                            self._chunk_planner.restore(xid, entity_type)
+
+    @staticmethod
+    def _data_planned(xids, entities, shelf, full=None):
+        """Remove and yield the planned groups or indicators from memory and then the shelf.
+
+        Args:
+            xids (list): The planned xids.
+            entities (dict): The groups or indicators in memory.
+            shelf (SpillStore): The groups or indicators in the shelf.
+            full (callable, optional): A method that returns True when the chunk is full.
+
+        Yields:
+            dict|obj: The Group or Indicator dict or object.
+        """
+        shelf_xids = []
+        for xid in xids:
+            if full is not None and full():
+                return
+            resource = entities.pop(xid, None)
+            if resource is not None:
+                yield resource
+            elif xid in shelf:
+                shelf_xids.append(xid)
+
+        # read the shelf in a single sequential pass (records are removed as they are read)
+        records = shelf.pop_iter(shelf_xids)
+        while full is None or not full():
+            resource = next(records, None)
+            if resource is None:
+                return
+            yield resource
+
     def data_group_association(self, xid):
         """Return group dict array following all associations.
 
+        .. Attention:: This method is deprecated, use :py:attr:`data` or :py:meth:`write_data`.
+
         Args:
             xid (str): The xid of the group to retrieve associations.
 
         Returns:
             list: A list of group dicts.
         """
-        groups = []
-        group_data = None
-
-        # get group data from one of the arrays
-        if self.groups.get(xid) is not None:
-            group_data = self.groups.get(xid)
-            del self.groups[xid]
-        elif self.groups_shelf.get(xid) is not None:
-            group_data = self.groups_shelf.get(xid)
-            del self.groups_shelf[xid]
-
-        if group_data is not None:
-            # convert any obj into dict and process file data
-            group_data = self.data_group_type(group_data)
-            groups.append(group_data)
-
-            # recursively get associations
-            for assoc_xid in group_data.get('associatedGroupXid', []):
-                groups.extend(self.data_group_association(assoc_xid))
-
-        return groups
+        warnings.warn(
+            'data_group_association is deprecated, use data', DeprecationWarning, stacklevel=2
+        )
+        planned_xids = self._planner.take(xid)
+        return [g for _, g in self._data_entities(None, planned_xids, ['group'])]
 
     def data_group_type(self, group_data):
         """Return dict representation of group data.
@@ -559,38 +941,79 @@ class Batch(object):
     def data_groups(self, groups, entity_count):
         """Process Group data.
 
+        .. Attention:: This method is deprecated, use :py:attr:`data` or :py:meth:`write_data`.
+            The groups of the next chunk are planned from memory and shelf, the groups argument
+            is not used.
+
         Args:
             groups (list): The list of groups to process.
+            entity_count (int): The number of groups and indicators already in the chunk.
 
         Returns:
-            list: A list of groups including associations
+            tuple: A list of groups including associations and the updated entity count.
         """
-        data = []
-        # process group objects
-        for xid in groups.keys():
-            # get association from group data
-            assoc_group_data = self.data_group_association(xid)
-            data += assoc_group_data
-            entity_count += len(assoc_group_data)
-
-            if entity_count >= self._batch_max_chunk:
-                break
-        return data, entity_count
+        warnings.warn('data_groups is deprecated, use data', DeprecationWarning, stacklevel=2)
+        planned_xids = self._plan_chunk(self._batch_max_chunk - entity_count)
+        data = [g for _, g in self._data_entities(None, planned_xids, ['group'])]
+        return data, entity_count + len(data)
 
     def data_indicators(self, indicators, entity_count):
-        """Process Indicator data."""
-        data = []
-        # process indicator objects
-        for xid, indicator_data in indicators.items():
-            entity_count += 1
-            if isinstance(indicator_data, dict):
-                data.append(indicator_data)
-            else:
-                data.append(indicator_data.data)
-            del indicators[xid]
-            if entity_count >= self._batch_max_chunk:
-                break
-        return data, entity_count
+        """Process Indicator data.
+
+        .. Attention:: This method is deprecated, use :py:attr:`data` or :py:meth:`write_data`.
+            The indicators of the next chunk are planned from memory and shelf, the indicators
+            argument is not used.
+
+        Args:
+            indicators (list): The list of indicators to process.
+            entity_count (int): The number of groups and indicators already in the chunk.
+
+        Returns:
+            tuple: A list of indicators and the updated entity count.
+        """
+        warnings.warn('data_indicators is deprecated, use data', DeprecationWarning, stacklevel=2)
+        planned_xids = self._plan_chunk(self._batch_max_chunk - entity_count)
+        data = [i for _, i in self._data_entities(None, planned_xids, ['indicator'])]
+        return data, entity_count + len(data)
+
+    def write_data(self, fh):
+        """Write the next chunk of batch data as JSON to a file handle.
+
+        Each group and indicator is serialized and written as it is removed from memory and/or
+        shelf, so only a single entity is held in memory. The output is identical to
+        ``json.dumps(self.data)``.
+
+        Args:
+            fh (file): A file handle opened in binary mode.
+
+        Returns:
+            tuple: The number of groups and indicators written.
+        """
+        counts = {'bytes': 0, 'group': 0, 'indicator': 0}
+
+        def write(content):
+            """Write content to the file handle tracking the size."""
+            fh.write(content)
+            counts['bytes'] += len(content)
+
+        def full():
+            """Return True if the data has reached the max payload size."""
+            return counts['bytes'] >= self.batch_max_size
+
+        section = 'group'
+        write(b'{"group": [')
+        for entity_type, entity_data in self._data_entities(full if self.batch_max_size else None):
+            if entity_type != section:
+                write(b'], "indicator": [')
+                section = entity_type
+            elif counts[entity_type]:
+                write(b', ')
+            write(json.dumps(entity_data).encode('utf-8'))
+            counts[entity_type] += 1
+        if section == 'group':
+            write(b'], "indicator": [')
+        write(b']}')
+        return counts['group'], counts['indicator']
 
     @property
     def debug(self):
@@ -607,7 +1030,8 @@ class Batch(object):
             name (str): The name for this Group.
             file_name (str): The name for the attached file for this Group.
             date_added (str, kwargs): The date timestamp the Indicator was created.
-            file_content (str;method, kwargs): The file contents or callback method to retrieve
+            file_content (str;method, kwargs): The file contents (bytes, file object, or
+                                               generator of chunks) or callback method to retrieve
                                                file content.
             malware (bool, kwargs): If true the file is considered malware.
             password (bool, kwargs): If malware is true a password for the zip archive is
@@ -697,9 +1121,10 @@ class Batch(object):
             #     time.sleep(5)  # allow time for errors to be processed
             #     r = self.tcex.session.get('/v2/batch/{}/errors'.format(batch_id))
             self.tcex.log.debug(
-                'Retrieve Errors for ID {}: status code {}, errors {}'.format(
-                    batch_id, r.status_code, r.text
-                )
+                'Retrieve Errors for ID %s: status code %s, errors %s',
+                batch_id,
+                r.status_code,
+                TruncatedArg(r.text),
             )
             # self.tcex.log.debug('Retrieve Errors URL {}'.format(r.url))
             # API does not return correct content type
@@ -831,9 +1256,9 @@ class Batch(object):
 
     @property
     def groups_shelf(self):
-        """Return dictionary of all Groups data."""
+        """Return the on disk store of all saved Groups data."""
         if self._groups_shelf is None:
-            self._groups_shelf = shelve.open(self.group_shelf_fqfn, writeback=False)
+            self._groups_shelf = SpillStore(self.group_shelf_fqfn)
         return self._groups_shelf
 
     @property
@@ -971,9 +1396,9 @@ class Batch(object):
 
     @property
     def indicators_shelf(self):
-        """Return dictionary of all Indicator data."""
+        """Return the on disk store of all saved Indicator data."""
         if self._indicators_shelf is None:
-            self._indicators_shelf = shelve.open(self.indicator_shelf_fqfn, writeback=False)
+            self._indicators_shelf = SpillStore(self.indicator_shelf_fqfn)
         return self._indicators_shelf
 
     def intrusion_set(self, name, **kwargs):
@@ -1025,6 +1450,10 @@ class Batch(object):
                 }
             }
 
+        If a :py:class:`~tcex.batch.batch_poller.BatchPoller` is set on the **poller** property
+        (e.g., ``batch.poller = tcex.batch_poller``) the batch job is polled by the shared poller
+        and this method waits on the result.
+
         Args:
             batch_id (str): The ID returned from the ThreatConnect API for the current batch job.
             retry_seconds (int): The base number of seconds used for retries when job is not
@@ -1041,14 +1470,19 @@ class Batch(object):
         if self.halt_on_poll_error is not None:
             halt_on_error = self.halt_on_poll_error
 
-        # initial poll interval
-        if self._poll_interval is None and self._batch_data_count is not None:
+        # initial poll interval (jobs may be polled concurrently, the interval is per job)
+        with self._poll_lock:
+            poll_interval = self._poll_interval
+        batch_data_count = self._chunk_info.get(batch_id, {}).get(
+            'entities', self._batch_data_count
+        )
+        if poll_interval is None and batch_data_count is not None:
             # calculate poll_interval base off the number of entries in the batch data
             # with a minimum value of 5 seconds.
-            self._poll_interval = max(math.ceil(self._batch_data_count / 300), 5)
-        elif self._poll_interval is None:
+            poll_interval = max(math.ceil(batch_data_count / 300), 5)
+        elif poll_interval is None:
             # if not able to calculate poll_interval default to 15 seconds
-            self._poll_interval = 15
+            poll_interval = 15
 
         # poll retry back_off factor
         if back_off is None:
@@ -1067,6 +1501,10 @@ class Batch(object):
             timeout = self.poll_timeout
         else:
             timeout = int(timeout)
+
+        if self.poller is not None:
+            return self._poll_shared(batch_id, poll_interval, timeout, halt_on_error)
+
         params = {'includeAdditional': 'true'}
 
         poll_count = 0
@@ -1074,8 +1512,8 @@ class Batch(object):
         data = {}
         while True:
             poll_count += 1
-            poll_time_total += self._poll_interval
-            time.sleep(self._poll_interval)
+            poll_time_total += poll_interval
+            time.sleep(poll_interval)
             self.tcex.log.info('Batch poll time: {} seconds'.format(poll_time_total))
             try:
                 # retrieve job status
@@ -1090,40 +1528,77 @@ class Batch(object):
                 self.tcex.handle_error(540, [e], halt_on_error)
 
             if data.get('data', {}).get('batchStatus', {}).get('status') == 'Completed':
-                # store last 5 poll times to use in calculating average poll time
-                modifier = poll_time_total * 0.7
-                self._poll_interval_times = self._poll_interval_times[-4:] + [modifier]
+                self._update_poll_interval(poll_count, poll_time_total)
 
-                weights = [1]
-                poll_interval_time_weighted_sum = 0
-                for poll_interval_time in self._poll_interval_times:
-                    poll_interval_time_weighted_sum += poll_interval_time * weights[-1]
-                    # weights will be [1, 1.5, 2.25, 3.375, 5.0625] for all 5 poll times depending
-                    # on how many poll times are available.
-                    weights.append(weights[-1] * 1.5)
-
-                # pop off the last weight so its not added in to the sum
-                weights.pop()
-
-                # calculate the weighted average of the last 5 poll times
-                self._poll_interval = math.floor(poll_interval_time_weighted_sum / sum(weights))
-
-                if poll_count == 1:
-                    # if completed on first poll, reduce poll interval.
-                    self._poll_interval = self._poll_interval * 0.85
-
-                self.tcex.log.debug('Batch Status: {}'.format(data))
+                self.tcex.log.debug('Batch Status: %s', TruncatedArg(data))
+                self._record_chunk(batch_id, data.get('data', {}).get('batchStatus', {}))
                 return data
 
             # update poll_interval for retry with max poll time of 20 seconds
-            self._poll_interval = min(
-                poll_retry_seconds + int(poll_count * poll_interval_back_off), 20
-            )
+            poll_interval = min(poll_retry_seconds + int(poll_count * poll_interval_back_off), 20)
 
             # time out poll to prevent App running indefinitely
             if poll_time_total >= timeout:
                 self.tcex.handle_error(550, [timeout], True)
 
+    def _update_poll_interval(self, poll_count, poll_time_total):
+        """Update the initial poll interval for the next batch job from a completed job.
+
+        Args:
+            poll_count (int): The number of polls until the batch job completed.
+            poll_time_total (int): The number of seconds until the batch job completed.
+        """
+        with self._poll_lock:
+            # store last 5 poll times to use in calculating average poll time
+            modifier = poll_time_total * 0.7
+            self._poll_interval_times = self._poll_interval_times[-4:] + [modifier]
+
+            weights = [1]
+            poll_interval_time_weighted_sum = 0
+            for poll_interval_time in self._poll_interval_times:
+                poll_interval_time_weighted_sum += poll_interval_time * weights[-1]
+                # weights will be [1, 1.5, 2.25, 3.375, 5.0625] for all 5 poll times depending
+                # on how many poll times are available.
+                weights.append(weights[-1] * 1.5)
+
+            # pop off the last weight so its not added in to the sum
+            weights.pop()
+
+            # calculate the weighted average of the last 5 poll times
+            self._poll_interval = math.floor(poll_interval_time_weighted_sum / sum(weights))
+
+            if poll_count == 1:
+                # if completed on first poll, reduce poll interval.
+                self._poll_interval = self._poll_interval * 0.85
+
+    def _poll_shared(self, batch_id, poll_interval, timeout, halt_on_error):
+        """Poll Batch status using the shared poller.
+
+        Args:
+            batch_id (str): The ID returned from the ThreatConnect API for the current batch job.
+            poll_interval (int): The number of seconds before the first poll.
+            timeout (int): The number of seconds before the poll should timeout.
+            halt_on_error (bool): If True any exception will raise an error.
+
+        Returns:
+            dict: The batch status returned from the ThreatConnect API.
+        """
+        future = self.poller.add(batch_id, interval=poll_interval, timeout=timeout)
+        try:
+            # the poller resolves the job by the last poll after the timeout, unless the poller
+            # was never started or was stopped
+            data = future.result(timeout + max(poll_interval, self.poller.max_interval))
+        except FutureTimeoutError:
+            self.tcex.handle_error(550, [timeout], True)
+        except RuntimeError as e:
+            # the error has already been logged by the poller
+            if halt_on_error or e.args[0] == 550:
+                raise
+            return {}
+
+        self._record_chunk(batch_id, data.get('data', {}).get('batchStatus', {}))
+        return data
+
     @property
     def poll_timeout(self):
         """Return current poll timeout value."""
@@ -1160,7 +1635,8 @@ class Batch(object):
             name (str): The name for this Group.
             file_name (str): The name for the attached file for this Group.
             date_added (str, kwargs): The date timestamp the Indicator was created.
-            file_content (str;method, kwargs): The file contents or callback method to retrieve
+            file_content (str;method, kwargs): The file contents (bytes, file object, or
+                generator of chunks) or callback method to retrieve
                 file content.
             publish_date (str, kwargs): The publish datetime expression for this Group.
             xid (str, kwargs): The external id for this Group.
@@ -1172,7 +1648,7 @@ class Batch(object):
         return self._group(group_obj)
 
     def save(self, resource):
-        """Save group|indicator dict or object to shelve.
+        """Save group|indicator dict or object to the on disk shelf.
 
         Best effort to save group/indicator data to disk.  If for any reason the save fails
         the data will still be accessible from list in memory.
@@ -1199,6 +1675,7 @@ class Batch(object):
                     saved = False
 
                 if saved:
+                    self._chunk_planner.add(xid, 'group', ChunkPlanner.associations(resource))
                     try:
                         del self._groups[xid]
                     except KeyError:
@@ -1212,6 +1689,7 @@ class Batch(object):
                     saved = False
 
                 if saved:
+                    self._chunk_planner.add(xid, 'indicator', ChunkPlanner.associations(resource))
                     try:
                         del self._indicators[xid]
                     except KeyError:
@@ -1226,7 +1704,7 @@ class Batch(object):
             fqfn_saved = os.path.join(self.tcex.args.tc_temp_path, 'groups-saved')
             if (
                 self.enable_saved_file
-                and os.path.isfile(fqfn_saved)
+                and os.path.isdir(fqfn_saved)
                 and os.access(fqfn_saved, os.R_OK)
             ):
                 self._saved_groups = True
@@ -1241,7 +1719,7 @@ class Batch(object):
             fqfn_saved = os.path.join(self.tcex.args.tc_temp_path, 'indicators-saved')
             if (
                 self.enable_saved_file
-                and os.path.isfile(fqfn_saved)
+                and os.path.isdir(fqfn_saved)
                 and os.access(fqfn_saved, os.R_OK)
             ):
                 self._saved_indicators = True
@@ -1362,7 +1840,9 @@ class Batch(object):
             batch_data['uploadStatus'] = self.submit_files(halt_on_error)
         return batch_data
 
-    def submit_all(self, poll=True, errors=True, process_files=True, halt_on_error=True):
+    def submit_all(
+        self, poll=True, errors=True, process_files=True, halt_on_error=True, max_in_flight=None
+    ):
         """Submit Batch request to ThreatConnect API.
 
         By default this method will submit the job request and data and if the size of the data
@@ -1377,70 +1857,264 @@ class Batch(object):
         Each of these methods can also be called on their own for greater control of the submit
         process.
 
+        When **max_in_flight** is greater than 1 the submit is pipelined. The next chunk of data
+        is built and uploaded while previous batch jobs are still being polled, with at most
+        max_in_flight batch jobs outstanding at any time. Results are returned in submit order.
+
+        When the **checkpoint** property is enabled each submitted chunk is recorded in a journal.
+        If a previous call did not complete, groups and indicators already submitted are skipped
+        and batch jobs that had not completed are polled (and their files uploaded) first. Batch
+        jobs submitted with poll disabled are not completed until polled by a later call.
+
         Args:
             poll (bool, default:True): Poll for status.
             errors (bool, default:True): Retrieve any batch errors (only if poll is True).
             process_files (bool, default:True): Send any document or report attachments to the API.
             halt_on_error (bool, default:True): If True any exception will raise an error.
+            max_in_flight (int, optional): The max number of batch jobs to poll concurrently.
 
         Returns.
             dict: The Batch Status from the ThreatConnect API.
         """
         batch_data_array = []
-        while True:
-            batch_data = {}
-            batch_id = None
-            if self.action.lower() == 'delete':
-                # while waiting of FR for delete support in createAndUpload submit delete request
-                # the old way (submit job + submit data), still using V2.
-                if len(self) > 0:  # pylint: disable=C1801
-                    batch_id = self.submit_job(halt_on_error)
-                    if batch_id is not None:
-                        batch_data = self.submit_data(batch_id, halt_on_error)
-                else:
-                    batch_data = {}
-            else:
-                batch_data = (
-                    self.submit_create_and_upload(halt_on_error)
-                    .get('data', {})
-                    .get('batchStatus', {})
-                )
-                batch_id = batch_data.get('id')
+        if self._checkpoint is not None:
+            batch_data_array.extend(
+                self._submit_all_resume(poll, errors, process_files, halt_on_error)
+            )
 
-            if not batch_data:
-                break
-            elif batch_id is not None:
-                self.tcex.log.info('Batch ID: {}'.format(batch_id))
-                # job hit queue
-                if poll:
-                    # poll for status
-                    batch_data = (
-                        self.poll(batch_id, halt_on_error=halt_on_error)
-                        .get('data', {})
-                        .get('batchStatus')
-                    )
-                    if errors:
-                        # retrieve errors
-                        error_count = batch_data.get('errorCount', 0)
-                        error_groups = batch_data.get('errorGroupCount', 0)
-                        error_indicators = batch_data.get('errorIndicatorCount', 0)
-                        if error_count > 0 or error_groups > 0 or error_indicators > 0:
-                            self.tcex.log.debug('retrieving batch errors')
-                            batch_data['errors'] = self.errors(batch_id)
-                else:
+        if poll and max_in_flight is not None and int(max_in_flight) > 1:
+            batch_data_array.extend(
+                self._submit_all_pipelined(errors, process_files, halt_on_error, int(max_in_flight))
+            )
+        else:
+            while True:
+                batch_id, batch_data = self._submit_chunk(halt_on_error)
+                if not batch_data:
+                    break
+
+                if batch_id is not None and not poll:
                     # can't process files if status is unknown (polling must be enabled)
                     process_files = False
 
-            if process_files:
-                # submit file data after batch job is complete
-                batch_data['uploadStatus'] = self.submit_files(halt_on_error)
+                batch_data = self._process_chunk(
+                    batch_id,
+                    batch_data,
+                    poll,
+                    errors,
+                    process_files,
+                    halt_on_error,
+                    self._pop_files(),
+                )
+                batch_data_array.append(batch_data)
+
+                if self.debug:
+                    self.write_error_json(batch_data.get('errors'))
+
+        if self._checkpoint is not None and not self._checkpoint.pending:
+            # all chunks have completed, the next submit starts with a new journal
+            self._checkpoint.delete()
+        return batch_data_array
+
+    def _submit_all_resume(self, poll, errors, process_files, halt_on_error):
+        """Skip the groups and indicators in the checkpoint and process any pending batch jobs.
+
+        The groups and indicators submitted in a previous run are removed from memory and the
+        shelf. The file data of Documents and Reports in pending batch jobs is kept and uploaded
+        once the pending batch jobs have completed.
+
+        Args:
+            poll (bool): Poll for status.
+            errors (bool): Retrieve any batch errors (only if poll is True).
+            process_files (bool): Send any document or report attachments to the API.
+            halt_on_error (bool): If True any exception will raise an error.
+
+        Returns.
+            list: The Batch Status for each pending batch job from the ThreatConnect API.
+        """
+        checkpoint = self._checkpoint
+        skipped = 0
+        for groups in [self.groups, self.groups_shelf]:
+            xids = [xid for xid in groups.keys() if xid in checkpoint]
+            skipped += len(xids)
+            if isinstance(groups, SpillStore):
+                groups_data = groups.pop_many(xids)
+            else:
+                groups_data = [groups.pop(xid) for xid in xids]
+            for group_data in groups_data:
+                xid = group_data.get('xid') if isinstance(group_data, dict) else group_data.xid
+                if checkpoint.is_pending(xid):
+                    # store the file data to upload once the batch job has completed
+                    self.data_group_type(group_data)
+
+        for indicators in [self.indicators, self.indicators_shelf]:
+            xids = [xid for xid in indicators.keys() if xid in checkpoint]
+            skipped += len(xids)
+            for xid in xids:
+                del indicators[xid]
+        self._compact_shelves()
+        self.tcex.log.info('Batch checkpoint skipped {:,} groups and indicators.'.format(skipped))
+
+        if not poll:
+            # can't process files if status is unknown (polling must be enabled)
+            process_files = False
+
+        batch_data_array = []
+        pending = checkpoint.pending
+        for i, batch_id in enumerate(pending):
+            # the files are uploaded after all pending batch jobs have completed
+            files = self._pop_files() if i == len(pending) - 1 else {}
+            batch_data = self._process_chunk(
+                batch_id, {'id': batch_id}, poll, errors, process_files, halt_on_error, files
+            )
             batch_data_array.append(batch_data)
 
             if self.debug:
                 self.write_error_json(batch_data.get('errors'))
+        return batch_data_array
+
+    def _submit_all_pipelined(self, errors, process_files, halt_on_error, max_in_flight):
+        """Submit all batch data, polling previous batch jobs while the next chunk is uploaded.
+
+        Args:
+            errors (bool): Retrieve any batch errors.
+            process_files (bool): Send any document or report attachments to the API.
+            halt_on_error (bool): If True any exception will raise an error.
+            max_in_flight (int): The max number of batch jobs to poll concurrently.
+
+        Returns.
+            list: The Batch Status for each chunk from the ThreatConnect API in submit order.
+        """
+        batch_data_array = []
+        in_flight = deque()
+
+        def collect(future):
+            """Store the batch status of a completed chunk (raises any error from the stage)."""
+            batch_data = future.result()
+            batch_data_array.append(batch_data)
+            if self.debug:
+                self.write_error_json(batch_data.get('errors'))
+
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            try:
+                while True:
+                    # surface results (and errors) of any completed jobs as early as possible
+                    while in_flight and in_flight[0].done():
+                        collect(in_flight.popleft())
+
+                    # bound the number of outstanding batch jobs
+                    while len(in_flight) >= max_in_flight:
+                        collect(in_flight.popleft())
+
+                    batch_id, batch_data = self._submit_chunk(halt_on_error)
+                    if not batch_data:
+                        break
+
+                    in_flight.append(
+                        executor.submit(
+                            self._process_chunk,
+                            batch_id,
+                            batch_data,
+                            True,
+                            errors,
+                            process_files,
+                            halt_on_error,
+                            self._pop_files(),
+                        )
+                    )
+
+                while in_flight:
+                    collect(in_flight.popleft())
+            except Exception:
+                # don't start polling for any job not yet started
+                for future in in_flight:
+                    future.cancel()
+                raise
 
         return batch_data_array
 
+    def _submit_chunk(self, halt_on_error):
+        """Submit the next chunk of batch data.
+
+        Args:
+            halt_on_error (bool): If True any exception will raise an error.
+
+        Returns.
+            tuple: The batch id (if any) and the batch status. An empty status indicates that
+                there was no data left to submit.
+        """
+        batch_data = {}
+        batch_id = None
+        if self.action.lower() == 'delete':
+            # while waiting of FR for delete support in createAndUpload submit delete request
+            # the old way (submit job + submit data), still using V2.
+            if len(self) > 0:  # pylint: disable=C1801
+                batch_id = self.submit_job(halt_on_error)
+                if batch_id is not None:
+                    batch_data = self.submit_data(batch_id, halt_on_error)
+        else:
+            batch_data = (
+                self.submit_create_and_upload(halt_on_error).get('data', {}).get('batchStatus', {})
+            )
+            batch_id = batch_data.get('id')
+
+        if self._checkpoint is not None and batch_id is not None and batch_data:
+            self._checkpoint.submitted(batch_id, self._chunk_xids)
+        return batch_id, batch_data
+
+    def _process_chunk(
+        self, batch_id, batch_data, poll, errors, process_files, halt_on_error, files
+    ):
+        """Poll, retrieve errors, and upload files for a previously submitted chunk.
+
+        Args:
+            batch_id (str): The ID returned from the ThreatConnect API for the chunk.
+            batch_data (dict): The batch status returned when the chunk was submitted.
+            poll (bool): Poll for status.
+            errors (bool): Retrieve any batch errors (only if poll is True).
+            process_files (bool): Send any document or report attachments to the API.
+            halt_on_error (bool): If True any exception will raise an error.
+            files (dict): The document and report file data for the groups in this chunk.
+
+        Returns.
+            dict: The Batch Status from the ThreatConnect API.
+        """
+        if batch_id is not None:
+            self.tcex.log.info('Batch ID: {}'.format(batch_id))
+            # job hit queue
+            if poll:
+                # poll for status
+                batch_data = (
+                    self.poll(batch_id, halt_on_error=halt_on_error)
+                    .get('data', {})
+                    .get('batchStatus')
+                )
+                if errors:
+                    # retrieve errors
+                    error_count = batch_data.get('errorCount', 0)
+                    error_groups = batch_data.get('errorGroupCount', 0)
+                    error_indicators = batch_data.get('errorIndicatorCount', 0)
+                    if error_count > 0 or error_groups > 0 or error_indicators > 0:
+                        self.tcex.log.debug('retrieving batch errors')
+                        batch_data['errors'] = self.errors(batch_id)
+            else:
+                # can't process files if status is unknown (polling must be enabled)
+                process_files = False
+
+        if process_files:
+            # submit file data after batch job is complete
+            batch_data['uploadStatus'] = self.submit_files(halt_on_error, files)
+
+        if self._checkpoint is not None and batch_id is not None and poll:
+            # without polling the status is unknown, the batch job is polled on the next submit
+            self._checkpoint.completed(batch_id)
+        return batch_data
+
+    def _pop_files(self):
+        """Return the pending file data and reset the container for the next chunk."""
+        files = self._files
+        self._files = {}
+        return files
+
     def write_error_json(self, errors):
         """Writes the errors for debuging purposes"""
         timestamp = str(time.time()).replace('.', '')
@@ -1453,6 +2127,9 @@ class Batch(object):
     def submit_create_and_upload(self, halt_on_error=True):
         """Submit Batch request to ThreatConnect API.
 
+        The multipart request body is written to a temporary file as the batch data is serialized
+        (see :py:meth:`write_data`) and streamed to the API.
+
         Returns.
             dict: The Batch Status from the ThreatConnect API.
         """
@@ -1460,28 +2137,75 @@ class Batch(object):
         if self.halt_on_batch_error is not None:
             halt_on_error = self.halt_on_batch_error
 
-        content = self.data
-        if content.get('group') or content.get('indicator'):
+        boundary = choose_boundary()
+        with tempfile.TemporaryFile(dir=self.tcex.args.tc_temp_path) as body:
+            # config part
+            body.write(self._multipart_header(boundary, 'config'))
+            body.write(json.dumps(self.settings).encode('utf-8'))
+            # content part
+            body.write(b'\r\n')
+            body.write(self._multipart_header(boundary, 'content'))
+            content_start = body.tell()
+            group_count, indicator_count = self.write_data(body)
+            content_end = body.tell()
+            body.write('\r\n--{}--\r\n'.format(boundary).encode('utf-8'))
+            self._compact_shelves()
+            if not group_count and not indicator_count:
+                return {}
+
             if self.debug:
                 # special code for debugging App using batchV2.
-                self.write_batch_json(content)
+                body.seek(content_start)
+                self.write_batch_json(json.loads(body.read(content_end - content_start)))
 
             # store the length of the batch data to use for poll interval calculations
-            self.tcex.log.info('Batch Group Size: {:,}.'.format(len(content.get('group'))))
-            self.tcex.log.info('Batch Indicator Size {:,}.'.format(len(content.get('indicator'))))
+            self.tcex.log.info('Batch Group Size: {:,}.'.format(group_count))
+            self.tcex.log.info('Batch Indicator Size {:,}.'.format(indicator_count))
 
             try:
-                files = (('config', json.dumps(self.settings)), ('content', json.dumps(content)))
+                body.seek(0)
+                headers = {'Content-Type': 'multipart/form-data; boundary={}'.format(boundary)}
                 params = {'includeAdditional': 'true'}
-                r = self.tcex.session.post('/v2/batch/createAndUpload', files=files, params=params)
-                self.tcex.log.debug('Batch Status Code: {}'.format(r.status_code))
+                submit_time = time.time()
+                r = self.tcex.session.post(
+                    '/v2/batch/createAndUpload', data=body, headers=headers, params=params
+                )
+                self.tcex.log.debug('Batch Status Code: %s', r.status_code)
                 if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
                     self.tcex.handle_error(10510, [r.status_code, r.text], halt_on_error)
-                return r.json()
+                data = r.json()
+
+                # store chunk details to calculate throughput once the batch job completes
+                batch_id = data.get('data', {}).get('batchStatus', {}).get('id')
+                if batch_id is not None:
+                    self._chunk_info[batch_id] = {
+                        'bytes': content_end - content_start,
+                        'entities': group_count + indicator_count,
+                        'max_chunk': self._batch_max_chunk,
+                        'submit_time': submit_time,
+                    }
+                return data
             except Exception as e:
                 self.tcex.handle_error(10505, [e], halt_on_error)
         return {}
 
+    @staticmethod
+    def _multipart_header(boundary, name):
+        """Return the multipart/form-data boundary and headers for a part.
+
+        Args:
+            boundary (str): The multipart boundary.
+            name (str): The name of the form field.
+
+        Returns:
+            bytes: The part header.
+        """
+        return (
+            '--{0}\r\nContent-Disposition: form-data; name="{1}"; filename="{1}"\r\n\r\n'.format(
+                boundary, name
+            ).encode('utf-8')
+        )
+
     def submit_data(self, batch_id, halt_on_error=True):
         """Submit Batch request to ThreatConnect API.
         Args:
@@ -1492,6 +2216,7 @@ class Batch(object):
             halt_on_error = self.halt_on_batch_error
 
         content = self.data
+        self._compact_shelves()
         # store the length of the batch data to use for poll interval calculations
         self._batch_data_count = len(content.get('group')) + len(content.get('indicator'))
         self.tcex.log.info('Batch Size: {:,}'.format(self._batch_data_count))
@@ -1508,46 +2233,62 @@ class Batch(object):
             return r.json()
         return {}
 
-    def submit_files(self, halt_on_error=True):
-        """Submit Files for Documents and Reports to ThreatConnect API.
+    def _file_body(self, content):
+        """Return the request body for file content.
 
-        Critical Errors
-
-        * There is insufficient document storage allocated to this account.
+        Bytes, strings, and file objects are returned as is. Any other iterable (e.g., a
+        generator of chunks) is spooled to a temporary file so that it can be streamed and
+        replayed on retry without holding the entire file in memory.
 
         Args:
-            halt_on_error (bool, default:True): If True any exception will raise an error.
+            content (bytes|str|file|iterable): The file content.
 
         Returns:
-            dict: The upload status for each xid.
+            bytes|str|file: The request body.
         """
-        # check global setting for override
-        if self.halt_on_file_error is not None:
-            halt_on_error = self.halt_on_file_error
+        if isinstance(content, (bytes, str)) or hasattr(content, 'read'):
+            return content
 
-        upload_status = []
-        for xid, content_data in self._files.items():
-            del self._files[xid]  # win or loose remove the entry
-            status = True
+        fh = tempfile.TemporaryFile(dir=self.tcex.args.tc_temp_path)
+        for chunk in content:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            fh.write(chunk)
+        fh.seek(0)
+        return fh
 
-            # used for debug/testing to prevent upload of previously uploaded file
-            if self.debug and xid in self.saved_xids:
-                self.tcex.log.debug('skipping previously saved file {}.'.format(xid))
-                continue
+    def _submit_file(self, xid, content_data, halt_on_error):
+        """Submit a single File for a Document or Report to ThreatConnect API.
 
-            # process the file content
-            content = content_data.get('fileContent')
-            if callable(content):
-                content = content_data.get('fileContent')(xid)
-            if content is None:
-                upload_status.append({'uploaded': False, 'xid': xid})
-                self.tcex.log.warning('File content was null for xid {}.'.format(xid))
-                continue
-            if content_data.get('type') == 'Document':
-                api_branch = 'documents'
-            elif content_data.get('type') == 'Report':
-                api_branch = 'reports'
+        Args:
+            xid (str): The xid of the Document or Report.
+            content_data (dict): The file data for the Document or Report.
+            halt_on_error (bool): If True any exception will raise an error.
 
+        Returns:
+            dict: The upload status for the xid or None if the file was skipped.
+        """
+        # used for debug/testing to prevent upload of previously uploaded file
+        if self.debug and xid in self.saved_xids:
+            self.tcex.log.debug('skipping previously saved file %s.', xid)
+            return None
+
+        # process the file content
+        content = content_data.get('fileContent')
+        if callable(content):
+            content = content_data.get('fileContent')(xid)
+        if content is None:
+            self.tcex.log.warning('File content was null for xid {}.'.format(xid))
+            return {'uploaded': False, 'xid': xid}
+        if content_data.get('type') == 'Document':
+            api_branch = 'documents'
+        elif content_data.get('type') == 'Report':
+            api_branch = 'reports'
+
+        body = self._file_body(content)
+        # the start position of a file object, used to rewind the file on retry
+        body_start = body.tell() if hasattr(body, 'seek') else None
+        try:
             if self.debug and content_data.get('fileName'):
                 # special code for debugging App using batchV2.
                 fqfn = os.path.join(
@@ -1557,26 +2298,103 @@ class Batch(object):
                     ),
                 )
                 with open(fqfn, 'wb') as fh:
-                    fh.write(content)
+                    if body_start is None:
+                        fh.write(body)
+                    else:
+                        shutil.copyfileobj(body, fh)
 
             # Post File
             url = '/v2/groups/{}/{}/upload'.format(api_branch, xid)
             headers = {'Content-Type': 'application/octet-stream'}
             params = {'owner': self._owner, 'updateIfExists': 'true'}
-            r = self.submit_file_content('POST', url, content, headers, params, halt_on_error)
-            if r.status_code == 401:
-                # use PUT method if file already exists
-                self.tcex.log.info('Received 401 status code using POST. Trying PUT to update.')
-                r = self.submit_file_content('PUT', url, content, headers, params, halt_on_error)
-            self.tcex.log.debug('{} Upload URL: {}.'.format(content_data.get('type'), r.url))
-            if not r.ok:
-                status = False
-                self.tcex.handle_error(585, [r.status_code, r.text], halt_on_error)
-            elif self.debug:
-                self.saved_xids.append(xid)
-            self.tcex.log.info('Status {} for file upload with xid {}.'.format(r.status_code, xid))
-            upload_status.append({'uploaded': status, 'xid': xid})
-        return upload_status
+            method = 'POST'
+            for attempt in range(self.file_upload_retries + 1):
+                if body_start is not None:
+                    body.seek(body_start)
+
+                # only halt on the final attempt
+                halt = halt_on_error if attempt == self.file_upload_retries else False
+                r = self.submit_file_content(method, url, body, headers, params, halt)
+                if r is not None and r.status_code == 401 and method == 'POST':
+                    # use PUT method if file already exists
+                    self.tcex.log.info(
+                        'Received 401 status code using POST. Trying PUT to update.'
+                    )
+                    method = 'PUT'
+                    if body_start is not None:
+                        body.seek(body_start)
+                    r = self.submit_file_content(method, url, body, headers, params, halt)
+                if r is not None and r.status_code not in [429, 500, 502, 503, 504]:
+                    break
+                if attempt < self.file_upload_retries:
+                    self.tcex.log.warning(
+                        'Retrying file upload for xid {} (attempt {}).'.format(xid, attempt + 1)
+                    )
+                    time.sleep(min(2 ** attempt, 30))
+        finally:
+            if body is not content:
+                # close the temporary file
+                body.close()
+
+        if r is None:
+            return {'uploaded': False, 'xid': xid}
+
+        status = True
+        self.tcex.log.debug('%s Upload URL: %s.', content_data.get('type'), r.url)
+        if not r.ok:
+            status = False
+            self.tcex.handle_error(585, [r.status_code, r.text], halt_on_error)
+        elif self.debug:
+            self.saved_xids.append(xid)
+        self.tcex.log.info('Status {} for file upload with xid {}.'.format(r.status_code, xid))
+        return {'uploaded': status, 'xid': xid}
+
+    def submit_files(self, halt_on_error=True, files=None, max_workers=None):
+        """Submit Files for Documents and Reports to ThreatConnect API.
+
+        Files are uploaded concurrently using up to **max_workers** threads and each upload
+        is retried **file_upload_retries** times on connection errors or 429/5xx responses.
+
+        Critical Errors
+
+        * There is insufficient document storage allocated to this account.
+
+        Args:
+            halt_on_error (bool, default:True): If True any exception will raise an error.
+            files (dict, optional): The file data to upload, defaults to all pending files.
+            max_workers (int, optional): The max number of concurrent uploads, defaults to the
+                file_upload_workers value.
+
+        Returns:
+            list: The upload status for each xid.
+        """
+        # check global setting for override
+        if self.halt_on_file_error is not None:
+            halt_on_error = self.halt_on_file_error
+
+        if files is None:
+            files = self._files
+        if max_workers is None:
+            max_workers = self.file_upload_workers
+
+        # win or loose remove the entries
+        uploads = [(xid, files.pop(xid)) for xid in list(files)]
+        if max_workers <= 1 or len(uploads) <= 1:
+            upload_status = [self._submit_file(xid, cd, halt_on_error) for xid, cd in uploads]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._submit_file, xid, cd, halt_on_error)
+                    for xid, cd in uploads
+                ]
+                try:
+                    upload_status = [future.result() for future in futures]
+                except Exception:
+                    # don't start any remaining uploads on a halting error
+                    for future in futures:
+                        future.cancel()
+                    raise
+        return [status for status in upload_status if status is not None]
 
     def submit_file_content(self, method, url, data, headers, params, halt_on_error=True):
         """Submit File Content for Documents and Reports to ThreatConnect API.
@@ -1614,7 +2432,7 @@ class Batch(object):
         data = r.json()
         if data.get('status') != 'Success':
             self.tcex.handle_error(10510, [r.status_code, r.text], halt_on_error)
-        self.tcex.log.debug('Batch Submit Data: {}'.format(data))
+        self.tcex.log.debug('Batch Submit Data: %s', TruncatedArg(data))
         return data.get('data', {}).get('batchId')
 
     def threat(self, name, **kwargs):
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""ThreatConnect Batch Checkpoint Module"""
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+class BatchCheckpoint(object):
+    """Durable journal of the Batch chunks accepted by the ThreatConnect API.
+
+    Each event is appended to the journal file as a single line of JSON and flushed to disk
+    (fsync) before the submit continues. A partially written last line (e.g., the process was
+    killed during the write) is discarded when the journal is loaded, so an event is either
+    recorded in full or not at all.
+
+    * submitted - the batch id and the group/indicator xids of a chunk accepted by the API.
+    * completed - the batch id of a chunk that has been polled and had its files uploaded.
+
+    A chunk that has been submitted but not completed is pending and will be polled again when
+    the submit is resumed.
+    """
+
+    def __init__(self, fqfn):
+        """Initialize Class Properties.
+
+        Args:
+            fqfn (str): The fully qualified filename of the journal. An existing journal will be
+                reloaded.
+        """
+        self.fqfn = fqfn
+
+        # properties
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._xids = {}
+
+        self._load()
+
+    def _record(self, record):
+        """Append a single event to the journal, flush it to disk, and update the state."""
+        line = '{}\n'.format(json.dumps(record, separators=(',', ':'))).encode('utf-8')
+        with self._lock:
+            with open(self.fqfn, 'ab') as fh:
+                fh.write(line)
+                fh.flush()
+                os.fsync(fh.fileno())
+            self._apply(record)
+
+    def _apply(self, record):
+        """Update the checkpoint state for a journal event."""
+        batch_id = record.get('batch_id')
+        if record.get('event') == 'submitted':
+            self._pending[batch_id] = True
+            for xid in record.get('xids', []):
+                self._xids[xid] = batch_id
+        elif record.get('event') == 'completed':
+            self._pending.pop(batch_id, None)
+
+    def _load(self):
+        """Rebuild the checkpoint state from an existing journal."""
+        if not os.path.isfile(self.fqfn):
+            return
+
+        offset = 0
+        with open(self.fqfn, 'rb') as fh:
+            for line in fh:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    break
+                self._apply(record)
+                offset += len(line)
+
+        if os.path.getsize(self.fqfn) > offset:
+            # remove the incomplete event so the next event starts on a new line
+            with open(self.fqfn, 'r+b') as fh:
+                fh.truncate(offset)
+
+    def completed(self, batch_id):
+        """Record a chunk as completed.
+
+        Args:
+            batch_id (int): The ID returned from the ThreatConnect API for the batch job.
+        """
+        self._record({'event': 'completed', 'batch_id': batch_id})
+
+    def delete(self):
+        """Remove the journal and reset the checkpoint state."""
+        with self._lock:
+            if os.path.isfile(self.fqfn):
+                os.remove(self.fqfn)
+            self._pending.clear()
+            self._xids.clear()
+
+    def is_pending(self, xid):
+        """Return True if the xid was submitted in a chunk that has not completed.
+
+        Args:
+            xid (str): The xid of the group or indicator.
+        """
+        return self._xids.get(xid) in self._pending
+
+    @property
+    def pending(self):
+        """Return the batch ids of chunks that were submitted but not completed."""
+        with self._lock:
+            return list(self._pending)
+
+    def submitted(self, batch_id, xids):
+        """Record a chunk as submitted.
+
+        Args:
+            batch_id (int): The ID returned from the ThreatConnect API for the batch job.
+            xids (list): The xids of the groups and indicators in the chunk.
+        """
+        self._record({'event': 'submitted', 'batch_id': batch_id, 'xids': list(xids)})
+
+    def __contains__(self, xid):
+        """Return True if the xid was submitted in a previous chunk."""
+        return xid in self._xids
+
+    def __len__(self):
+        """Return the number of submitted xids."""
+        return len(self._xids)
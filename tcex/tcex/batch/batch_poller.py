@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""ThreatConnect Batch Poller Module"""
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+
+from ..logger.trace_logger import TruncatedArg
+
+
+class BatchPoller(object):
+    """Poll the status of many Batch jobs on a single scheduled loop.
+
+    Each batch ID added to the poller gets its own poll schedule and back off. When a batch job
+    completes the returned Future is resolved with the batch status response, if the job can not
+    be polled or times out the Future is resolved with a RuntimeError.
+
+    The poller can be driven in a background thread using :py:meth:`start` or by calling
+    :py:meth:`run_pending` directly (e.g., with a fake clock for testing).
+    """
+
+    def __init__(
+        self, tcex, retry_seconds=5, back_off=2.5, max_interval=20, timeout=None, clock=None
+    ):
+        """Initialize Class Properties.
+
+        Args:
+            tcex (obj): An instance of TcEx object.
+            retry_seconds (int, default:5): The base number of seconds between polls of a job
+                that has not completed.
+            back_off (float, default:2.5): A multiplier used to back off on each poll attempt of a
+                job that has not completed.
+            max_interval (int, default:20): The max number of seconds between polls of a job.
+            timeout (int, optional): The default number of seconds before polling of a job
+                times out. Defaults to 3600.
+            clock (callable, optional): A method returning the current time in seconds. Defaults
+                to time.time.
+        """
+        self.tcex = tcex
+        self.back_off = float(back_off)
+        self.clock = clock or time.time
+        self.max_interval = max_interval
+        self.retry_seconds = int(retry_seconds)
+        self.timeout = int(timeout or 3600)
+
+        # properties
+        self._batches = {}
+        self._condition = threading.Condition()
+        self._counter = itertools.count()
+        self._schedule = []
+        self._thread = None
+        self._running = False
+
+    def _error(self, batch, code, message_values):
+        """Resolve the batch Future with a RuntimeError for the provided error code."""
+        self.tcex.handle_error(code, message_values, False)
+        message = self.tcex.error_codes.message(code).format(*message_values)
+        self._resolve(batch, exception=RuntimeError(code, message))
+
+    def _poll(self, batch):
+        """Retrieve the status of a single batch job and reschedule it if not completed."""
+        now = self.clock()
+        batch['poll_count'] += 1
+        self.tcex.log.info(
+            'Batch {} poll time: {:.0f} seconds'.format(batch['batch_id'], now - batch['start'])
+        )
+        try:
+            r = self.tcex.session.get(
+                '/v2/batch/{}'.format(batch['batch_id']), params={'includeAdditional': 'true'}
+            )
+            if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
+                return self._error(batch, 545, [r.status_code, r.text])
+            data = r.json()
+            if data.get('status') != 'Success':
+                return self._error(batch, 545, [r.status_code, r.text])
+        except Exception as e:
+            return self._error(batch, 540, [e])
+
+        if data.get('data', {}).get('batchStatus', {}).get('status') == 'Completed':
+            self.tcex.log.debug('Batch Status: %s', TruncatedArg(data))
+            return self._resolve(batch, result=data)
+
+        # time out poll to prevent App running indefinitely
+        if now - batch['start'] >= batch['timeout']:
+            return self._error(batch, 550, [batch['timeout']])
+
+        # back off for the next poll with max poll interval
+        interval = min(
+            self.retry_seconds + int(batch['poll_count'] * self.back_off), self.max_interval
+        )
+        self._schedule_poll(batch, now + interval)
+        return None
+
+    def _resolve(self, batch, result=None, exception=None):
+        """Remove a batch from the poller and set the result or exception of its Future."""
+        with self._condition:
+            self._batches.pop(batch['batch_id'], None)
+            self._condition.notify_all()
+        if exception is not None:
+            batch['future'].set_exception(exception)
+        else:
+            batch['future'].set_result(result)
+
+    def _run(self):
+        """Poll batches as they become due until the poller is stopped."""
+        while True:
+            wait = self.run_pending()
+            with self._condition:
+                if not self._running:
+                    break
+                if wait is None or wait > 0:
+                    # wait until the next batch is due or a new batch is added
+                    self._condition.wait(wait)
+
+    def _schedule_poll(self, batch, poll_time):
+        """Add the next poll time of a batch to the schedule."""
+        with self._condition:
+            heapq.heappush(self._schedule, (poll_time, next(self._counter), batch['batch_id']))
+            self._condition.notify_all()
+
+    def add(self, batch_id, interval=None, timeout=None, callback=None):
+        """Add a batch job to be polled.
+
+        Args:
+            batch_id (str): The ID returned from the ThreatConnect API for the batch job.
+            interval (int, optional): The number of seconds before the first poll. Defaults to
+                retry_seconds.
+            timeout (int, optional): The number of seconds before polling of the job times out.
+            callback (callable, optional): A method called with the Future when the job
+                completes.
+
+        Returns:
+            Future: A Future resolved with the batch status when the job completes.
+        """
+        with self._condition:
+            if batch_id in self._batches:
+                return self._batches[batch_id]['future']
+
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        now = self.clock()
+        batch = {
+            'batch_id': batch_id,
+            'future': future,
+            'poll_count': 0,
+            'start': now,
+            'timeout': int(timeout or self.timeout),
+        }
+        with self._condition:
+            self._batches[batch_id] = batch
+        if interval is None:
+            interval = self.retry_seconds
+        self._schedule_poll(batch, now + interval)
+        return future
+
+    @property
+    def pending(self):
+        """Return the batch IDs still being polled."""
+        with self._condition:
+            return list(self._batches)
+
+    def run_pending(self):
+        """Poll all batches that are due.
+
+        Returns:
+            float: The number of seconds until the next batch is due or None if there are no
+                batches being polled.
+        """
+        while True:
+            with self._condition:
+                if not self._schedule:
+                    return None
+                poll_time, _, batch_id = self._schedule[0]
+                wait = poll_time - self.clock()
+                if wait > 0:
+                    return wait
+                heapq.heappop(self._schedule)
+                batch = self._batches.get(batch_id)
+            if batch is not None:
+                self._poll(batch)
+
+    def start(self):
+        """Start polling in a background thread."""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name='batch-poller')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread. Batches not completed remain in the poller."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
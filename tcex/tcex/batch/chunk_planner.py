@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""ThreatConnect Batch Chunk Planner Module"""
+from collections import deque, OrderedDict
+
+
+class ChunkPlanner(object):
+    """Plan Batch chunks that keep associated Groups and Indicators together.
+
+    The xids of the Groups and Indicators and the Group xids they are associated with form an
+    undirected graph. The connected components of the graph are maintained incrementally with a
+    disjoint set (union-find) as entities are added, so all entities that reference each other
+    directly or through other entities are in the same component. All operations are iterative,
+    the length of an association chain is not limited by the recursion limit.
+
+    Chunks are packed first fit decreasing, the largest components that fit in the remaining
+    space of the chunk are added first and the remaining space is filled with smaller components.
+    A component larger than a chunk is split across chunks with the Groups first. Entities without
+    any associations (commonly most Indicators) are kept in a separate queue and used to fill the
+    remaining space of each chunk.
+    """
+
+    def __init__(self):
+        """Initialize Class Properties."""
+        # properties
+        self._buckets = {}  # component size -> ordered set of component roots
+        self._members = {}  # component root -> (group xids, indicator xids)
+        self._parent = {}
+        self._present = set()
+        self._singles = OrderedDict()  # xid -> entity type of entities without associations
+
+    @staticmethod
+    def associations(resource):
+        """Return the associated Group xids of a Group or Indicator dict or object.
+
+        Args:
+            resource (dict|obj): The Group or Indicator dict or object.
+
+        Returns:
+            list: The associated Group xids.
+        """
+        if not isinstance(resource, dict):
+            return resource.associations
+        xids = resource.get('associatedGroupXid') or []
+        if resource.get('associatedGroups'):
+            xids = list(xids) + [a.get('groupXid') for a in resource.get('associatedGroups')]
+        return xids
+
+    def _bucket(self, root):
+        """Add a component to the bucket for its size."""
+        size = self._size(root)
+        if size:
+            self._buckets.setdefault(size, OrderedDict())[root] = None
+
+    def _find(self, xid):
+        """Return the root xid of the component, adding the xid if required."""
+        parent = self._parent.setdefault(xid, xid)
+        root = xid
+        while parent != root:
+            root = parent
+            parent = self._parent[root]
+
+        # path compression
+        while xid != root:
+            self._parent[xid], xid = root, self._parent[xid]
+        return root
+
+    def _insert(self, xid, entity_type, first=False):
+        """Add an xid to its component."""
+        root = self._find(xid)
+        self._unbucket(root)
+        members = self._members.setdefault(root, (deque(), deque()))
+        xids = members[0] if entity_type == 'group' else members[1]
+        if first:
+            xids.appendleft(xid)
+        else:
+            xids.append(xid)
+        self._bucket(root)
+        self._present.add(xid)
+
+    def _size(self, root):
+        """Return the number of entities in a component."""
+        groups, indicators = self._members.get(root, ((), ()))
+        return len(groups) + len(indicators)
+
+    def _take(self, root, count, groups, indicators):
+        """Move up to count xids from a component to the chunk, Groups first.
+
+        Returns:
+            int: The number of xids moved.
+        """
+        self._unbucket(root)
+        group_xids, indicator_xids = self._members[root]
+        taken = 0
+        while group_xids and taken < count:
+            groups.append(group_xids.popleft())
+            taken += 1
+        while indicator_xids and taken < count:
+            indicators.append(indicator_xids.popleft())
+            taken += 1
+
+        if group_xids or indicator_xids:
+            self._bucket(root)
+        else:
+            del self._members[root]
+        return taken
+
+    def _union(self, xid_1, xid_2):
+        """Merge the components of two xids, the smaller component is merged into the larger."""
+        for xid in [xid_1, xid_2]:
+            if xid in self._singles:
+                # the entity is no longer without associations
+                self._insert(xid, self._singles.pop(xid))
+        root_1 = self._find(xid_1)
+        root_2 = self._find(xid_2)
+        if root_1 == root_2:
+            return
+
+        if self._size(root_1) < self._size(root_2):
+            root_1, root_2 = root_2, root_1
+        self._parent[root_2] = root_1
+        if self._size(root_2):
+            self._unbucket(root_1)
+            self._unbucket(root_2)
+            group_xids, indicator_xids = self._members.setdefault(root_1, (deque(), deque()))
+            members = self._members.pop(root_2)
+            group_xids.extend(members[0])
+            indicator_xids.extend(members[1])
+            self._bucket(root_1)
+
+    def _unbucket(self, root):
+        """Remove a component from the bucket for its size."""
+        size = self._size(root)
+        bucket = self._buckets.get(size)
+        if bucket is not None:
+            bucket.pop(root, None)
+            if not bucket:
+                del self._buckets[size]
+
+    def add(self, xid, entity_type, associations=None):
+        """Add a Group or Indicator xid and the associated Group xids.
+
+        Adding an xid that was already added merges any new associations.
+
+        Args:
+            xid (str): The xid of the Group or Indicator.
+            entity_type (str): The entity type (group or indicator).
+            associations (list, optional): The associated Group xids.
+        """
+        if not self._present and not self._singles:
+            # remove the components of previous chunks
+            self._parent.clear()
+
+        if xid not in self._present and xid not in self._singles:
+            if associations or xid in self._parent:
+                self._insert(xid, entity_type)
+            else:
+                self._singles[xid] = entity_type
+
+        for association in associations or []:
+            self._union(xid, association)
+
+    def plan(self, limit):
+        """Remove and return the xids for the next chunk.
+
+        Args:
+            limit (int): The max number of Groups and Indicators in the chunk.
+
+        Returns:
+            tuple: The list of Group xids and the list of Indicator xids.
+        """
+        groups = []
+        indicators = []
+        remaining = limit
+        for size in sorted(self._buckets, reverse=True):
+            bucket = self._buckets.get(size)
+            # a component larger than the chunk size is only started in an empty chunk
+            while bucket and remaining > 0 and (size <= remaining or remaining == limit):
+                remaining -= self._take(next(iter(bucket)), remaining, groups, indicators)
+                bucket = self._buckets.get(size)
+            if remaining <= 0:
+                break
+        self._present.difference_update(groups)
+        self._present.difference_update(indicators)
+
+        # fill the remaining space with entities without associations
+        while remaining > 0 and self._singles:
+            xid, entity_type = self._singles.popitem(last=False)
+            if entity_type == 'group':
+                groups.append(xid)
+            else:
+                indicators.append(xid)
+            remaining -= 1
+        return groups, indicators
+
+    def restore(self, xid, entity_type):
+        """Return an xid from a planned chunk that was not added to the chunk.
+
+        Args:
+            xid (str): The xid of the Group or Indicator.
+            entity_type (str): The entity type (group or indicator).
+        """
+        if xid in self._present or xid in self._singles:
+            return
+        if xid in self._parent:
+            self._insert(xid, entity_type, first=True)
+        else:
+            self._singles[xid] = entity_type
+            self._singles.move_to_end(xid, last=False)
+
+    def take(self, xid):
+        """Remove and return the xids of all entities in the component of an xid.
+
+        Args:
+            xid (str): The xid of the Group or Indicator.
+
+        Returns:
+            tuple: The list of Group xids and the list of Indicator xids.
+        """
+        groups = []
+        indicators = []
+        if xid in self._singles:
+            if self._singles.pop(xid) == 'group':
+                groups.append(xid)
+            else:
+                indicators.append(xid)
+        elif xid in self._present:
+            root = self._find(xid)
+            self._take(root, self._size(root), groups, indicators)
+            self._present.difference_update(groups)
+            self._present.difference_update(indicators)
+        return groups, indicators
+
+    def __len__(self):
+        """Return the number of Groups and Indicators not yet planned."""
+        return len(self._present) + len(self._singles)
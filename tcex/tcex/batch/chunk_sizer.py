@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""ThreatConnect Batch Chunk Sizer Module"""
+import threading
+from collections import deque
+
+
+class ChunkSizer(object):
+    """Adaptive Batch chunk size based on the throughput of previous batch jobs.
+
+    The throughput (successful entities per second from submit to completion) is measured over a
+    window of completed batch jobs and compared to the previous window. The chunk size keeps
+    moving in the same direction while throughput improves and reverses direction when it drops.
+    The completion time of a single job is only known to the poll interval, so comparing single
+    jobs would reverse direction on noise.
+    """
+
+    def __init__(
+        self, adaptive=False, max_bytes=None, min_chunk=500, step=0.25, history=100, window=3
+    ):
+        """Initialize Class Properties.
+
+        Args:
+            adaptive (bool, default:False): If True the chunk size is adjusted after each job.
+            max_bytes (int, optional): The target payload size in bytes for a chunk.
+            min_chunk (int, default:500): The min number of entities in an adaptive chunk.
+            step (float, default:0.25): The ratio the chunk size is changed by on each step.
+            history (int, default:100): The number of chunk stats to keep.
+            window (int, default:3): The number of jobs the throughput is measured over before
+                the chunk size is changed.
+        """
+        self.adaptive = adaptive
+        self.max_bytes = max_bytes
+        self.min_chunk = min_chunk
+        self.step = step
+        self.window = window
+
+        # properties
+        self._chunk_size = None
+        self._chunks = deque(maxlen=history)
+        self._direction = -1
+        self._last_rate = None
+        self._lock = threading.Lock()
+        self._totals = {'bytes': 0, 'chunks': 0, 'entities': 0, 'seconds': 0.0, 'success': 0}
+        self._window = []
+
+    def chunk_size(self, ceiling):
+        """Return the number of entities for the next chunk.
+
+        Args:
+            ceiling (int): The max number of entities in a chunk.
+
+        Returns:
+            int: The chunk size.
+        """
+        if not self.adaptive or self._chunk_size is None:
+            return ceiling
+        return min(self._chunk_size, ceiling)
+
+    def record(self, ceiling, entities, payload_bytes, seconds, success_count, error_count):
+        """Record the result of a completed batch job and adjust the chunk size.
+
+        Args:
+            ceiling (int): The max number of entities in a chunk when the chunk was submitted.
+            entities (int): The number of groups and indicators in the chunk.
+            payload_bytes (int): The size of the chunk JSON in bytes.
+            seconds (float): The number of seconds from submit until the job completed.
+            success_count (int): The successCount from the batch status.
+            error_count (int): The errorCount from the batch status.
+        """
+        rate = success_count / seconds if seconds > 0 else 0.0
+        with self._lock:
+            self._chunks.append(
+                {
+                    'entities': entities,
+                    'bytes': payload_bytes,
+                    'seconds': round(seconds, 3),
+                    'success_count': success_count,
+                    'error_count': error_count,
+                    'entities_per_second': round(rate, 3),
+                }
+            )
+            self._totals['chunks'] += 1
+            self._totals['entities'] += entities
+            self._totals['bytes'] += payload_bytes
+            self._totals['seconds'] += seconds
+            self._totals['success'] += success_count
+
+            if not self.adaptive:
+                return
+
+            if self._chunk_size is None:
+                self._chunk_size = min(max(entities, self.min_chunk), ceiling)
+
+            # smooth the throughput over several jobs
+            self._window.append((success_count, seconds))
+            if len(self._window) < self.window:
+                return
+            window_seconds = sum([w[1] for w in self._window])
+            rate = sum([w[0] for w in self._window]) / window_seconds if window_seconds else 0.0
+            self._window = []
+
+            if self._last_rate is not None and rate < self._last_rate:
+                # throughput dropped, reverse direction
+                self._direction *= -1
+            self._last_rate = rate
+
+            chunk_size = int(self._chunk_size * (1 + self.step * self._direction))
+            self._chunk_size = max(min(chunk_size, ceiling), self.min_chunk)
+
+    @property
+    def stats(self):
+        """Return the chunk size and throughput stats."""
+        with self._lock:
+            seconds = self._totals['seconds']
+            return {
+                'adaptive': self.adaptive,
+                'chunk_size': self._chunk_size,
+                'max_bytes': self.max_bytes,
+                'chunks': list(self._chunks),
+                'total_chunks': self._totals['chunks'],
+                'total_entities': self._totals['entities'],
+                'total_bytes': self._totals['bytes'],
+                'entities_per_second': (
+                    round(self._totals['success'] / seconds, 3) if seconds else 0.0
+                ),
+            }
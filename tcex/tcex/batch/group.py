@@ -12,17 +12,21 @@ from .tag import Tag
 class Group(object):
     """ThreatConnect Batch Group Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = [
-    #     '_attributes',
-    #     '_file_content',
-    #     '_group_data',
-    #     '_labels',
-    #     '_name',
-    #     '_processed',
-    #     '_type',
-    #     '_tags',
-    #     '_utils']
+    __slots__ = [
+        '_association_callback',
+        '_attribute_index',
+        '_attributes',
+        '_file_content',
+        '_group_data',
+        '_label_index',
+        '_labels',
+        '_processed',
+        '_tag_index',
+        '_tags',
+    ]
+
+    # shared by all instances, Utils holds no per-group state
+    _utils = Utils()
 
     def __init__(self, group_type, name, **kwargs):
         """Initialize Class Properties.
@@ -32,9 +36,6 @@ class Group(object):
             name (str): The name for this Group.
             xid (str, kwargs): The external id for this Group.
         """
-        self._utils = Utils()
-        self._name = name
-        self._type = group_type
         self._group_data = {'name': name, 'type': group_type}
         # process all kwargs and update metadata field names
         for arg, value in kwargs.items():
@@ -42,11 +43,18 @@ class Group(object):
         # set xid to random and unique uuid4 value if not provided
         if kwargs.get('xid') is None:
             self._group_data['xid'] = str(uuid.uuid4())
-        self._attributes = []
-        self._labels = []
+        # called with the xid and the associated group xid when an association is added
+        self._association_callback = None
+        # child collections are created on first use
+        self._attributes = None
+        self._labels = None
         self._file_content = None
-        self._tags = []
+        self._tags = None
         self._processed = False
+        # the children keyed by (type), (type, value) or name for unique lookups
+        self._attribute_index = None
+        self._label_index = None
+        self._tag_index = None
 
     @property
     def _metadata_map(self):
@@ -63,6 +71,15 @@ class Group(object):
             'to_addr': 'to',
         }
 
+    def _remove_attribute(self, attr):
+        """Remove the attribute from the attributes list and indexes."""
+        self._attributes.remove(attr)
+        for key in [attr.type, (attr.type, attr.value)]:
+            attributes = self._attribute_index.get(key)
+            attributes.remove(attr)
+            if not attributes:
+                del self._attribute_index[key]
+
     def add_file(self, filename, file_content):
         """Add a file for Document and Report types.
 
@@ -74,6 +91,7 @@ class Group(object):
         Args:
             filename (str): The name of the file.
             file_content (bytes|method|str): The contents of the file or callback to get contents.
+                The contents can also be a file object or a generator of chunks.
         """
         self._group_data['fileName'] = filename
         self._file_content = file_content
@@ -111,6 +129,23 @@ class Group(object):
             group_xid (str): The external id of the Group to associate.
         """
         self._group_data.setdefault('associatedGroupXid', []).append(group_xid)
+        if self._association_callback is not None:
+            self._association_callback(self.xid, group_xid)
+
+    @property
+    def association_callback(self):
+        """Return the method called when an association is added."""
+        return self._association_callback
+
+    @association_callback.setter
+    def association_callback(self, callback):
+        """Set the method called with the xid and the associated Group xid on association."""
+        self._association_callback = callback
+
+    @property
+    def associations(self):
+        """Return the associated Group xids."""
+        return list(self._group_data.get('associatedGroupXid', []))
 
     def attribute(
         self, attr_type, attr_value, displayed=False, source=None, unique=True, formatter=None
@@ -136,44 +171,43 @@ class Group(object):
             obj: An instance of Attribute.
         """
         attr = Attribute(attr_type, attr_value, displayed, source, formatter)
+        if self._attributes is None:
+            self._attributes = []
+            self._attribute_index = {}
         if unique == 'Type':
-            for attribute_data in self._attributes:
-                if attribute_data.type == attr_type:
-                    self._attributes.remove(attribute_data)
-                    break
-            self._attributes.append(attr)
+            # replace the first attribute of the same type
+            attributes = self._attribute_index.get(attr_type)
+            if attributes:
+                self._remove_attribute(attributes[0])
         elif unique is True:
-            for attribute_data in self._attributes:
-                if attribute_data.type == attr_type and attribute_data.value == attr.value:
-                    attr = attribute_data
-                    break
-            else:
-                self._attributes.append(attr)
-        elif unique is False:
-            self._attributes.append(attr)
+            attributes = self._attribute_index.get((attr_type, attr.value))
+            if attributes:
+                return attributes[0]
+        elif unique is not False:
+            return attr
+
+        self._attributes.append(attr)
+        self._attribute_index.setdefault(attr.type, []).append(attr)
+        self._attribute_index.setdefault((attr.type, attr.value), []).append(attr)
         return attr
 
     @property
     def data(self):
-        """Return Group data."""
+        """Return Group data.
+
+        A new dict is built on each call, the Group is not modified.
+        """
+        data = dict(self._group_data)
         # add attributes
         if self._attributes:
-            self._group_data['attribute'] = []
-            for attr in self._attributes:
-                if attr.valid:
-                    self._group_data['attribute'].append(attr.data)
+            data['attribute'] = [attr.data for attr in self._attributes if attr.valid]
         # add security labels
         if self._labels:
-            self._group_data['securityLabel'] = []
-            for label in self._labels:
-                self._group_data['securityLabel'].append(label.data)
+            data['securityLabel'] = [label.data for label in self._labels]
         # add tags
         if self._tags:
-            self._group_data['tag'] = []
-            for tag in self._tags:
-                if tag.valid:
-                    self._group_data['tag'].append(tag.data)
-        return self._group_data
+            data['tag'] = [tag.data for tag in self._tags if tag.valid]
+        return data
 
     @property
     def date_added(self):
@@ -228,13 +262,14 @@ class Group(object):
         Returns:
             obj: An instance of SecurityLabel.
         """
-        label = SecurityLabel(name, description, color)
-        for label_data in self._labels:
-            if label_data.name == name:
-                label = label_data
-                break
-        else:
+        if self._labels is None:
+            self._labels = []
+            self._label_index = {}
+        label = self._label_index.get(name)
+        if label is None:
+            label = SecurityLabel(name, description, color)
             self._labels.append(label)
+            self._label_index.setdefault(label.name, label)
         return label
 
     def tag(self, name, formatter=None):
@@ -248,13 +283,14 @@ class Group(object):
         Returns:
             obj: An instance of Tag.
         """
-        tag = Tag(name, formatter)
-        for tag_data in self._tags:
-            if tag_data.name == name:
-                tag = tag_data
-                break
-        else:
+        if self._tags is None:
+            self._tags = []
+            self._tag_index = {}
+        tag = self._tag_index.get(name)
+        if tag is None:
+            tag = Tag(name, formatter)
             self._tags.append(tag)
+            self._tag_index.setdefault(tag.name, tag)
         return tag
 
     @property
@@ -275,8 +311,7 @@ class Group(object):
 class Adversary(Group):
     """ThreatConnect Batch Adversary Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, name, **kwargs):
         """Initialize Class Properties.
@@ -292,8 +327,7 @@ class Adversary(Group):
 class Campaign(Group):
     """ThreatConnect Batch Campaign Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, name, **kwargs):
         """Initialize Class Properties.
@@ -322,8 +356,7 @@ class Campaign(Group):
 class Document(Group):
     """ThreatConnect Batch Document Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = ['_file_data', '_group_data']
+    __slots__ = []
 
     def __init__(self, name, file_name, **kwargs):
         """Initialize Class Properties.
@@ -332,7 +365,8 @@ class Document(Group):
             name (str): The name for this Group.
             file_name (str): The name for the attached file for this Group.
             date_added (str, kwargs): The date timestamp the Indicator was created.
-            file_content (str;method, kwargs): The file contents or callback method to retrieve
+            file_content (str;method, kwargs): The file contents (bytes, file object, or
+                                               generator of chunks) or callback method to retrieve
                                                file content.
             malware (bool, kwargs): If true the file is considered malware.
             password (bool, kwargs): If malware is true a password for the zip archive is required.
@@ -386,8 +420,7 @@ class Document(Group):
 class Email(Group):
     """ThreatConnect Batch Email Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, name, subject, header, body, **kwargs):
         """Initialize Class Properties.
@@ -442,8 +475,7 @@ class Email(Group):
 class Event(Group):
     """ThreatConnect Batch Event Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, name, **kwargs):
         """Initialize Class Properties.
@@ -489,8 +521,7 @@ class Event(Group):
 class Incident(Group):
     """ThreatConnect Batch Incident Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, name, **kwargs):
         """Initialize Class Properties.
@@ -553,8 +584,7 @@ class Incident(Group):
 class IntrusionSet(Group):
     """ThreatConnect Batch Adversary Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, name, **kwargs):
         """Initialize Class Properties.
@@ -570,8 +600,7 @@ class IntrusionSet(Group):
 class Report(Group):
     """ThreatConnect Batch Report Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, name, **kwargs):
         """Initialize Class Properties.
@@ -580,7 +609,8 @@ class Report(Group):
             name (str): The name for this Group.
             date_added (str, kwargs): The date timestamp the Indicator was created.
             file_name (str, kwargs): The name for the attached file for this Group.
-            file_content (str;method, kwargs): The file contents or callback method to retrieve
+            file_content (str;method, kwargs): The file contents (bytes, file object, or
+                                               generator of chunks) or callback method to retrieve
                                                file content.
             publish_date (str, kwargs): The publish datetime expression for this Group.
             xid (str, kwargs): The external id for this Group.
@@ -624,8 +654,7 @@ class Report(Group):
 class Signature(Group):
     """ThreatConnect Batch Signature Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, name, file_name, file_type, file_text, **kwargs):
         """Initialize Class Properties.
@@ -658,8 +687,7 @@ class Signature(Group):
 class Threat(Group):
     """ThreatConnect Batch Threat Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, name, **kwargs):
         """Initialize Class Properties.
@@ -39,24 +39,30 @@ def custom_indicator_class_factory(indicator_type, base_class, class_dict, value
 
     class_name = indicator_type.replace(' ', '')
     init_method = locals()['init_{}'.format(value_count)]
-    newclass = type(str(class_name), (base_class,), {'__init__': init_method})
+    newclass = type(
+        str(class_name), (base_class,), {'__init__': init_method, '__slots__': list(class_dict)}
+    )
     return newclass
 
 
 class Indicator(object):
     """ThreatConnect Batch Indicator Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = [
-    #     '_attributes',
-    #     '_file_actions',
-    #     '_indicator_data',
-    #     '_labels',
-    #     '_occurrences',
-    #     '_summary',
-    #     '_tags',
-    #     '_type',
-    #     '_utils']
+    __slots__ = [
+        '_association_callback',
+        '_attribute_index',
+        '_attributes',
+        '_file_actions',
+        '_indicator_data',
+        '_label_index',
+        '_labels',
+        '_occurrences',
+        '_tag_index',
+        '_tags',
+    ]
+
+    # shared by all instances, Utils holds no per-indicator state
+    _utils = Utils()
 
     def __init__(self, indicator_type, summary, **kwargs):
         """Initialize Class Properties.
@@ -72,9 +78,6 @@ class Indicator(object):
             rating (str, kwargs): The threat rating for this Indicator.
             xid (str, kwargs): The external id for this Indicator.
         """
-        self._utils = Utils()
-        self._summary = summary
-        self._type = indicator_type
         self._indicator_data = {'summary': summary, 'type': indicator_type}
         # process all kwargs and update metadata field names
         for arg, value in kwargs.items():
@@ -82,11 +85,18 @@ class Indicator(object):
         # set xid to random and unique uuid4 value if not provided
         if kwargs.get('xid') is None:
             self._indicator_data['xid'] = str(uuid.uuid4())
-        self._attributes = []
-        self._file_actions = []
-        self._labels = []
-        self._occurrences = []
-        self._tags = []
+        # called with the xid and the associated group xid when an association is added
+        self._association_callback = None
+        # child collections are created on first use
+        self._attributes = None
+        self._file_actions = None
+        self._labels = None
+        self._occurrences = None
+        self._tags = None
+        # the first child keyed by (type), (type, value) or name for unique lookups
+        self._attribute_index = None
+        self._label_index = None
+        self._tag_index = None
 
     @property
     def _metadata_map(self):
@@ -146,6 +156,23 @@ class Indicator(object):
         """
         association = {'groupXid': group_xid}
         self._indicator_data.setdefault('associatedGroups', []).append(association)
+        if self._association_callback is not None:
+            self._association_callback(self.xid, group_xid)
+
+    @property
+    def association_callback(self):
+        """Return the method called when an association is added."""
+        return self._association_callback
+
+    @association_callback.setter
+    def association_callback(self, callback):
+        """Set the method called with the xid and the associated Group xid on association."""
+        self._association_callback = callback
+
+    @property
+    def associations(self):
+        """Return the associated Group xids."""
+        return [a.get('groupXid') for a in self._indicator_data.get('associatedGroups', [])]
 
     def attribute(
         self, attr_type, attr_value, displayed=False, source=None, unique=True, formatter=None
@@ -171,22 +198,23 @@ class Indicator(object):
             obj: An instance of Attribute.
         """
         attr = Attribute(attr_type, attr_value, displayed, source, formatter)
+        if self._attributes is None:
+            self._attributes = []
+            self._attribute_index = {}
         if unique == 'Type':
-            for attribute_data in self._attributes:
-                if attribute_data.type == attr_type:
-                    attr = attribute_data
-                    break
-            else:
-                self._attributes.append(attr)
+            attribute_data = self._attribute_index.get(attr_type)
         elif unique is True:
-            for attribute_data in self._attributes:
-                if attribute_data.type == attr_type and attribute_data.value == attr.value:
-                    attr = attribute_data
-                    break
-            else:
-                self._attributes.append(attr)
+            attribute_data = self._attribute_index.get((attr_type, attr.value))
         elif unique is False:
-            self._attributes.append(attr)
+            attribute_data = None
+        else:
+            return attr
+
+        if attribute_data is not None:
+            return attribute_data
+        self._attributes.append(attr)
+        self._attribute_index.setdefault(attr.type, attr)
+        self._attribute_index.setdefault((attr.type, attr.value), attr)
         return attr
 
     @staticmethod
@@ -216,36 +244,33 @@ class Indicator(object):
 
     @property
     def data(self):
-        """Return Indicator data."""
+        """Return Indicator data.
+
+        A new dict is built on each call, the Indicator is not modified.
+        """
+        data = dict(self._indicator_data)
         # add attributes
         if self._attributes:
-            self._indicator_data['attribute'] = []
-            for attr in self._attributes:
-                if attr.valid:
-                    self._indicator_data['attribute'].append(attr.data)
+            data['attribute'] = [attr.data for attr in self._attributes if attr.valid]
         # add file actions
         if self._file_actions:
-            self._indicator_data.setdefault('fileAction', {})
-            self._indicator_data['fileAction'].setdefault('children', [])
-            for action in self._file_actions:
-                self._indicator_data['fileAction']['children'].append(action.data)
+            file_action = dict(data.get('fileAction', {}))
+            file_action['children'] = list(file_action.get('children', [])) + [
+                action.data for action in self._file_actions
+            ]
+            data['fileAction'] = file_action
         # add file occurrences
         if self._occurrences:
-            self._indicator_data.setdefault('fileOccurrence', [])
-            for occurrence in self._occurrences:
-                self._indicator_data['fileOccurrence'].append(occurrence.data)
+            data['fileOccurrence'] = list(data.get('fileOccurrence', [])) + [
+                occurrence.data for occurrence in self._occurrences
+            ]
         # add security labels
         if self._labels:
-            self._indicator_data['securityLabel'] = []
-            for label in self._labels:
-                self._indicator_data['securityLabel'].append(label.data)
+            data['securityLabel'] = [label.data for label in self._labels]
         # add tags
         if self._tags:
-            self._indicator_data['tag'] = []
-            for tag in self._tags:
-                if tag.valid:
-                    self._indicator_data['tag'].append(tag.data)
-        return self._indicator_data
+            data['tag'] = [tag.data for tag in self._tags if tag.valid]
+        return data
 
     @property
     def date_added(self):
@@ -287,6 +312,8 @@ class Indicator(object):
             return None
 
         occurrence_obj = FileOccurrence(file_name, path, date)
+        if self._occurrences is None:
+            self._occurrences = []
         self._occurrences.append(occurrence_obj)
         return occurrence_obj
 
@@ -329,13 +356,14 @@ class Indicator(object):
         Returns:
             obj: An instance of SecurityLabel.
         """
-        label = SecurityLabel(name, description, color)
-        for label_data in self._labels:
-            if label_data.name == name:
-                label = label_data
-                break
-        else:
+        if self._labels is None:
+            self._labels = []
+            self._label_index = {}
+        label = self._label_index.get(name)
+        if label is None:
+            label = SecurityLabel(name, description, color)
             self._labels.append(label)
+            self._label_index.setdefault(label.name, label)
         return label
 
     def tag(self, name, formatter=None):
@@ -349,13 +377,14 @@ class Indicator(object):
         Returns:
             obj: An instance of Tag.
         """
-        tag = Tag(name, formatter)
-        for tag_data in self._tags:
-            if tag_data.name == name:
-                tag = tag_data
-                break
-        else:
+        if self._tags is None:
+            self._tags = []
+            self._tag_index = {}
+        tag = self._tag_index.get(name)
+        if tag is None:
+            tag = Tag(name, formatter)
             self._tags.append(tag)
+            self._tag_index.setdefault(tag.name, tag)
         return tag
 
     @property
@@ -376,8 +405,7 @@ class Indicator(object):
 class Address(Indicator):
     """ThreatConnect Batch Address Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, ip, **kwargs):
         """Initialize Class Properties.
@@ -398,8 +426,7 @@ class Address(Indicator):
 class ASN(Indicator):
     """ThreatConnect Batch ASN Object."""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, as_number, **kwargs):
         """Initialize Class Properties.
@@ -420,8 +447,7 @@ class ASN(Indicator):
 class CIDR(Indicator):
     """ThreatConnect Batch CIDR Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, block, **kwargs):
         """Initialize Class Properties.
@@ -442,8 +468,7 @@ class CIDR(Indicator):
 class EmailAddress(Indicator):
     """ThreatConnect Batch EmailAddress Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, address, **kwargs):
         """Initialize Class Properties.
@@ -464,8 +489,7 @@ class EmailAddress(Indicator):
 class File(Indicator):
     """ThreatConnect Batch File Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, md5=None, sha1=None, sha256=None, **kwargs):
         """Initialize Class Properties.
@@ -485,11 +509,12 @@ class File(Indicator):
         """
         summary = self.build_summary(md5, sha1, sha256)  # build the indicator summary
         super(File, self).__init__('File', summary, **kwargs)
-        # self._file_action = []
 
     def action(self, relationship):
         """Add a File Action."""
         action_obj = FileAction(self._indicator_data.get('xid'), relationship)
+        if self._file_actions is None:
+            self._file_actions = []
         self._file_actions.append(action_obj)
         return action_obj
 
@@ -537,8 +562,7 @@ class File(Indicator):
 class Host(Indicator):
     """ThreatConnect Batch Host Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, hostname, **kwargs):
         """Initialize Class Properties.
@@ -581,8 +605,7 @@ class Host(Indicator):
 class Mutex(Indicator):
     """ThreatConnect Batch Mutex Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, mutex, **kwargs):
         """Initialize Class Properties.
@@ -603,8 +626,7 @@ class Mutex(Indicator):
 class RegistryKey(Indicator):
     """ThreatConnect Batch Registry Key Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, key_name, value_name, value_type, **kwargs):
         """Initialize Class Properties.
@@ -628,8 +650,7 @@ class RegistryKey(Indicator):
 class URL(Indicator):
     """ThreatConnect Batch URL Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, text, **kwargs):
         """Initialize Class Properties.
@@ -650,8 +671,7 @@ class URL(Indicator):
 class UserAgent(Indicator):
     """ThreatConnect Batch User Agent Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = []
+    __slots__ = []
 
     def __init__(self, text, **kwargs):
         """Initialize Class Properties.
@@ -672,8 +692,7 @@ class UserAgent(Indicator):
 class FileAction(object):
     """ThreatConnect Batch FileAction Object"""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = ['_action_data', '_children', 'xid']
+    __slots__ = ['_action_data', '_children', 'xid']
 
     def __init__(self, parent_xid, relationship):
         """Initialize Class Properties.
@@ -694,11 +713,13 @@ class FileAction(object):
 
     @property
     def data(self):
-        """Return File Occurrence data."""
+        """Return File Action data."""
+        data = dict(self._action_data)
         if self._children:
-            for child in self._children:
-                self._action_data.setdefault('children', []).append(child.data)
-        return self._action_data
+            data['children'] = list(data.get('children', [])) + [
+                child.data for child in self._children
+            ]
+        return data
 
     def action(self, relationship):
         """Add a nested File Action."""
@@ -713,8 +734,10 @@ class FileAction(object):
 class FileOccurrence(object):
     """ThreatConnect Batch FileAction Object."""
 
-    # TODO: enable when support for py2 is dropped.
-    # __slots__ = ['_occurrence_data', '_utils']
+    __slots__ = ['_occurrence_data']
+
+    # shared by all instances, Utils holds no per-occurrence state
+    _utils = Utils()
 
     def __init__(self, file_name=None, path=None, date=None):
         """Initialize Class Properties
@@ -724,7 +747,6 @@ class FileOccurrence(object):
             path (str, optional): The file path for this occurrence.
             date (str, optional): The datetime expression for this occurrence.
         """
-        self._utils = Utils()
         self._occurrence_data = {}
         if file_name is not None:
             self._occurrence_data['fileName'] = file_name
@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+"""ThreatConnect Batch Spill Store Module"""
+import hashlib
+import json
+import os
+import shutil
+from collections.abc import MutableMapping
+
+
+class SpillStore(MutableMapping):
+    """Append-only on disk store for Batch Group and Indicator data.
+
+    Each entry is written as a single line of pre-serialized JSON to the end of the current
+    segment file and an in-memory index maps the xid to the segment and offset of the record.
+    Replacing or deleting an entry only updates the index, the space used by the old record is
+    reclaimed by :py:meth:`compact`.
+
+    File content for Document and Report Groups is not JSON serializable (bytes or a callback
+    method) and is kept in memory until the entry is removed from the store. When the store is
+    closed without being deleted, the file content is written to sidecar files and reloaded with
+    the store.
+    """
+
+    def __init__(self, path, segment_size=None):
+        """Initialize Class Properties.
+
+        Args:
+            path (str): The directory for the segment files. Existing segments will be reloaded.
+            segment_size (int, optional): The max size in bytes of a segment file before a new
+                segment is started. Defaults to 64MB.
+        """
+        self.path = path
+        self.segment_size = segment_size or 64 * 1024 * 1024
+
+        # containers
+        self._associations = {}
+        self._file_content = {}
+        self._handles = {}
+        self._index = {}
+        self._segments = {}
+        self._segment = 0
+
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        self._load()
+
+    @staticmethod
+    def _file_chunks(file_content):
+        """Yield the chunks of bytes, str, file object, or iterable file content."""
+        if isinstance(file_content, (bytes, str)):
+            yield file_content
+        elif hasattr(file_content, 'read'):
+            while True:
+                chunk = file_content.read(65536)
+                if not chunk:
+                    break
+                yield chunk
+        elif file_content is not None:
+            for chunk in file_content:
+                yield chunk
+
+    @property
+    def _files_path(self):
+        """Return the directory for the saved file content sidecar files."""
+        return os.path.join(self.path, 'files')
+
+    def _handle(self, segment):
+        """Return the (cached) read/append file handle for the provided segment."""
+        if segment not in self._handles:
+            self._handles[segment] = open(self._segment_fqfn(segment), 'a+b')
+        return self._handles[segment]
+
+    def _load(self):
+        """Rebuild the index from any existing segment files (e.g., a saved store)."""
+        for filename in sorted(os.listdir(self.path)):
+            if not filename.endswith('.json'):
+                continue
+            segment = int(filename.split('.')[0])
+            self._segments[segment] = {'live_size': 0, 'size': 0, 'xids': set()}
+            self._segment = max(self._segment, segment)
+
+            fh = self._handle(segment)
+            fh.seek(0)
+            offset = 0
+            for line in fh:
+                data = json.loads(line.decode('utf-8'))
+                self._index_record(data, segment, offset, len(line))
+                offset += len(line)
+
+        # file content saved on close
+        files_fqfn = os.path.join(self._files_path, 'files.json')
+        if os.path.isfile(files_fqfn):
+            with open(files_fqfn) as fh:
+                for xid, filename in json.load(fh).items():
+                    if xid in self._index:
+                        fqfn = os.path.join(self._files_path, filename)
+                        self._file_content[xid] = SavedFileContent(fqfn)
+
+    def _index_record(self, data, segment, offset, length):
+        """Add the location of a record to the index and update segment counters."""
+        xid = data.get('xid')
+        if xid in self._index:
+            self._unindex(xid)
+        self._index[xid] = (segment, offset, length)
+        self._segments[segment]['live_size'] += length
+        self._segments[segment]['size'] = offset + length
+        self._segments[segment]['xids'].add(xid)
+        if data.get('associatedGroupXid'):
+            self._associations[xid] = list(data.get('associatedGroupXid'))
+        elif data.get('associatedGroups'):
+            self._associations[xid] = [a.get('groupXid') for a in data.get('associatedGroups')]
+
+    def _read(self, xid):
+        """Return the deserialized record for the provided xid."""
+        segment, offset, length = self._index[xid]
+        fh = self._handle(segment)
+        fh.seek(offset)
+        data = json.loads(fh.read(length).decode('utf-8'))
+        if xid in self._file_content:
+            data['fileContent'] = self._file_content[xid]
+        return data
+
+    def _remove_segment(self, segment):
+        """Close and delete a segment file."""
+        fh = self._handles.pop(segment, None)
+        if fh is not None:
+            fh.close()
+        if os.path.isfile(self._segment_fqfn(segment)):
+            os.remove(self._segment_fqfn(segment))
+        del self._segments[segment]
+
+    def _save_file_content(self):
+        """Write the file content of all stored entries to sidecar files."""
+        files = {}
+        for xid, file_content in self._file_content.items():
+            filename = '{}.bin'.format(hashlib.sha256(xid.encode('utf-8')).hexdigest())
+            files[xid] = filename
+            if isinstance(file_content, SavedFileContent):
+                # reloaded from a previously saved store
+                continue
+            if callable(file_content):
+                file_content = file_content(xid)
+
+            if not os.path.isdir(self._files_path):
+                os.makedirs(self._files_path)
+            with open(os.path.join(self._files_path, filename), 'wb') as fh:
+                for chunk in self._file_chunks(file_content):
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode('utf-8')
+                    fh.write(chunk)
+            self._file_content[xid] = SavedFileContent(os.path.join(self._files_path, filename))
+
+        if files or os.path.isdir(self._files_path):
+            if not os.path.isdir(self._files_path):
+                os.makedirs(self._files_path)
+            with open(os.path.join(self._files_path, 'files.json'), 'w') as fh:
+                json.dump(files, fh)
+            # remove the file content of entries no longer in the store
+            for filename in os.listdir(self._files_path):
+                if filename != 'files.json' and filename not in files.values():
+                    os.remove(os.path.join(self._files_path, filename))
+
+    def _segment_fqfn(self, segment):
+        """Return the fully qualified filename for the provided segment."""
+        return os.path.join(self.path, '{:05d}.json'.format(segment))
+
+    def _unindex(self, xid):
+        """Remove a record from the index and return its location."""
+        location = self._index.pop(xid)
+        self._segments[location[0]]['live_size'] -= location[2]
+        self._segments[location[0]]['xids'].discard(xid)
+        self._associations.pop(xid, None)
+        return location
+
+    def _write(self, data):
+        """Append a single serialized record to the current segment."""
+        self._write_many([data])
+
+    def _write_many(self, records):
+        """Append multiple serialized records, starting a new segment when a segment is full."""
+        pending = []
+        size = self._segments.get(self._segment, {}).get('size', 0)
+        for data in records:
+            line = '{}\n'.format(json.dumps(data)).encode('utf-8')
+            if size > 0 and size + len(line) > self.segment_size:
+                # start a new segment
+                self._write_lines(pending)
+                pending = []
+                self._segment += 1
+                size = 0
+            pending.append((data, line))
+            size += len(line)
+        self._write_lines(pending)
+
+    def _write_lines(self, records):
+        """Append multiple serialized records to the current segment in a single write."""
+        if not records:
+            return
+        self._segments.setdefault(self._segment, {'live_size': 0, 'size': 0, 'xids': set()})
+
+        fh = self._handle(self._segment)
+        fh.seek(0, os.SEEK_END)
+        offset = fh.tell()
+        fh.write(b''.join([line for _, line in records]))
+        for data, line in records:
+            self._index_record(data, self._segment, offset, len(line))
+            offset += len(line)
+
+    def associations(self, xid):
+        """Return the associated Group xids of a stored entity without reading the record.
+
+        Args:
+            xid (str): The xid of the stored Group or Indicator.
+
+        Returns:
+            list: The associated Group xids.
+        """
+        return self._associations.get(xid, [])
+
+    def close(self, delete=False):
+        """Close all segment files.
+
+        Args:
+            delete (bool, default:False): If True the segment files will be removed.
+        """
+        if not delete:
+            # remove all replaced and deleted records so the store can be reloaded
+            self.compact(ratio=1.0)
+            self._save_file_content()
+
+        for fh in self._handles.values():
+            fh.close()
+        self._handles = {}
+        if delete:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+    def compact(self, ratio=0.5):
+        """Reclaim the space used by deleted or replaced records.
+
+        Segments without any live records are removed. Segments where less than **ratio** of the
+        bytes belong to live records have the remaining records copied to the end of the store
+        before removal.
+
+        Args:
+            ratio (float, default:0.5): The live byte ratio below which a segment is rewritten.
+        """
+        for segment in sorted(self._segments):
+            stats = self._segments[segment]
+            if not stats['xids']:
+                if segment == self._segment:
+                    # reuse the current segment
+                    self._handle(segment).truncate(0)
+                    stats['size'] = 0
+                else:
+                    self._remove_segment(segment)
+                continue
+
+            live_size = stats['live_size']
+            if live_size < stats['size'] and live_size / float(stats['size']) < ratio:
+                if segment == self._segment:
+                    # live records can't be copied into the segment being removed
+                    self._segment += 1
+                # live records ordered by offset so the segment is read sequentially
+                locations = sorted((self._index[xid][1], xid) for xid in stats['xids'])
+                for _, xid in locations:
+                    data = self._read(xid)
+                    data.pop('fileContent', None)
+                    self._write(data)
+                self._remove_segment(segment)
+
+    def pop_iter(self, xids):
+        """Remove and yield multiple records reading the segments sequentially.
+
+        Only a single record is held in memory at a time.
+
+        Args:
+            xids (list): The xids of the records to return. Any xid not in the store is skipped.
+
+        Yields:
+            dict: The record dicts in the order they are stored on disk.
+        """
+        locations = sorted((self._index[xid], xid) for xid in set(xids) if xid in self._index)
+        for _, xid in locations:
+            data = self._read(xid)
+            self._unindex(xid)
+            self._file_content.pop(xid, None)
+            yield data
+
+    def pop_many(self, xids):
+        """Remove and return multiple records reading the segments sequentially.
+
+        Args:
+            xids (list): The xids of the records to return. Any xid not in the store is skipped.
+
+        Returns:
+            list: The record dicts in the order of the provided xids.
+        """
+        records = {data.get('xid'): data for data in self.pop_iter(xids)}
+        return [records[xid] for xid in xids if xid in records]
+
+    def write_many(self, records):
+        """Serialize and append multiple Group or Indicator dicts to the store.
+
+        The records are written with a single write per segment. File content is not supported,
+        use ``store[xid] = resource`` for Document and Report Groups with file content.
+
+        Args:
+            records (list): The Group or Indicator dicts, each including the xid.
+        """
+        records = list(records)
+        for data in records:
+            self._file_content.pop(data.get('xid'), None)
+        self._write_many(records)
+
+    def __contains__(self, xid):
+        """Return True if the xid is in the store."""
+        return xid in self._index
+
+    def __delitem__(self, xid):
+        """Remove a record from the store."""
+        self._unindex(xid)
+        self._file_content.pop(xid, None)
+
+    def __getitem__(self, xid):
+        """Return the record dict for the provided xid."""
+        if xid not in self._index:
+            raise KeyError(xid)
+        return self._read(xid)
+
+    def __iter__(self):
+        """Return an iterator of the stored xids in insertion order."""
+        return iter(self._index)
+
+    def __len__(self):
+        """Return the number of records in the store."""
+        return len(self._index)
+
+    def __setitem__(self, xid, resource):
+        """Serialize a Group or Indicator dict or object and append it to the store.
+
+        Args:
+            xid (str): The xid of the Group or Indicator.
+            resource (dict|obj): The Group or Indicator dict or object.
+        """
+        file_content = None
+        if isinstance(resource, dict):
+            data = dict(resource)
+            file_content = data.pop('fileContent', None)
+        else:
+            data = dict(resource.data)
+            if data.get('type') in ['Document', 'Report']:
+                file_content = resource.file_data.get('fileContent')
+        data['xid'] = xid
+
+        self._write(data)
+        self._file_content.pop(xid, None)
+        if file_content is not None:
+            self._file_content[xid] = file_content
+
+
+class SavedFileContent(object):
+    """File content of a Document or Report saved to a sidecar file of a SpillStore.
+
+    The file content is read when called with the xid, the same as a file content callback.
+    """
+
+    def __init__(self, fqfn):
+        """Initialize Class Properties.
+
+        Args:
+            fqfn (str): The fully qualified filename of the sidecar file.
+        """
+        self.fqfn = fqfn
+
+    def __call__(self, xid):  # pylint: disable=W0613
+        """Return the file content."""
+        with open(self.fqfn, 'rb') as fh:
+            return fh.read()
@@ -279,12 +279,26 @@ class Inputs(object):
             # create new args Namespace for resolved args
             self._default_args_resolved = Namespace()
 
-            # iterate over args and resolve any playbook variables
+            # resolve any playbook variables (read in a single DB request)
+            resolve = [
+                arg
+                for arg, arg_val in vars(self._default_args).items()
+                if arg not in self.tc_reserved_args and isinstance(arg_val, (str))
+            ]
+            resolved = dict(
+                zip(
+                    resolve,
+                    self.tcex.playbook.read_many(
+                        [getattr(self._default_args, arg) for arg in resolve]
+                    ),
+                )
+            )
+
+            # iterate over args and set resolved playbook variables
             for arg in vars(self._default_args):
                 arg_val = getattr(self._default_args, arg)
-                if arg not in self.tc_reserved_args:
-                    if isinstance(arg_val, (str)):
-                        arg_val = self.tcex.playbook.read(arg_val)
+                if arg in resolved:
+                    arg_val = resolved.get(arg)
                 setattr(self._default_args_resolved, arg, arg_val)
 
             # set parsed bool to ensure args are only parsed once
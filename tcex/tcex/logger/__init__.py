@@ -3,3 +3,4 @@
 # flake8: noqa
 from .logger import Logger
 from .rotating_file_handler_custom import RotatingFileHandlerCustom
+from .trace_logger import LazyArg, TruncatedArg
@@ -1,29 +1,128 @@
 # -*- coding: utf-8 -*-
 """API Handler Class"""
 import logging
-import time
 import threading
+import time
 
+try:
+    import Queue as queue  # Python 2
+except ImportError:
+    import queue  # Python 3
 
-class ApiHandler(logging.Handler):
-    """Logger handler for ThreatConnect Exchange API logging."""
 
-    def __init__(self, session, flush_limit=100):
+class ApiHandler(logging.Handler):
+    """Logger handler for ThreatConnect Exchange API logging.
+
+    Formatted records are added to a bounded queue and sent to the API in batches by a background
+    sender thread, so logging does not block the calling thread. A batch is sent once
+    **flush_limit** records are queued or **flush_interval** seconds have passed. Records are
+    dropped (and counted in **dropped**) when the queue is full or a batch fails after all
+    retries.
+    """
+
+    def __init__(
+        self,
+        session,
+        flush_limit=100,
+        flush_interval=5,
+        max_queue=10000,
+        max_batch=1000,
+        retries=3,
+        backoff_factor=1,
+    ):
         """Initialize Class properties.
 
         Args:
             session (Request.Session): The preconfigured instance of Session for ThreatConnect API.
-            flush_limit (int): The limit to flush batch logs to the API.
+            flush_limit (int): The number of queued records that triggers a send to the API.
+            flush_interval (int): The max number of seconds between sends to the API.
+            max_queue (int): The max number of records waiting to be sent.
+            max_batch (int): The max number of records sent in a single request.
+            retries (int): The number of retries for a failed request.
+            backoff_factor (float): The backoff factor applied between retries.
         """
         super(ApiHandler, self).__init__()
         self.session = session
+        self.backoff_factor = backoff_factor
+        self.dropped = 0
+        self.flush_interval = flush_interval
         self.flush_limit = flush_limit
-        self._entries = []
         self.in_token_renewal = False
+        self.max_batch = max_batch
+        self.retries = retries
+        self._dropped_lock = threading.Lock()
+        self._entries = queue.Queue(maxsize=max_queue)
+        # flush requests are numbered, the sender notifies the last request sent
+        self._flushed = threading.Condition()
+        self._flush_event = threading.Event()
+        self._flush_requested = 0
+        self._flush_sent = 0
+        self._sender = None
+        self._shutdown = False
+
+    def _drop(self, count):
+        """Increment the count of dropped records."""
+        with self._dropped_lock:
+            self.dropped += count
+
+    def _send(self):
+        """Send queued log events to the API until the handler is closed."""
+        while True:
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            if self.in_token_renewal:  # pragma: no cover
+                continue
+
+            # all entries queued before the flush request are sent in this pass
+            with self._flushed:
+                flush_requested = self._flush_requested
+            try:
+                entries = self.entries
+                while entries:
+                    if not self.log_to_api(entries):
+                        self._drop(len(entries))
+                    entries = self.entries
+            finally:
+                with self._flushed:
+                    self._flush_sent = flush_requested
+                    self._flushed.notify_all()
+
+            if self._shutdown:
+                break
+
+    def close(self):
+        """Flush entries and stop the sender thread."""
+        self.flush()
+        self._shutdown = True
+        self._flush_event.set()
+        if self._sender is not None and self._sender is not threading.current_thread():
+            self._sender.join(self.flush_interval)
+        super(ApiHandler, self).close()
+
+    def flush(self, timeout=10):
+        """Send all queued entries to the API.
 
-    def flush(self):
-        """Close the logger and flush entries."""
-        self.log_to_api(self.entries)  # pragma: no cover
+        Args:
+            timeout (int): The max number of seconds to wait for queued entries to be sent.
+        """
+        if (
+            self._sender is None
+            or not self._sender.is_alive()
+            or self._sender is threading.current_thread()
+        ):
+            # send on the current thread when the sender is not running (or is the current thread)
+            entries = self.entries
+            while entries:
+                if not self.log_to_api(entries):
+                    self._drop(len(entries))
+                entries = self.entries
+            return
+
+        with self._flushed:
+            self._flush_requested += 1
+            flush_requested = self._flush_requested
+            self._flush_event.set()
+            self._flushed.wait_for(lambda: self._flush_sent >= flush_requested, timeout)
 
     def emit(self, record):
         """Emit a record.
@@ -31,31 +130,66 @@ class ApiHandler(logging.Handler):
         Args:
             record (obj): The record to be logged.
         """
-        if threading.current_thread().name != 'MainThread':  # pragma: no cover
+        # queue log events
+        try:
+            self._entries.put_nowait(self.format(record))
+        except queue.Full:
+            self._drop(1)
             return
 
-        # queue log events
-        self._entries.append(self.format(record))
+        if self._sender is None:
+            self._sender = threading.Thread(name='api-log-sender', target=self._send)
+            self._sender.daemon = True  # use setter for py2
+            self._sender.start()
 
-        # flush queue once limit is hit token module is currently renewing token
-        if len(self._entries) > self.flush_limit and not self.in_token_renewal:
-            self.log_to_api(self.entries)
+        # wake the sender once the flush limit is reached
+        if self._entries.qsize() >= self.flush_limit:
+            self._flush_event.set()
+
+    def filter(self, record):
+        """Return False for records logged by the sender thread (e.g., by the session).
+
+        Args:
+            record (obj): The record to be logged.
+        """
+        if self._sender is not None and threading.current_thread() is self._sender:
+            return False
+        return super(ApiHandler, self).filter(record)
 
     @property
     def entries(self):
-        """Return a copy and clear self._entries."""
-        entries = list(self._entries)
-        self._entries = []
+        """Return and remove up to max_batch queued entries."""
+        entries = []
+        while len(entries) < self.max_batch:
+            try:
+                entries.append(self._entries.get_nowait())
+            except queue.Empty:
+                break
         return entries
 
     def log_to_api(self, entries):
-        """Send log events to the ThreatConnect API"""
-        if entries:
+        """Send log events to the ThreatConnect API.
+
+        Args:
+            entries (list): The formatted log events.
+
+        Returns:
+            bool: True if the log events were sent.
+        """
+        if not entries:
+            return True
+
+        headers = {'Content-Type': 'application/json'}
+        for attempt in range(self.retries + 1):
             try:
-                headers = {'Content-Type': 'application/json'}
-                self.session.post('/v2/logs/app', headers=headers, json=entries)
+                r = self.session.post('/v2/logs/app', headers=headers, json=entries)
+                if r.status_code != 429 and r.status_code < 500:
+                    return r.ok
             except Exception:  # pragma: no cover
                 pass
+            if attempt < self.retries:
+                time.sleep(self.backoff_factor * (2 ** attempt))
+        return False
 
 
 class ApiHandlerFormatter(logging.Formatter):
@@ -81,6 +215,6 @@ class ApiHandlerFormatter(logging.Formatter):
         """
         return {
             'timestamp': int(float(record.created or time.time()) * 1000),
-            'message': record.msg or '',
+            'message': record.getMessage() or '',
             'level': record.levelname or 'DEBUG',
         }
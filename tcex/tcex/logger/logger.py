@@ -7,7 +7,7 @@ import sys
 from .api_handler import ApiHandler, ApiHandlerFormatter
 from .cache_handler import CacheHandler
 from .rotating_file_handler_custom import RotatingFileHandlerCustom
-from .thread_file_handler import ThreadFileHandler
+from .thread_file_handler import ThreadFileDispatchHandler
 from .trace_logger import TraceLogger
 
 
@@ -28,9 +28,22 @@ class Logger(object):
         """Return the logger. The default_args property is not available in init."""
         logging.setLoggerClass(TraceLogger)
         logger = logging.getLogger(self.logger_name)
-        logger.setLevel(logging.TRACE)
+        if logger.level == logging.NOTSET:
+            # updated to the lowest handler level as handlers are added
+            logger.setLevel(logging.TRACE)
         return logger
 
+    def _update_logger_level(self):
+        """Set the logger level to the lowest handler level.
+
+        Records below the level of every handler are discarded by the logger before a record is
+        created, so log message arguments are never formatted.
+        """
+        levels = [h.level or logging.TRACE for h in self._logger.handlers]
+        level = min(levels or [logging.TRACE])
+        if self._logger.level != level:
+            self._logger.setLevel(level)
+
     @property
     def _formatter(self):
         """Return log formatter."""
@@ -49,6 +62,14 @@ class Logger(object):
         )
         return logging.Formatter(tx_format)
 
+    @property
+    def _thread_file_handler(self):
+        """Return the thread file dispatch handler."""
+        for h in self._logger.handlers:
+            if isinstance(h, ThreadFileDispatchHandler):
+                return h
+        return None
+
     @property
     def log(self):
         """Return logger."""
@@ -71,10 +92,17 @@ class Logger(object):
         Args:
             handler_name (str): The handler name to remove.
         """
+        # thread file handlers are registered with the thread file dispatch handler
+        tfh = self._thread_file_handler
+        if tfh is not None and tfh.remove_sink(handler_name):
+            self._update_logger_level()
+            return
+
         for h in self._logger.handlers:
             if h.get_name() == handler_name:
                 self._logger.removeHandler(h)
                 break
+        self._update_logger_level()
 
     def replay_cached_events(self, handler_name='cache'):
         """Replay cached log events and remove handler."""
@@ -82,6 +110,7 @@ class Logger(object):
             if h.get_name() == handler_name:
                 events = h.events
                 self._logger.removeHandler(h)
+                self._update_logger_level()
                 for event in events:
                     self._logger.handle(event)
                 break
@@ -97,6 +126,7 @@ class Logger(object):
         # update all handler logging levels
         for h in self._logger.handlers:
             h.setLevel(level)
+        self._update_logger_level()
 
     #
     # handlers
@@ -114,6 +144,7 @@ class Logger(object):
         api.setLevel(self.log_level(level))
         api.setFormatter(ApiHandlerFormatter())
         self._logger.addHandler(api)
+        self._update_logger_level()
 
     def add_cache_handler(self, name):
         """Add cache logging handler.
@@ -129,6 +160,7 @@ class Logger(object):
         cache.setLevel(self.log_level('trace'))
         cache.setFormatter(self._formatter)
         self._logger.addHandler(cache)
+        self._update_logger_level()
 
     def add_rotating_file_handler(
         self, name, filename, path, backup_count, max_bytes, level, formatter=None, mode='a'
@@ -156,6 +188,7 @@ class Logger(object):
         fh.setFormatter(formatter)
         fh.setLevel(self.log_level(level))
         self._logger.addHandler(fh)
+        self._update_logger_level()
 
     def add_stream_handler(self, name='sh', formatter=None, level=None):
         """Return stream logging handler.
@@ -173,6 +206,7 @@ class Logger(object):
         sh.setFormatter(formatter)
         sh.setLevel(self.log_level(level))
         self._logger.addHandler(sh)
+        self._update_logger_level()
 
     def add_thread_file_handler(self, name, filename, level, path, formatter=None):
         """Add File logging handler.
@@ -184,14 +218,15 @@ class Logger(object):
             path (str): The path for the logfile.
             formatter (str, optional): The logging formatter to use. Defaults to None.
         """
-        self.remove_handler_by_name(name)
         formatter = formatter or self._formatter
-        # create customized handler
-        fh = ThreadFileHandler(os.path.join(path, filename))
-        fh.set_name(name)
-        fh.setFormatter(formatter)
-        fh.setLevel(self.log_level(level))
-        self._logger.addHandler(fh)
+        tfh = self._thread_file_handler
+        if tfh is None:
+            # a single handler routes records to the log file by thread name
+            tfh = ThreadFileDispatchHandler()
+            tfh.set_name('thread-file')
+            self._logger.addHandler(tfh)
+        tfh.add_sink(name, os.path.join(path, filename), self.log_level(level), formatter)
+        self._update_logger_level()
 
     #
     # App info logging
@@ -3,6 +3,7 @@
 import logging
 import os
 import threading
+from collections import OrderedDict
 
 
 class ThreadFileHandler(logging.FileHandler):
@@ -36,3 +37,120 @@ class ThreadFileHandler(logging.FileHandler):
         """
         if self.get_name() == threading.current_thread().name:
             logging.FileHandler.emit(self, record)
+
+
+class ThreadFileDispatchHandler(logging.Handler):
+    """Logger handler routing records to a per thread (session) ThreadFileHandler.
+
+    Records are routed using a dict keyed by the thread name, so the cost per record does not
+    depend on the number of registered threads. Log files are opened on the first record and
+    the least recently used files are closed once more than **max_open** files are open.
+    """
+
+    def __init__(self, max_open=100):
+        """Initialize Class properties.
+
+        Args:
+            max_open (int, optional): The max number of open log files. Defaults to 100.
+        """
+        super(ThreadFileDispatchHandler, self).__init__()
+        self.max_open = max_open
+        self.sinks = {}
+        self._lru_lock = threading.Lock()
+        self._open_sinks = OrderedDict()
+        self._update_level()
+
+    @staticmethod
+    def _close_stream(handler):
+        """Close the handler file stream, the file is reopened on the next record."""
+        handler.acquire()
+        try:
+            if handler.stream is not None:
+                handler.flush()
+                handler.stream.close()
+                handler.stream = None
+        finally:
+            handler.release()
+
+    def _update_level(self):
+        """Set the handler level to the lowest log file level (records are checked per file)."""
+        levels = [sink.level for sink in list(self.sinks.values())]
+        # with no log files registered the handler does not accept any records
+        self.level = min(levels or [logging.CRITICAL + 1])
+
+    def add_sink(self, name, filename, level, formatter):
+        """Add a log file for a thread.
+
+        Args:
+            name (str): The thread name.
+            filename (str): The full path of the logfile.
+            level (int): The logging level.
+            formatter (logging.Formatter): The logging formatter.
+        """
+        self.remove_sink(name)
+        fh = ThreadFileHandler(filename, delay=1)
+        fh.set_name(name)
+        fh.setFormatter(formatter)
+        fh.setLevel(level)
+        self.sinks[name] = fh
+        self._update_level()
+
+    def close(self):
+        """Close all log files."""
+        for name in list(self.sinks):
+            self.remove_sink(name)
+        super(ThreadFileDispatchHandler, self).close()
+
+    def handle(self, record):
+        """Route the record to the log file for the thread.
+
+        Args:
+            record (obj): The record to be logged.
+        """
+        sink = self.sinks.get(record.threadName)
+        if sink is None or record.levelno < sink.level or not self.filter(record):
+            return False
+
+        # track recently used log files and close the least recently used file
+        with self._lru_lock:
+            self._open_sinks[record.threadName] = sink
+            if hasattr(self._open_sinks, 'move_to_end'):
+                self._open_sinks.move_to_end(record.threadName)
+            else:  # pragma: no cover
+                # TODO: [py2] - remove py2 specific code
+                self._open_sinks[record.threadName] = self._open_sinks.pop(record.threadName)
+            idle = []
+            while len(self._open_sinks) > self.max_open:
+                idle.append(self._open_sinks.popitem(last=False)[1])
+        for handler in idle:
+            self._close_stream(handler)
+
+        return sink.handle(record)
+
+    def remove_sink(self, name):
+        """Remove the log file for a thread.
+
+        Args:
+            name (str): The thread name.
+
+        Returns:
+            bool: True if a log file was registered for the thread.
+        """
+        sink = self.sinks.pop(name, None)
+        if sink is None:
+            return False
+        with self._lru_lock:
+            self._open_sinks.pop(name, None)
+        sink.close()
+        self._update_level()
+        return True
+
+    def setLevel(self, level):
+        """Set the logging level of all log files.
+
+        Args:
+            level (int): The logging level.
+        """
+        for sink in list(self.sinks.values()):
+            sink.setLevel(level)
+        self._update_level()
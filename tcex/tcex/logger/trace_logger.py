@@ -2,39 +2,99 @@
 """Trace Logger Class"""
 import logging
 import sys
-from inspect import getframeinfo, stack
 
 # Create trace logging level
 logging.TRACE = logging.DEBUG - 5
 logging.addLevelName(logging.TRACE, 'TRACE')
 
 
+class LazyArg(object):
+    """Log message argument that is only evaluated when the record is formatted.
+
+    .. code-block:: python
+
+        tcex.log.debug('metrics: %s', LazyArg(lambda: self.metrics))
+
+    Args:
+        func (callable): The method returning the argument value.
+    """
+
+    __slots__ = ['func']
+
+    def __init__(self, func):
+        """Initialize Class properties."""
+        self.func = func
+
+    def __str__(self):
+        """Return the argument value as a string."""
+        return str(self.func())
+
+
+class TruncatedArg(object):
+    """Log message argument that is truncated to max_length characters when formatted.
+
+    .. code-block:: python
+
+        tcex.log.trace('message: %s', TruncatedArg(message))
+
+    Args:
+        value (any): The argument value. Callables are evaluated when the record is formatted.
+        max_length (int, optional): The max number of characters. Defaults to 1000.
+    """
+
+    __slots__ = ['max_length', 'value']
+
+    def __init__(self, value, max_length=1000):
+        """Initialize Class properties."""
+        self.max_length = max_length
+        self.value = value
+
+    def __str__(self):
+        """Return the truncated argument value as a string."""
+        value = self.value() if callable(self.value) else self.value
+        value = str(value)
+        if len(value) > self.max_length:
+            value = '{}... ({} characters)'.format(value[: self.max_length], len(value))
+        return value
+
+
 class TraceLogger(logging.Logger):
     """Add trace level to logging"""
 
-    def findCaller(self, stack_info=False):
+    def findCaller(self, stack_info=False, stacklevel=1):  # pylint: disable=unused-argument
         """Find the caller for the current log event.
 
         Args:
             stack_info (bool, optional): Defaults to False.
+            stacklevel (int, optional): Defaults to 1.
 
         Returns:
             tuple: The caller stack information.
         """
-        caller = None
+        # walk the frames directly (inspect.stack reads the source of every frame)
         depth = 3
-        while True:
+        frame = sys._getframe(depth)  # pylint: disable=protected-access
+        while frame.f_code.co_name == 'trace' and depth < 6:
             # search for the correct calling method
-            caller = getframeinfo(stack()[depth][0])
-            if caller.function != 'trace' or depth >= 6:
-                break
+            frame = frame.f_back
             depth += 1
+        caller = (frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)
 
         if sys.version_info < (3,):
             # return value for py2
-            return (caller.filename, caller.lineno, caller.function)
+            return caller
         # TODO: [py2] - remove py2 statement and remove coverage pragma
-        return (caller.filename, caller.lineno, caller.function, None)  # pragma: no cover
+        return caller + (None,)  # pragma: no cover
+
+    @property
+    def is_debug(self):
+        """Return True if DEBUG records are handled (guard for expensive log arguments)."""
+        return self.isEnabledFor(logging.DEBUG)
+
+    @property
+    def is_trace(self):
+        """Return True if TRACE records are handled (guard for expensive log arguments)."""
+        return self.isEnabledFor(logging.TRACE)
 
     def trace(self, msg, *args, **kwargs):
         """Set trace logging level
@@ -1,34 +1,185 @@
 # -*- coding: utf-8 -*-
 """TcEx Framework Playbook module"""
 import base64
+import binascii
+import io
 import json
 import re
+import tempfile
+import threading
 from collections import OrderedDict
 
+from ..logger.trace_logger import TruncatedArg
+
 
 class Playbooks(object):
     """Playbook methods for accessing key value store."""
 
-    def __init__(self, tcex):
+    # the variable regexes are compiled once and shared by all Playbooks instances
+    _variable_regexes = None
+    # parsed embedded variable templates shared by all Playbooks instances
+    _embedded_templates = {}
+    _embedded_templates_max = 1024
+    # the backslash escapes expanded in embedded variable values
+    _embedded_escapes = re.compile(r'\\([\\abfnrtv])')
+    _embedded_escape_chars = {
+        '\\': '\\',
+        'a': '\a',
+        'b': '\b',
+        'f': '\f',
+        'n': '\n',
+        'r': '\r',
+        't': '\t',
+        'v': '\v',
+    }
+    # binary data is base64 encoded/decoded in chunks (multiples of 3 bytes/4 characters)
+    _binary_chunk_size = 3 * 256 * 1024
+
+    def __init__(self, tcex, context=None, output_variables=None):
         """Initialize the Class properties.
 
         Args:
             tcex (object): Instance of TcEx.
+            context (str, optional): The KV store context (Redis hash key) for this instance,
+                defaults to tc_playbook_db_context.
+            output_variables (list, optional): The requested output variables for this instance.
         """
         self.tcex = tcex
+        self._context = context
         self._db = None
+        self._local = threading.local()
         self._output_variables = {}
         self._output_variables_type = None
         self.output_data = {}
 
-        # match full variable
-        self._variable_match = re.compile(r'^{}$'.format(self._variable_pattern))
-        # capture variable parts (exactly a variable)
-        self._variable_parse = re.compile(self._variable_pattern)
-        # match embedded variables without quotes (#App:7979:variable_name!StringArray)
-        self._vars_keyvalue_embedded = re.compile(
-            r'(?:\"\:\s?)[^\"]?{}'.format(self._variable_pattern)
-        )
+        if Playbooks._variable_regexes is None:
+            Playbooks._variable_regexes = (
+                # match full variable
+                re.compile(r'^{}$'.format(self._variable_pattern)),
+                # capture variable parts (exactly a variable)
+                re.compile(self._variable_pattern),
+                # match embedded variables without quotes (#App:7979:variable_name!StringArray)
+                re.compile(r'(?:\"\:\s?)[^\"]?{}'.format(self._variable_pattern)),
+            )
+        (
+            self._variable_match,
+            self._variable_parse,
+            self._vars_keyvalue_embedded,
+        ) = Playbooks._variable_regexes
+
+        if output_variables is not None:
+            self._parse_output_variables(output_variables)
+
+    def _embedded_template(self, data):
+        """Return the data parsed into literal (str) and variable (tuple) parts.
+
+        Variables are stored as (variable, variable type, quote before, quote after). For
+        non-String types the double quotes around the variable are part of the variable, as they
+        are replaced when the variable has a value. Parsed templates are cached.
+
+        Args:
+            data (str): The data with embedded variables.
+
+        Returns:
+            tuple: The template parts.
+        """
+        template = self._embedded_templates.get(data)
+        if template is not None:
+            return template
+
+        template = []
+        position = 0
+        for m in self._variable_parse.finditer(data):
+            start, end = m.span()
+            before = after = ''
+            if m.group(4) != 'String':
+                if start > position and data[start - 1] == '"':
+                    start -= 1
+                    before = '"'
+                if data.startswith('"', end):
+                    end += 1
+                    after = '"'
+            if start > position:
+                template.append(data[position:start])
+            template.append((m.group(0), m.group(4), before, after))
+            position = end
+        if position < len(data):
+            template.append(data[position:])
+
+        if len(self._embedded_templates) >= self._embedded_templates_max:
+            self._embedded_templates.clear()
+        template = tuple(template)
+        self._embedded_templates[data] = template
+        return template
+
+    def _embedded_unescape(self, value):
+        """Return an embedded variable value with the backslash escapes expanded.
+
+        Embedded values have always been expanded the same as a re.sub() replacement string
+        (e.g., the JSON escaped newline of a String value is embedded as a newline). Only the
+        character escapes are expanded, any other backslash (e.g., in a JSON unicode escape or
+        before a digit) is inserted literally instead of raising an invalid escape error.
+
+        Args:
+            value (str): The JSON encoded value.
+
+        Returns:
+            str: The value to embed in the data.
+        """
+        return self._embedded_escapes.sub(lambda m: self._embedded_escape_chars[m.group(1)], value)
+
+    @staticmethod
+    def _binary_view(data):
+        """Return a view of the base64 data of binary data stored as a JSON string.
+
+        Args:
+            data (bytes): The JSON string of base64 encoded data from the DB.
+
+        Returns:
+            (memoryview): The base64 encoded data.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if b'\\' in data:
+            # escaped characters (e.g., "\/") written by another JSON encoder
+            data = json.loads(data.decode('utf-8')).encode('utf-8')
+
+        view = memoryview(data)
+        if data.startswith(b'"') and data.endswith(b'"'):
+            end = len(view) - 1
+            view = view[1:end]
+        return view
+
+    def _encode_binary(self, value, output):
+        """Base64 encode binary data as a JSON string in chunks.
+
+        The result is the same as ``json.dumps(base64.b64encode(value).decode('utf-8'))``
+        without the intermediate copies of the data.
+
+        Args:
+            value (bytes|bytearray|memoryview|str|file): The data or a file opened in binary mode.
+            output (BytesIO): The buffer to write the JSON string of base64 encoded data.
+        """
+        chunk_size = self._binary_chunk_size
+        output.write(b'"')
+        if hasattr(value, 'read'):
+            pending = b''
+            for chunk in iter(lambda: value.read(chunk_size), b''):
+                # only encode multiples of 3 bytes so the encoded chunks can be joined
+                chunk = pending + chunk
+                end = len(chunk) - len(chunk) % 3
+                output.write(binascii.b2a_base64(chunk[:end], newline=False))
+                pending = chunk[end:]
+            if pending:
+                output.write(binascii.b2a_base64(pending, newline=False))
+        else:
+            if isinstance(value, str):
+                value = value.encode('utf-8')
+            view = memoryview(value).cast('B')
+            for start in range(0, len(view), chunk_size):
+                end = start + chunk_size
+                output.write(binascii.b2a_base64(view[start:end], newline=False))
+        output.write(b'"')
 
     def _parse_output_variables(self, variables):
         """Parse the injected output variables or tc_playbook_out_variable arg.
@@ -57,6 +208,79 @@ class Playbooks(object):
             vt_key = '{}-{}'.format(variable_name, variable_type)
             self._output_variables_type[vt_key] = {'variable': o}
 
+    def _prefetch(self, keys):
+        """Read multiple keys from the DB in a single request for the following reads.
+
+        Args:
+            keys (list): The variables to read from the DB.
+
+        Returns:
+            dict: The previous prefetched data, to be restored once the reads are complete.
+        """
+        previous = getattr(self._local, 'prefetch', None)
+        prefetch = dict(previous or {})
+        keys = [k for k in OrderedDict.fromkeys(keys) if k not in prefetch]
+        if len(keys) > 1:
+            prefetch.update(zip(keys, self.db.read_many(keys)))
+        self._local.prefetch = prefetch
+        return previous
+
+    def _read_db(self, key, decode=True):
+        """Read a key from the DB, using prefetched data if available.
+
+        Args:
+            key (string): The variable to read from the DB.
+            decode (bool, default:True): If False the data is returned as bytes.
+
+        Returns:
+            (string|bytes): Results retrieved from DB.
+        """
+        prefetch = getattr(self._local, 'prefetch', None)
+        if prefetch is not None and key in prefetch:
+            data = prefetch[key]
+            if not decode and isinstance(data, str):
+                data = data.encode('utf-8')
+            return data
+        if not decode:
+            return self.db.read(key, decode=False)
+        return self.db.read(key)
+
+    def _write_db(self, key, value):
+        """Write a key to the DB, or to the write buffer when writes are buffered.
+
+        Args:
+            key (string): The variable to write to the DB.
+            value (any): The data to write to the DB.
+
+        Returns:
+            (string): Result of DB write.
+        """
+        write_buffer = getattr(self._local, 'write_buffer', None)
+        if write_buffer is not None:
+            write_buffer[key] = value
+            return None
+        return self.db.create(key, value)
+
+    def _write_many(self, func):
+        """Buffer the DB writes made by func and write them in a single DB request.
+
+        Args:
+            func (callable): The method making the DB writes.
+        """
+        previous = getattr(self._local, 'write_buffer', None)
+        write_buffer = OrderedDict()
+        self._local.write_buffer = write_buffer
+        try:
+            func()
+        finally:
+            self._local.write_buffer = previous
+
+        if previous is not None:
+            # nested, written by the outer call
+            previous.update(write_buffer)
+        elif write_buffer:
+            self.db.create_many(write_buffer)
+
     @property
     def _variable_pattern(self):
         """Regex pattern to match and parse a playbook variable."""
@@ -205,7 +429,7 @@ class Playbooks(object):
         data = None
         if key is not None:
             key = key.strip()
-            self.tcex.log.debug(u'create variable {}'.format(key))
+            self.tcex.log.debug(u'create variable %s', key)
             # bcs - only for debugging or binary might cause issues
             # self.tcex.log.debug(u'variable value: {}'.format(value))
             parsed_key = self.parse_variable(key.strip())
@@ -216,6 +440,36 @@ class Playbooks(object):
                 data = self.create_raw(key, value)
         return data
 
+    def create_many(self, data):
+        """Create multiple variables in a single DB request.
+
+        Args:
+            data (dict): The variables and values to write to the DB.
+        """
+
+        def create():
+            """Create the variables."""
+            for key, value in data.items():
+                self.create(key, value)
+
+        self._write_many(create)
+
+    def context(self, context, output_variables=None):
+        """Return a Playbooks instance for a session (e.g., a service trigger session).
+
+        The instance has its own KV store context, output variables and output data, and shares
+        the compiled variable regexes and the Redis connection pool with this instance, so
+        sessions can be processed concurrently.
+
+        Args:
+            context (str): The KV store context (Redis hash key) for the session.
+            output_variables (list, optional): The requested output variables for the session.
+
+        Returns:
+            tcex.Playbooks: An instance of Playbooks for the session.
+        """
+        return Playbooks(self.tcex, context, output_variables or [])
+
     @property
     def create_data_types(self):
         """Map of standard playbook variable types to create method."""
@@ -282,10 +536,8 @@ class Playbooks(object):
                 var_value = key
                 if variable_type is not None:
                     var_value = key_type
-                self.tcex.log.trace('requested output variables: {}'.format(self.output_variables))
-                self.tcex.log.debug(
-                    u'Variable {} was NOT requested by downstream app.'.format(var_value)
-                )
+                self.tcex.log.trace('requested output variables: %s', self.output_variables)
+                self.tcex.log.debug(u'Variable %s was NOT requested by downstream app.', var_value)
         return results
 
     @property
@@ -295,10 +547,11 @@ class Playbooks(object):
             if self.tcex.default_args.tc_playbook_db_type == 'Redis':
                 from ..tcex_redis import TcExRedis
 
+                # the RedisClient connection pool is shared by all instances
                 self._db = TcExRedis(
                     self.tcex.default_args.tc_playbook_db_path,
                     self.tcex.default_args.tc_playbook_db_port,
-                    self.tcex.default_args.tc_playbook_db_context,
+                    self._context or self.tcex.default_args.tc_playbook_db_context,
                 )
             elif self.tcex.default_args.tc_playbook_db_type == 'TCKeyValueAPI':
                 from ..tcex_key_value import TcExKeyValue
@@ -378,9 +631,8 @@ class Playbooks(object):
         """
         data = None
         if variable is not None:
-            variable = variable.strip()
-            if re.match(self._variable_match, variable):
-                var = re.search(self._variable_parse, variable)
+            var = self._variable_match.match(variable.strip())
+            if var is not None:
                 data = {
                     'root': var.group(0),
                     'job_id': var.group(2),
@@ -408,10 +660,11 @@ class Playbooks(object):
         data = key
         if key is not None:
             key = key.strip()
-            key_type = self.variable_type(key)
-            if re.match(self._variable_match, key):
+            var = self._variable_match.match(key)
+            key_type = 'String' if var is None else var.group(4)
+            if var is not None:
                 # only log key if it's a variable
-                self.tcex.log.debug('read variable {}'.format(key))
+                self.tcex.log.debug('read variable %s', key)
                 if key_type in self.read_data_types:
                     # handle types with embedded variable
                     if key_type in ['Binary', 'BinaryArray']:
@@ -455,6 +708,26 @@ class Playbooks(object):
         """
         return self.read(key, True, embedded)
 
+    def read_many(self, keys, array=False, embedded=True):
+        """Read multiple variables, retrieving all of the variables in a single DB request.
+
+        Args:
+            keys (list): The variables to read from the DB.
+            array (boolean): Convert string/dict to Array/List before returning.
+            embedded (boolean): Resolve embedded variables.
+
+        Returns:
+            (list): Results retrieved from DB in the order of the keys.
+        """
+        variables = [
+            k.strip() for k in keys if k is not None and self._variable_match.match(k.strip())
+        ]
+        previous = self._prefetch(variables)
+        try:
+            return [self.read(k, array, embedded) for k in keys]
+        finally:
+            self._local.prefetch = previous
+
     @property
     def read_data_types(self):
         """Map of standard playbook variable types to read method."""
@@ -517,25 +790,47 @@ class Playbooks(object):
         if data is None:
             return data
 
-        # iterate all matching variables
-        for var in (v.group(0) for v in re.finditer(self._variable_parse, str(data))):
-            self.tcex.log.debug(
-                'embedded variable: {}, parent_var_type: {}'.format(var, parent_var_type)
-            )
-            key_type = self.variable_type(var)
-            val = self.read(var)
-
-            if val is None:
-                val = ''
-            elif key_type == 'String':
-                # SUP-5067 - embedded string needs to have newline escaped and double quotes removed
-                val = json.dumps(val)[1:-1]
-            elif key_type != 'String':
-                var = r'"?{}"?'.format(var)  # replace quotes if they exist
-                val = json.dumps(val)
-
-            data = re.sub(var, val, data)
-        return data
+        # parse the data once into literal and variable parts
+        template = self._embedded_template(str(data))
+        variables = OrderedDict((t[0], t[1]) for t in template if isinstance(t, tuple))
+        if not variables:
+            return data
+
+        # read all embedded variables in a single DB request
+        previous = self._prefetch(list(variables))
+        try:
+            values = {}
+            for var, key_type in variables.items():
+                self.tcex.log.debug(
+                    'embedded variable: %s, parent_var_type: %s', var, parent_var_type
+                )
+                val = self.read(var)
+                if val is None:
+                    values[var] = None
+                    continue
+
+                if key_type == 'String':
+                    # SUP-5067 - embedded string needs to have newline escaped and double quotes
+                    # removed
+                    val = json.dumps(val)[1:-1]
+                else:
+                    val = json.dumps(val)
+                values[var] = self._embedded_unescape(val)
+        finally:
+            self._local.prefetch = previous
+
+        # rebuild the data in a single pass
+        parts = []
+        for t in template:
+            if not isinstance(t, tuple):
+                parts.append(t)
+            elif values[t[0]] is None:
+                # keep the quotes when the variable has no value
+                parts.extend([t[2], t[3]])
+            else:
+                # replace quotes if they exist
+                parts.append(values[t[0]])
+        return ''.join(parts)
 
     def variable_type(self, variable):
         """Get the Type from the variable string or default to String type.
@@ -559,10 +854,10 @@ class Playbooks(object):
         """
         var_type = 'String'
         if variable is not None:
-            variable = variable.strip()
             # self.tcex.log.info(u'Variable {}'.format(variable))
-            if re.match(self._variable_match, variable):
-                var_type = re.search(self._variable_parse, variable).group(4)
+            var = self._variable_match.match(variable.strip())
+            if var is not None:
+                var_type = var.group(4)
         return var_type
 
     def wrap_embedded_keyvalue(self, data):
@@ -595,9 +890,14 @@ class Playbooks(object):
         return data
 
     def write_output(self):
-        """Write all stored output data to storage."""
-        for data in self.output_data.values():
-            self.create_output(data.get('key'), data.get('value'), data.get('type'))
+        """Write all stored output data to storage in a single DB request."""
+
+        def create_outputs():
+            """Create the output variables."""
+            for data in self.output_data.values():
+                self.create_output(data.get('key'), data.get('value'), data.get('type'))
+
+        self._write_many(create_outputs)
 
     #
     # db methods
@@ -610,29 +910,21 @@ class Playbooks(object):
     def create_binary(self, key, value):
         """Create method of CRUD operation for binary data.
 
+        The data is base64 encoded in chunks, large values can be provided as a file opened in
+        binary mode (e.g., a tempfile) to avoid reading the entire file into memory first.
+
         Args:
             key (string): The variable to write to the DB.
-            value (any): The data to write to the DB.
+            value (bytes|bytearray|memoryview|str|file): The data to write to the DB.
 
         Returns:
             (string): Result of DB write.
         """
         data = None
         if key is not None and value is not None:
-            try:
-                # py2
-                # convert to bytes as required for b64encode
-                # decode bytes for json serialization as required for json dumps
-                data = self.db.create(
-                    key.strip(), json.dumps(base64.b64encode(bytes(value)).decode('utf-8'))
-                )
-            except TypeError:
-                # py3
-                # set encoding on string and convert to bytes as required for b64encode
-                # decode bytes for json serialization as required for json dumps
-                data = self.db.create(
-                    key.strip(), json.dumps(base64.b64encode(bytes(value, 'utf-8')).decode('utf-8'))
-                )
+            output = io.BytesIO()
+            self._encode_binary(value, output)
+            data = self._write_db(key.strip(), output.getvalue())
         else:
             self.tcex.log.warning(u'The key or value field was None.')
         return data
@@ -650,23 +942,80 @@ class Playbooks(object):
         """
         data = None
         if key is not None:
-            data = self.db.read(key.strip())
+            if not b64decode:
+                data = self._read_db(key.strip())
+                if data is not None:
+                    data = json.loads(data)
+                return data
+
+            data = self._read_db(key.strip(), decode=False)
             if data is not None:
-                data = json.loads(data)
-                if b64decode:
-                    # if requested decode the base64 string
-                    data = base64.b64decode(data)
-                    if decode:
-                        try:
-                            # if requested decode bytes to a string
-                            data = data.decode('utf-8')
-                        except UnicodeDecodeError:
-                            # for data written an upstream java App
-                            data = data.decode('latin-1')
+                # decode the base64 string
+                data = binascii.a2b_base64(self._binary_view(data))
+                if decode:
+                    try:
+                        # if requested decode bytes to a string
+                        data = data.decode('utf-8')
+                    except UnicodeDecodeError:
+                        # for data written an upstream java App
+                        data = data.decode('latin-1')
         else:
             self.tcex.log.warning(u'The key field was None.')
         return data
 
+    def read_binary_buffer(self, key, max_size=None):
+        """Read method of CRUD operation for binary data without intermediate copies.
+
+        The data is base64 decoded in chunks into a bytearray or, if **max_size** is provided,
+        into a SpooledTemporaryFile that is written to disk once it exceeds **max_size** bytes.
+
+        .. code-block:: python
+
+            with tcex.playbook.read_binary_buffer(key, max_size=10485760) as fh:
+                for chunk in iter(lambda: fh.read(65536), b''):
+                    ...
+
+        Args:
+            key (string): The variable to read from the DB.
+            max_size (int, optional): The max number of bytes to hold in memory before
+                spilling to a temporary file.
+
+        Returns:
+            (bytearray|SpooledTemporaryFile): Results retrieved from DB.
+        """
+        if key is None:
+            self.tcex.log.warning(u'The key field was None.')
+            return None
+
+        data = self._read_db(key.strip(), decode=False)
+        if data is None:
+            return None
+
+        view = self._binary_view(data)
+        if max_size is None:
+            # allocate the max decoded size and trim after decoding
+            output = bytearray(len(view) // 4 * 3)
+        else:
+            output = tempfile.SpooledTemporaryFile(max_size=max_size)
+
+        chunk_size = self._binary_chunk_size // 3 * 4
+        size = 0
+        for start in range(0, len(view), chunk_size):
+            end = start + chunk_size
+            decoded = binascii.a2b_base64(view[start:end])
+            if max_size is None:
+                end = size + len(decoded)
+                output[size:end] = decoded
+            else:
+                output.write(decoded)
+            size += len(decoded)
+
+        if max_size is None:
+            del output[size:]
+        else:
+            output.seek(0)
+        return output
+
     def create_binary_array(self, key, value):
         """Create method of CRUD operation for binary array data.
 
@@ -679,21 +1028,18 @@ class Playbooks(object):
         """
         data = None
         if key is not None and value is not None:
-            value_encoded = []
-            for v in value:
-                if v is not None:
-                    try:
-                        # py2
-                        # convert to bytes as required for b64encode
-                        # decode bytes for json serialization as required for json dumps
-                        v = base64.b64encode(bytes(v)).decode('utf-8')
-                    except TypeError:
-                        # py3
-                        # set encoding on string and convert to bytes as required for b64encode
-                        # decode bytes for json serialization as required for json dumps
-                        v = base64.b64encode(bytes(v, 'utf-8')).decode('utf-8')
-                value_encoded.append(v)
-            data = self.db.create(key.strip(), json.dumps(value_encoded))
+            # same format as json.dumps of a list of base64 strings
+            output = io.BytesIO()
+            output.write(b'[')
+            for i, v in enumerate(value):
+                if i:
+                    output.write(b', ')
+                if v is None:
+                    output.write(b'null')
+                else:
+                    self._encode_binary(v, output)
+            output.write(b']')
+            data = self._write_db(key.strip(), output.getvalue())
         else:
             self.tcex.log.warning(u'The key or value field was None.')
         return data
@@ -711,7 +1057,7 @@ class Playbooks(object):
         """
         data = None
         if key is not None:
-            data = self.db.read(key.strip())
+            data = self._read_db(key.strip())
             if data is not None:
                 data_decoded = []
                 for d in json.loads(data, object_pairs_hook=OrderedDict):
@@ -744,12 +1090,12 @@ class Playbooks(object):
         data = None
         if key is not None and value is not None:
             if isinstance(value, (dict, list)):
-                data = self.db.create(key.strip(), json.dumps(value))
+                data = self._write_db(key.strip(), json.dumps(value))
             else:
                 # used to save raw value with embedded variables
-                data = self.db.create(key.strip(), value)
+                data = self._write_db(key.strip(), value)
             self.tcex.log.trace(
-                'pb create: context: {}, key: {}, value: {}'.format(self.db.key, key, value)
+                'pb create: context: %s, key: %s, value: %s', self.db.key, key, TruncatedArg(value)
             )
         else:
             self.tcex.log.warning(u'The key or value field was None.')
@@ -768,7 +1114,7 @@ class Playbooks(object):
         data = None
         if key is not None:
             key_type = self.variable_type(key)
-            data = self.db.read(key.strip())
+            data = self._read_db(key.strip())
             # embedded variable can be unquoted, which breaks JSON.
             data = self.wrap_embedded_keyvalue(data)
             if embedded:
@@ -798,12 +1144,12 @@ class Playbooks(object):
         data = None
         if key is not None and value is not None:
             if isinstance(value, (dict, list)):
-                data = self.db.create(key.strip(), json.dumps(value))
+                data = self._write_db(key.strip(), json.dumps(value))
             else:
                 # used to save raw value with embedded variables
-                data = self.db.create(key.strip(), value)
+                data = self._write_db(key.strip(), value)
             self.tcex.log.trace(
-                'pb create: context: {}, key: {}, value: {}'.format(self.db.key, key, value)
+                'pb create: context: %s, key: %s, value: %s', self.db.key, key, TruncatedArg(value)
             )
         else:
             self.tcex.log.warning(u'The key or value field was None.')
@@ -822,7 +1168,7 @@ class Playbooks(object):
         data = None
         if key is not None:
             key_type = self.variable_type(key)
-            data = self.db.read(key.strip())
+            data = self._read_db(key.strip())
             # embedded variable can be unquoted, which breaks JSON.
             data = self.wrap_embedded_keyvalue(data)
             if embedded:
@@ -851,7 +1197,7 @@ class Playbooks(object):
         """
         data = None
         if key is not None and value is not None:
-            data = self.db.create(key.strip(), value)
+            data = self._write_db(key.strip(), value)
         else:
             self.tcex.log.warning(u'The key or value field was None.')
         return data
@@ -867,7 +1213,7 @@ class Playbooks(object):
         """
         data = None
         if key is not None:
-            data = self.db.read(key.strip())
+            data = self._read_db(key.strip())
         else:
             self.tcex.log.warning(u'The key field was None.')
         return data
@@ -888,7 +1234,7 @@ class Playbooks(object):
                 # value = str(value)
                 value = u'{}'.format(value)
             # data = self.db.create(key.strip(), str(json.dumps(value)))
-            data = self.db.create(key.strip(), u'{}'.format(json.dumps(value)))
+            data = self._write_db(key.strip(), u'{}'.format(json.dumps(value)))
             # TODO: update for env servers
             # self.tcex.log.trace(
             #     'pb create: context: {}, key: {}, value: {}'.format(self.db.key, key, value)
@@ -910,7 +1256,7 @@ class Playbooks(object):
         data = None
         if key is not None:
             key_type = self.variable_type(key)
-            data = self.db.read(key.strip())
+            data = self._read_db(key.strip())
             if data is not None:
                 # handle improperly saved string
                 try:
@@ -942,12 +1288,12 @@ class Playbooks(object):
         data = None
         if key is not None and value is not None:
             if isinstance(value, (list)):
-                data = self.db.create(key.strip(), json.dumps(value))
+                data = self._write_db(key.strip(), json.dumps(value))
             else:
                 # used to save raw value with embedded variables
-                data = self.db.create(key.strip(), value)
+                data = self._write_db(key.strip(), value)
             self.tcex.log.trace(
-                'pb create: context: {}, key: {}, value: {}'.format(self.db.key, key, value)
+                'pb create: context: %s, key: %s, value: %s', self.db.key, key, TruncatedArg(value)
             )
         else:
             self.tcex.log.warning(u'The key or value field was None.')
@@ -966,7 +1312,7 @@ class Playbooks(object):
         data = None
         if key is not None:
             key_type = self.variable_type(key)
-            data = self.db.read(key.strip())
+            data = self._read_db(key.strip())
             if embedded:
                 data = self.read_embedded(data, key_type)
             if data is not None:
@@ -994,9 +1340,9 @@ class Playbooks(object):
         """
         data = None
         if key is not None and value is not None:
-            data = self.db.create(key.strip(), json.dumps(value))
+            data = self._write_db(key.strip(), json.dumps(value))
             self.tcex.log.trace(
-                'pb create: context: {}, key: {}, value: {}'.format(self.db.key, key, value)
+                'pb create: context: %s, key: %s, value: %s', self.db.key, key, TruncatedArg(value)
             )
         else:
             self.tcex.log.warning(u'The key or value field was None.')
@@ -1015,7 +1361,7 @@ class Playbooks(object):
         data = None
         if key is not None:
             key_type = self.variable_type(key)
-            data = self.db.read(key.strip())
+            data = self._read_db(key.strip())
             if embedded:
                 # untested. this is not a current use case.
                 data = self.read_embedded(data, key_type)
@@ -1044,9 +1390,9 @@ class Playbooks(object):
         """
         data = None
         if key is not None and value is not None:
-            data = self.db.create(key.strip(), json.dumps(value))
+            data = self._write_db(key.strip(), json.dumps(value))
             self.tcex.log.trace(
-                'pb create: context: {}, key: {}, value: {}'.format(self.db.key, key, value)
+                'pb create: context: %s, key: %s, value: %s', self.db.key, key, TruncatedArg(value)
             )
         else:
             self.tcex.log.warning(u'The key or value field was None.')
@@ -1065,7 +1411,7 @@ class Playbooks(object):
         data = None
         if key is not None:
             key_type = self.variable_type(key)
-            data = self.db.read(key.strip())
+            data = self._read_db(key.strip())
             if embedded:
                 # untested. this is not a current use case.
                 data = self.read_embedded(data, key_type)
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
 """Service module for TcEx Framework"""
 # flake8: noqa
-from services import Services
+from .message_dispatcher import MessageDispatcher
+from .services import Services
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""TcEx Framework Service Message Dispatcher module"""
+import threading
+import time
+import traceback
+from collections import deque
+
+try:
+    import Queue as queue  # Python 2
+except ImportError:
+    import queue  # Python 3
+
+from ..utils import Utils
+
+
+class MessageDispatcher(object):
+    """Run service messages on a bounded pool of worker threads.
+
+    Messages are added to a queue and processed by a fixed number of worker threads. While
+    processing a message the worker thread is renamed to the message name (e.g., the session id),
+    so thread based lookups (token registration, logging) continue to work.
+
+    At most **max_queue** messages can be waiting to be processed, including messages deferred
+    because their command is at the concurrency limit. When the queue is full the **overflow**
+    setting controls what happens to new messages:
+
+    * block - wait for space in the queue (the broker listener is blocked).
+    * shed - drop the message.
+    * reject - drop the message and call the reject callback (e.g., respond with a 503).
+
+    Calling :py:meth:`stop` processes the messages already queued and stops the worker threads,
+    any message submitted after that is dropped.
+
+    Args:
+        tcex (object): Instance of TcEx.
+        max_workers (int, default:25): The number of worker threads.
+        max_queue (int, default:1000): The max number of messages waiting to be processed (0 for
+            no limit).
+        overflow (str, default:block): The action when the queue is full (block, shed, or reject).
+        command_limits (dict, optional): The max number of concurrent messages per command
+            (e.g., {'runservice': 10}).
+        reject_callback (callable, optional): A method called with the message name, command, and
+            message args when a message is rejected.
+    """
+
+    def __init__(
+        self,
+        tcex,
+        max_workers=25,
+        max_queue=1000,
+        overflow='block',
+        command_limits=None,
+        reject_callback=None,
+    ):
+        """Initialize the Class properties."""
+        if overflow not in ['block', 'reject', 'shed']:
+            raise RuntimeError('Invalid overflow value ({}).'.format(overflow))
+
+        self.tcex = tcex
+        self.command_limits = command_limits or {}
+        self.max_workers = max_workers
+        self.overflow = overflow
+        self.reject_callback = reject_callback
+
+        # properties
+        self._deferred = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._queue = queue.Queue()
+        # a slot is held by each message from submit until the message starts processing
+        self._slots = threading.Semaphore(max_queue) if max_queue > 0 else None
+        self._running = {}
+        self._stats = {'completed': 0, 'execution': 0.0, 'rejected': 0, 'wait': 0.0}
+        self._stopped = False
+        self._workers = []
+
+    def _execute(self, task):
+        """Execute a task with the current thread renamed to the task name."""
+        name, _, target, args, kwargs, queued = task
+        if self._slots is not None:
+            self._slots.release()
+        with self._lock:
+            self._pending -= 1
+        with Utils.thread_name(name):
+            start = time.time()
+            try:
+                target(*args, **(kwargs or {}))
+            except Exception:
+                self.tcex.log.trace(traceback.format_exc())
+            finally:
+                with self._lock:
+                    self._stats['completed'] += 1
+                    self._stats['execution'] += time.time() - start
+                    self._stats['wait'] += start - queued
+
+    def _next_deferred(self, command):
+        """Return the next deferred task for the command or release the command slot."""
+        with self._lock:
+            deferred = self._deferred.get(command)
+            if deferred:
+                return deferred.popleft()
+            self._running[command] -= 1
+        return None
+
+    def _reserve(self, task):
+        """Reserve a command slot for the task or defer the task if the command is at limit."""
+        command = task[1]
+        limit = self.command_limits.get(command)
+        with self._lock:
+            running = self._running.get(command, 0)
+            if limit is not None and running >= limit:
+                self._deferred.setdefault(command, deque()).append(task)
+                return False
+            self._running[command] = running + 1
+        return True
+
+    def _start_workers(self):
+        """Start the worker threads."""
+        with self._lock:
+            if self._workers or self._stopped:
+                return
+            for i in range(self.max_workers):
+                t = threading.Thread(name='service-worker-{}'.format(i), target=self._worker)
+                t.daemon = True  # use setter for py2
+                t.start()
+                self._workers.append(t)
+
+    def _worker(self):
+        """Process tasks from the queue."""
+        while True:
+            task = self._queue.get()
+            if task is None:
+                # the dispatcher was stopped
+                self._queue.task_done()
+                return
+            try:
+                if not self._reserve(task):
+                    # the task will be run by the worker that releases the command slot
+                    continue
+
+                while task is not None:
+                    self._execute(task)
+                    task = self._next_deferred(task[1])
+            finally:
+                self._queue.task_done()
+
+    @property
+    def metrics(self):
+        """Return the dispatcher metrics.
+
+        The wait and execution times are the average milliseconds per completed message.
+        """
+        with self._lock:
+            completed = self._stats['completed']
+            return {
+                'queue depth': self._pending,
+                'queue wait ms': (
+                    int(self._stats['wait'] * 1000 / completed) if completed else 0
+                ),
+                'execution ms': (
+                    int(self._stats['execution'] * 1000 / completed) if completed else 0
+                ),
+                'rejected': self._stats['rejected'],
+                'running': sum(self._running.values()),
+            }
+
+    def submit(self, name, target, args, kwargs=None, command=None, overflow=None):
+        """Add a message to be processed by the worker pool.
+
+        Args:
+            name (str): The name of the thread while processing (e.g., the session id).
+            target (callable): The method to call.
+            args (tuple): The args to pass to the target method.
+            kwargs (dict, optional): The kwargs to pass to the target method.
+            command (str, optional): The command name used for concurrency limits and metrics.
+            overflow (str, optional): Override the overflow setting for this message.
+
+        Returns:
+            bool: True if the message was queued.
+        """
+        command = (command or name).lower()
+        if self._stopped:
+            self.tcex.log.warning(
+                'Service is stopped, {} message for {} was dropped.'.format(command, name)
+            )
+            return False
+
+        self._start_workers()
+        overflow = overflow or self.overflow
+        task = (name, command, target, args, kwargs, time.time())
+        if self._slots is not None and not self._slots.acquire(overflow == 'block'):
+            with self._lock:
+                self._stats['rejected'] += 1
+            self.tcex.log.warning(
+                'Service queue is full, {} message for {} was dropped.'.format(command, name)
+            )
+            if overflow == 'reject' and callable(self.reject_callback):
+                try:
+                    self.reject_callback(name, command, args)
+                except Exception:
+                    self.tcex.log.trace(traceback.format_exc())
+            return False
+
+        with self._lock:
+            self._pending += 1
+        self._queue.put(task)
+        return True
+
+    def stop(self, timeout=None):
+        """Stop the worker threads once all queued messages have been processed.
+
+        Args:
+            timeout (float, optional): The max number of seconds to wait for the worker threads.
+                By default wait until all queued messages have been processed.
+        """
+        with self._lock:
+            self._stopped = True
+            workers = self._workers
+            self._workers = []
+        for _ in workers:
+            self._queue.put(None)
+
+        end = time.time() + timeout if timeout is not None else None
+        for t in workers:
+            if t is threading.current_thread():
+                # stopped from a message being processed
+                continue
+            t.join(max(end - time.time(), 0) if end is not None else None)
@@ -9,11 +9,16 @@ import traceback
 import uuid
 from datetime import datetime
 
-# py2to3 will convert this to "from io"
-from StringIO import StringIO  # pylint: disable=import-error
+try:
+    from StringIO import StringIO  # Python 2
+except ImportError:
+    from io import StringIO  # Python 3
 
 import paho.mqtt.client as mqtt
 
+from ..logger.trace_logger import LazyArg, TruncatedArg
+from .message_dispatcher import MessageDispatcher
+
 
 class Services(object):
     """Service methods for customer Service (e.g., Triggers).
@@ -30,6 +35,7 @@ class Services(object):
         # properties
         self._client = None
         self._connected = False
+        self._dispatcher = None
         self._mqtt_client = None
         self._ready = False
         self._redis_client = None
@@ -117,6 +123,32 @@ class Services(object):
         except Exception as e:
             self.tcex.log.error('Could not delete config for Id {} ({}).'.format(trigger_id, e))
 
+    @property
+    def dispatcher(self):
+        """Return the message dispatcher, creating the default worker pool if required.
+
+        A custom dispatcher can be set by the App before the service starts listening.
+
+        .. code-block:: python
+
+            tcex.service.dispatcher = MessageDispatcher(
+                tcex,
+                max_workers=10,
+                max_queue=100,
+                overflow='reject',
+                command_limits={'runservice': 5},
+                reject_callback=tcex.service.reject_message,
+            )
+        """
+        if self._dispatcher is None:
+            self._dispatcher = MessageDispatcher(self.tcex, reject_callback=self.reject_message)
+        return self._dispatcher
+
+    @dispatcher.setter
+    def dispatcher(self, dispatcher):
+        """Set the message dispatcher."""
+        self._dispatcher = dispatcher
+
     def fire_event(self, callback, **kwargs):
         """Trigger a FireEvent command.
 
@@ -128,21 +160,20 @@ class Services(object):
 
         for trigger_id, config in self.configs.items():
             try:
-                self.tcex.log.trace('triggering callback for config id: {}'.format(trigger_id))
+                self.tcex.log.trace('triggering callback for config id: %s', trigger_id)
                 # get a session_id specifically for this thread
                 session_id = self.session_id(trigger_id)
 
-                # get instance of playbook specifically for this thread
-                playbook = self.tcex.playbook
-                # update the playbook hash/key/session_id and output_variables
-                playbook.db.key = session_id
-                playbook.output_variables = config.get('tc_playbook_out_variables', [])
+                # get instance of playbook specifically for this session
+                playbook = self.playbook(session_id, config.get('tc_playbook_out_variables'))
 
                 self.tcex.log.info('Trigger Session ID: {}'.format(session_id))
 
                 args = (callback, playbook, trigger_id, config)
                 # current thread has session_id as name
-                self.message_thread(session_id, self.fire_event_trigger, args, kwargs)
+                self.message_thread(
+                    session_id, self.fire_event_trigger, args, kwargs, command='fireevent'
+                )
             except Exception:
                 self.tcex.log.trace(traceback.format_exc())
 
@@ -297,7 +328,7 @@ class Services(object):
 
     def listen(self):
         """List for message coming from broker."""
-        self.tcex.log.trace('listen with {} broker'.format(self.tcex.args.tc_svc_broker_service))
+        self.tcex.log.trace('listen with %s broker', self.tcex.args.tc_svc_broker_service)
         if self.tcex.args.tc_svc_broker_service.lower() == 'mqtt':
             target = self.listen_mqtt
         elif self.tcex.args.tc_svc_broker_service.lower() == 'redis':
@@ -322,7 +353,7 @@ class Services(object):
             #     self.mqtt_client.on_log = self.on_log
             self.mqtt_client.loop_forever()
         except Exception as e:
-            self.tcex.log.trace('error in listen_mqtt: {}'.format(e))
+            self.tcex.log.trace('error in listen_mqtt: %s', e)
             self.tcex.log.error(traceback.format_exc())
 
     def listen_redis(self):
@@ -343,27 +374,36 @@ class Services(object):
             if self.shutdown is True:
                 break
 
-    def message_thread(self, name, target, args, kwargs=None):
-        """Start a message thread.
+    def message_thread(self, name, target, args, kwargs=None, command=None, overflow=None):
+        """Dispatch a message to the worker pool.
 
         Args:
-            name (str): The name of the thread.
+            name (str): The name of the thread while processing (e.g., the session id).
             target (callable): The method to call for the thread.
             args (tuple): The args to pass to the target method.
+            kwargs (dict, optional): The kwargs to pass to the target method.
+            command (str, optional): The command name used for concurrency limits.
+            overflow (str, optional): Override the dispatcher overflow setting.
+
+        Returns:
+            bool: True if the message was accepted.
         """
         # self.tcex.log.trace('message thread: {} - {}'.format(type(target), args))
         try:
-            t = threading.Thread(name=name, target=target, args=args, kwargs=kwargs)
-            t.daemon = True  # use setter for py2
-            t.start()
+            return self.dispatcher.submit(
+                name, target, args, kwargs, command=command, overflow=overflow
+            )
         except Exception:
             self.tcex.log.trace(traceback.format_exc())
+        return False
 
     @property
     def metrics(self):
         """Return current metrics."""
         # update default active playbook metric
         self.update_metric('active playbooks', len(self.configs))
+        if self._dispatcher is not None:
+            self._metrics.update(self._dispatcher.metrics)
         return self._metrics
 
     @metrics.setter
@@ -412,12 +452,12 @@ class Services(object):
 
     def on_log(self, client, userdata, level, buf):  # pylint: disable=unused-argument
         """Handle MQTT on_log events."""
-        self.tcex.log.trace('on_log - buf: {}, level: {}'.format(buf, level))
+        self.tcex.log.trace('on_log - buf: %s, level: %s', buf, level)
 
     def on_message_mqtt(self, client, userdata, message):  # pylint: disable=unused-argument
         """On message for mqtt."""
-        self.tcex.log.trace('on_message - message.payload: {}'.format(message.payload))
-        self.tcex.log.trace('on_message - message.topic: {}'.format(message.topic))
+        self.tcex.log.trace('on_message - message.payload: %s', TruncatedArg(message.payload))
+        self.tcex.log.trace('on_message - message.topic: %s', message.topic)
         try:
             # messages on server topic must be json objects
             m = json.loads(message.payload)
@@ -430,7 +470,7 @@ class Services(object):
 
     def on_message_redis(self, message):  # pylint: disable=unused-argument
         """Subscribe and listen to "message" on Redis topic."""
-        self.tcex.log.trace('on_message - message {}'.format(message))
+        self.tcex.log.trace('on_message - message %s', TruncatedArg(message))
         # only process "message" on topic (exclude subscriptions, etc)
         if message.get('type') != 'message':
             return
@@ -445,14 +485,14 @@ class Services(object):
 
     def on_publish(self, client, userdata, result):  # pylint: disable=unused-argument
         """Handle MQTT on_log events."""
-        self.tcex.log.trace('on_publish - {}'.format(result))
+        self.tcex.log.trace('on_publish - %s', result)
 
     def on_subscribe(self, client, userdata, mid, granted_qos):  # pylint: disable=unused-argument
         """Handle MQTT on_log events."""
-        self.tcex.log.trace('on_subscribe - mid: {}, granted_qos: {}'.format(mid, granted_qos))
+        self.tcex.log.trace('on_subscribe - mid: %s, granted_qos: %s', mid, granted_qos)
 
     def playbook(self, session_id, variables):
-        """Return a configure playbook instance.
+        """Return a playbook instance for the session.
 
         Args:
             session_id (str): The current session Id.
@@ -461,10 +501,7 @@ class Services(object):
         Returns:
             tcex.Playbook: An instance of Playbooks.
         """
-        playbook = self.tcex.playbook
-        playbook.db.key = session_id
-        playbook.output_variables = variables or []
-        return playbook
+        return self.tcex.playbook.context(session_id, variables)
 
     def process_config(self, message):
         """Process config message.
@@ -548,10 +585,7 @@ class Services(object):
             self.thread_name, message.get('apiToken'), message.get('expireSeconds')
         )
         self.tcex.log.info('Processing RunService Command')
-        self.tcex.log.debug('message: {}'.format(message))
-
-        # thread event used to block response until body is written
-        e = threading.Event()
+        self.tcex.log.debug('message: %s', TruncatedArg(message))
 
         # process message
         request_key = message.get('requestKey')
@@ -609,7 +643,7 @@ class Services(object):
                 environ['CONTENT_TYPE'] = (headers.get('content-type'),)
             if headers.get('content-length') is not None:
                 environ['CONTENT_LENGTH'] = headers.get('content-length')
-            self.tcex.log.trace('environ: {}'.format(environ))
+            self.tcex.log.trace('environ: %s', TruncatedArg(environ))
             self.increment_metric('requests')
         except Exception as e:
             self.tcex.log.error('Failed building environ ({})'.format(e))
@@ -617,18 +651,12 @@ class Services(object):
             self.increment_metric('errors')
             return  # stop processing
 
+        # the response is published on this thread once the body is written
+        response = {}
+
         def response_handler(*args, **kwargs):  # pylint: disable=unused-argument
             """Handle WSGI Response"""
-            kwargs['e'] = e  # add event to kwargs for blocking
-            kwargs['request_key'] = request_key
-            t = threading.Thread(
-                name='response-handler',
-                target=self.process_run_service_response,
-                args=args,
-                kwargs=kwargs,
-            )
-            t.daemon = True  # use setter for py2
-            t.start()
+            response['args'] = args
 
         if callable(self.api_event_callback):
             try:
@@ -642,9 +670,7 @@ class Services(object):
                 # write body to Redis
                 self.redis_client.hset(request_key, 'response.body', body)
 
-                # set thread event to True to trigger response
                 self.tcex.log.info('API response body written')
-                e.set()
             except Exception as e:
                 self.tcex.log.error(
                     'The api event callback method encountered and error ({}).'.format(e)
@@ -652,6 +678,9 @@ class Services(object):
                 self.tcex.log.trace(traceback.format_exc())
                 self.increment_metric('errors')
 
+            if response.get('args') is not None:
+                self.process_run_service_response(*response['args'], request_key=request_key)
+
         # unregister config apiToken
         self.tcex.token.unregister_token(self.thread_name)
 
@@ -660,9 +689,10 @@ class Services(object):
 
         ('200 OK', [('content-type', 'application/json'), ('content-length', '103')])
         """
-        self.tcex.log.info('API response received, waiting on body to be written')
-        kwargs.get('e').wait(10)  # wait for thread event - (set on body write)
-        self.tcex.log.trace('response args: {}'.format(args))
+        self.tcex.log.info('API response received')
+        if kwargs.get('e') is not None:
+            kwargs.get('e').wait(10)  # wait for thread event - (set on body write)
+        self.tcex.log.trace('response args: %s', TruncatedArg(args))
         try:
             status_code, status = args[0].split(' ', 1)
             response = {
@@ -712,6 +742,10 @@ class Services(object):
             self.mqtt_client.unsubscribe(self.tcex.default_args.tc_svc_server_topic)
             self.mqtt_client.disconnect()
 
+        # process the messages already queued and stop the worker threads
+        if self._dispatcher is not None:
+            self._dispatcher.stop(timeout=5)
+
         # delay shutdown to give App time to cleanup
         self.shutdown = True
         time.sleep(5)
@@ -798,12 +832,12 @@ class Services(object):
         """
         if topic is None:
             topic = self.tcex.default_args.tc_svc_client_topic
-        self.tcex.log.debug('publish topic: ({})'.format(topic))
-        self.tcex.log.debug('publish message: ({})'.format(message))
+        self.tcex.log.debug('publish topic: (%s)', topic)
+        self.tcex.log.debug('publish message: (%s)', TruncatedArg(message))
 
         if self.tcex.args.tc_svc_broker_service.lower() == 'mqtt':
             r = self.mqtt_client.publish(topic, message)
-            self.tcex.log.trace('publish response: {}'.format(r))
+            self.tcex.log.trace('publish response: %s', r)
         elif self.tcex.args.tc_svc_broker_service.lower() == 'redis':
             self.redis_client.publish(topic, message)
 
@@ -833,13 +867,56 @@ class Services(object):
             self._redis_client = self.tcex.playbook.db.client
         return self._redis_client
 
+    def reject_message(self, name, command, args):
+        """Respond with a 503 status for a message rejected by the dispatcher.
+
+        The response has the same format as the RunService and WebhookEvent responses with an
+        empty response body.
+
+        Args:
+            name (str): The session id of the rejected message.
+            command (str): The command name of the rejected message.
+            args (tuple): The args of the rejected message (the broker message).
+        """
+        message = args[0]
+        request_key = message.get('requestKey')
+        if command == 'runservice':
+            response = {
+                'bodyVariable': 'response.body',
+                'command': 'Acknowledged',
+                'headers': [],
+                'requestKey': request_key,
+                'status': 'Service Unavailable',
+                'statusCode': '503',
+                'type': 'RunService',
+            }
+            self.redis_client.hset(request_key, 'response.body', '')
+        elif command == 'webhookevent':
+            trigger_id = message.get('triggerId')
+            response = {
+                'sessionId': name,  # session/context
+                'requestKey': request_key,
+                'command': 'WebhookEventResponse',
+                'triggerId': trigger_id,
+                'bodyVariable': 'response.body',
+                'headers': [],
+                'statusCode': 503,
+            }
+            config = self.configs.get(trigger_id) or {}
+            playbook = self.playbook(name, config.get('tc_playbook_out_variables'))
+            playbook.create_string('response.body', '')
+        else:
+            return
+        self.increment_metric('errors')
+        self.publish(json.dumps(response))
+
     def server_topic(self, message):
         """Handle any event coming in on server_topic.
 
         Args:
             message (dict): The broker message.
         """
-        self.tcex.log.trace('message: {}'.format(message))
+        self.tcex.log.trace('message: %s', TruncatedArg(message))
         # parse the command type
         command = message.get('command')
 
@@ -852,7 +929,7 @@ class Services(object):
             response = {'command': 'Heartbeat', 'metric': self.metrics}
             self.publish(json.dumps(response))
             self.tcex.log.info('Heartbeat command sent')
-            self.tcex.log.debug('metrics: {}'.format(self.metrics))
+            self.tcex.log.debug('metrics: %s', LazyArg(lambda: self.metrics))
         elif command.lower() == 'loggingchange':
             # {"command": "LoggingChange", "level": "DEBUG"}
             level = message.get('level')
@@ -860,7 +937,10 @@ class Services(object):
             self.tcex.logger.update_handler_level(level)
         elif command.lower() == 'runservice':
             self.message_thread(
-                self.session_id(message.get('triggerId')), self.process_run_service, (message,)
+                self.session_id(message.get('triggerId')),
+                self.process_run_service,
+                (message,),
+                command='runservice',
             )
         elif command.lower() == 'shutdown':
             # {"command": "Shutdown", "reason": "Service disabled by user."}
@@ -868,11 +948,20 @@ class Services(object):
             self.process_shutdown(reason)
         elif command.lower() == 'webhookevent':
             self.message_thread(
-                self.session_id(message.get('triggerId')), self.process_webhook, (message,)
+                self.session_id(message.get('triggerId')),
+                self.process_webhook,
+                (message,),
+                command='webhookevent',
             )
         else:
-            # any other message is a config message
-            self.message_thread('process-config', self.process_config, (message,))
+            # any other message is a config message (never shed)
+            self.message_thread(
+                'process-config',
+                self.process_config,
+                (message,),
+                command='config',
+                overflow='block',
+            )
 
     @staticmethod
     def session_id(trigger_id=None):  # pylint: disable=unused-argument
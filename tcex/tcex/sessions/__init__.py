@@ -2,3 +2,4 @@
 """Session module for TcEx Framework"""
 # flake8: noqa
 from .tc_session import TcSession
+from .connection_pool import ConnectionPool
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""ThreatConnect asyncio Session"""
+import asyncio
+import contextvars
+import json
+import ssl
+import threading
+
+import aiohttp
+from yarl import URL
+
+from ..utils import Utils
+
+# the name of the thread that called run/run_all, tokens are looked up by the thread name
+_caller_thread_name = contextvars.ContextVar('caller_thread_name', default=None)
+
+
+class AsyncResponse(object):
+    """Response for an AsyncTcSession request with the commonly used Requests properties."""
+
+    def __init__(self, method, url, status_code, reason, headers, content):
+        """Initialize Class Properties."""
+        self.content = content
+        self.headers = headers
+        self.method = method
+        self.reason = reason
+        self.status_code = status_code
+        self.url = url
+
+    def json(self):
+        """Return the response content as JSON."""
+        return json.loads(self.text)
+
+    @property
+    def ok(self):
+        """Return True if the status code is less than 400."""
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        """Return the response content as text."""
+        return self.content.decode('utf-8', errors='replace')
+
+
+class AsyncTcSession(object):
+    """ThreatConnect REST API asyncio Session.
+
+    Requests are prepared (URL, headers, HMAC/Token authorization) by the TcSession and sent
+    using aiohttp with the same retry policy as TcSession.retry. A semaphore bounds the number
+    of concurrent requests.
+
+    Sync code can call coroutines using :py:meth:`run`, which executes them on a background
+    event loop. Requests sent by the coroutines are signed with the token of the thread that
+    called run (e.g., the service session).
+    """
+
+    def __init__(
+        self,
+        tcex,
+        max_concurrent=50,
+        retries=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 504),
+        timeout=300,
+    ):
+        """Initialize the Class properties.
+
+        Args:
+            tcex (obj): An instance of TcEx object.
+            max_concurrent (int, default:50): The max number of concurrent requests.
+            retries (int, default:3): The number of retries for failed requests.
+            backoff_factor (float, default:0.3): The backoff factor applied between retries.
+            status_forcelist (tuple, default:(500, 502, 504)): The status codes to retry.
+            timeout (int, default:300): The number of seconds before a request times out.
+        """
+        self.tcex = tcex
+        self.backoff_factor = backoff_factor
+        self.max_concurrent = max_concurrent
+        self.retries = retries
+        self.status_forcelist = status_forcelist
+        self.timeout = timeout
+
+        # properties
+        self._lock = threading.Lock()
+        self._loop = None
+        self._loop_thread = None
+        self._semaphores = {}
+        self._sessions = {}
+
+    def _client_session(self):
+        """Return the aiohttp ClientSession for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if loop not in self._sessions:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrent)
+            self._sessions[loop] = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent)
+        return self._sessions[loop], self._semaphores[loop]
+
+    @property
+    def _proxy(self):
+        """Return the proxy URL for ThreatConnect API requests."""
+        if self.tcex.session.args.tc_proxy_tc:
+            return self.tcex.proxies.get('https')
+        return None
+
+    @property
+    def _ssl_kwargs(self):
+        """Return the aiohttp ssl argument matching the TcSession verify setting."""
+        verify = self.tcex.session.verify
+        if verify is False:
+            return {'ssl': False}
+        if isinstance(verify, str):
+            # path to a CA bundle
+            return {'ssl': ssl.create_default_context(cafile=verify)}
+        return {}
+
+    async def _send(self, method, url, **kwargs):
+        """Prepare and send a single request."""
+        # prepare on each attempt so the HMAC timestamp/token is current
+        name = _caller_thread_name.get() or threading.current_thread().name
+        with Utils.thread_name(name):
+            prepared = self.tcex.session.prepare(method, url, **kwargs)
+        client_session, semaphore = self._client_session()
+        async with semaphore:
+            async with client_session.request(
+                prepared.method,
+                URL(prepared.url, encoded=True),
+                data=prepared.body,
+                # HmacAuth sets the Timestamp header as an int
+                headers={k: str(v) for k, v in prepared.headers.items()},
+                proxy=self._proxy,
+                **self._ssl_kwargs
+            ) as r:
+                content = await r.read()
+                return AsyncResponse(
+                    prepared.method, str(r.url), r.status, r.reason, r.headers, content
+                )
+
+    async def aclose(self):
+        """Close the aiohttp session for the running event loop."""
+        loop = asyncio.get_running_loop()
+        self._semaphores.pop(loop, None)
+        client_session = self._sessions.pop(loop, None)
+        if client_session is not None:
+            await client_session.close()
+
+    def close(self):
+        """Close the aiohttp session and stop the background event loop used by run."""
+        with self._lock:
+            loop = self._loop
+            self._loop = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        self._loop_thread.join()
+        loop.close()
+
+    @property
+    def loop(self):
+        """Return the background event loop used by run, starting it if required."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name='async-tc-session'
+                )
+                self._loop_thread.daemon = True
+                self._loop_thread.start()
+            return self._loop
+
+    async def request(self, method, url, **kwargs):
+        """Send a request to the ThreatConnect API.
+
+        Args:
+            method (str): The HTTP method for the request.
+            url (str): The API path or full URL for the request.
+            **kwargs: Additional keyword arguments for requests.Request (e.g., params, json, data,
+                headers).
+
+        Returns:
+            AsyncResponse: The response from the ThreatConnect API.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                r = await self._send(method, url, **kwargs)
+                if r.status_code not in self.status_forcelist or attempt == self.retries:
+                    return r
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.retries:
+                    raise
+                self.tcex.log.debug('Retrying request {} {} ({}).'.format(method, url, e))
+            await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+        return None
+
+    async def delete(self, url, **kwargs):
+        """Send a DELETE request."""
+        return await self.request('DELETE', url, **kwargs)
+
+    async def get(self, url, **kwargs):
+        """Send a GET request."""
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        """Send a POST request."""
+        return await self.request('POST', url, **kwargs)
+
+    async def put(self, url, **kwargs):
+        """Send a PUT request."""
+        return await self.request('PUT', url, **kwargs)
+
+    def run(self, coro, timeout=None):
+        """Run a coroutine on the background event loop and return the result.
+
+        Args:
+            coro (coroutine): The coroutine to run (e.g., ``ti.single(...)``).
+            timeout (int, optional): The number of seconds to wait for the result.
+
+        Returns:
+            any: The result of the coroutine.
+        """
+        name = threading.current_thread().name
+
+        async def caller():
+            """Run the coroutine with the caller thread name for token lookups."""
+            _caller_thread_name.set(name)
+            return await coro
+
+        return asyncio.run_coroutine_threadsafe(caller(), self.loop).result(timeout)
+
+    def run_all(self, coros, timeout=None):
+        """Run multiple coroutines concurrently on the background event loop.
+
+        Args:
+            coros (list): The coroutines to run.
+            timeout (int, optional): The number of seconds to wait for all results.
+
+        Returns:
+            list: The results in the order of the provided coroutines.
+        """
+
+        async def gather():
+            """Gather the results of all coroutines."""
+            return await asyncio.gather(*coros)
+
+        return self.run(gather(), timeout)
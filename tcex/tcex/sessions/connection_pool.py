@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""Shared HTTP Connection Pool for TcEx Sessions"""
+import threading
+import time
+
+from requests import adapters
+from urllib3 import PoolManager
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class PoolMetrics(object):
+    """Connection usage metrics for a single connection pool."""
+
+    def __init__(self):
+        """Initialize Class Properties."""
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.in_use = 0
+        self.new_connections = 0
+        self.wait_seconds = 0.0
+
+    def checkout(self, wait_seconds):
+        """Record a connection taken from the pool."""
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.wait_seconds += wait_seconds
+
+    def checkin(self):
+        """Record a connection returned to the pool."""
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+
+    def new_connection(self):
+        """Record a new connection created by the pool."""
+        with self._lock:
+            self.new_connections += 1
+
+    @property
+    def data(self):
+        """Return the metrics as a dict."""
+        with self._lock:
+            reused = max(self.checkouts - self.new_connections, 0)
+            return {
+                'checkouts': self.checkouts,
+                'in_use': self.in_use,
+                'new_connections': self.new_connections,
+                'reuse_rate': round(reused / float(self.checkouts), 3) if self.checkouts else 0.0,
+                'wait_seconds': round(self.wait_seconds, 3),
+            }
+
+
+class MetricsPoolMixin(object):
+    """Record connection usage on a urllib3 connection pool."""
+
+    def _get_conn(self, timeout=None):
+        """Get a connection from the pool recording the time waiting for the connection."""
+        start = time.time()
+        conn = super(MetricsPoolMixin, self)._get_conn(timeout=timeout)
+        self.metrics.checkout(time.time() - start)
+        return conn
+
+    def _new_conn(self):
+        """Create a new connection."""
+        self.metrics.new_connection()
+        return super(MetricsPoolMixin, self)._new_conn()
+
+    def _put_conn(self, conn):
+        """Return a connection to the pool."""
+        self.metrics.checkin()
+        return super(MetricsPoolMixin, self)._put_conn(conn)
+
+
+class MetricsHTTPConnectionPool(MetricsPoolMixin, HTTPConnectionPool):
+    """HTTP connection pool with connection usage metrics."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize Class Properties."""
+        self.metrics = PoolMetrics()
+        super(MetricsHTTPConnectionPool, self).__init__(*args, **kwargs)
+
+
+class MetricsHTTPSConnectionPool(MetricsPoolMixin, HTTPSConnectionPool):
+    """HTTPS connection pool with connection usage metrics."""
+
+    def __init__(self, *args, **kwargs):
+        """Initialize Class Properties."""
+        self.metrics = PoolMetrics()
+        super(MetricsHTTPSConnectionPool, self).__init__(*args, **kwargs)
+
+
+class ConnectionPool(object):
+    """Connection pools shared by all TcEx Requests Sessions.
+
+    Sessions mount a :py:class:`PooledHTTPAdapter` so that connections (and TLS sessions) are
+    reused across the TcSession, TcExRequest, and token renewal sessions instead of each
+    session keeping a separate pool.
+
+    .. code-block:: python
+
+        from tcex.sessions.connection_pool import ConnectionPool
+
+        ConnectionPool.shared().configure(maxsize=50, block=True)
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, num_pools=10, maxsize=20, block=False):
+        """Initialize Class Properties.
+
+        Args:
+            num_pools (int, default:10): The number of host pools to keep.
+            maxsize (int, default:20): The max number of connections to keep per host pool.
+            block (bool, default:False): If True requests wait for a free connection once
+                maxsize connections are in use, otherwise extra connections are created and
+                discarded after use.
+        """
+        self._lock = threading.Lock()
+        self._pool_manager = None
+        self._proxy_managers = {}
+        self.block = block
+        self.maxsize = maxsize
+        self.num_pools = num_pools
+
+    def adapter(self, max_retries=None):
+        """Return a Requests adapter using the shared pools.
+
+        Args:
+            max_retries (int|urllib3.util.retry.Retry, optional): The retry settings.
+
+        Returns:
+            PooledHTTPAdapter: The adapter to mount on a Session.
+        """
+        return PooledHTTPAdapter(self, max_retries=max_retries or adapters.DEFAULT_RETRIES)
+
+    def clear(self):
+        """Close all pooled connections."""
+        with self._lock:
+            if self._pool_manager is not None:
+                self._pool_manager.clear()
+            for proxy_manager in self._proxy_managers.values():
+                proxy_manager.clear()
+
+    def configure(self, num_pools=None, maxsize=None, block=None):
+        """Update the pool settings and close existing pools.
+
+        Args:
+            num_pools (int, optional): The number of host pools to keep.
+            maxsize (int, optional): The max number of connections to keep per host pool.
+            block (bool, optional): If True requests wait for a free connection.
+        """
+        self.clear()
+        with self._lock:
+            if num_pools is not None:
+                self.num_pools = num_pools
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if block is not None:
+                self.block = block
+            self._pool_manager = None
+            self._proxy_managers.clear()
+
+    @property
+    def metrics(self):
+        """Return the connection usage metrics for each active pool.
+
+        .. code-block:: javascript
+
+            {
+                "https://api.threatconnect.com:443": {
+                    "checkouts": 250,
+                    "in_use": 3,
+                    "new_connections": 12,
+                    "reuse_rate": 0.952,
+                    "wait_seconds": 0.041
+                }
+            }
+        """
+        pool_managers = [self.pool_manager] + list(self._proxy_managers.values())
+        metrics = {}
+        for pool_manager in pool_managers:
+            for key in pool_manager.pools.keys():
+                pool = pool_manager.pools.get(key)
+                if pool is None or not hasattr(pool, 'metrics'):
+                    continue
+                name = '{}://{}:{}'.format(pool.scheme, pool.host, pool.port)
+                metrics[name] = pool.metrics.data
+        return metrics
+
+    @property
+    def pool_manager(self):
+        """Return the shared urllib3 PoolManager."""
+        with self._lock:
+            if self._pool_manager is None:
+                self._pool_manager = PoolManager(
+                    num_pools=self.num_pools, maxsize=self.maxsize, block=self.block
+                )
+                self._pool_manager.pool_classes_by_scheme = {
+                    'http': MetricsHTTPConnectionPool,
+                    'https': MetricsHTTPSConnectionPool,
+                }
+            return self._pool_manager
+
+    @property
+    def proxy_managers(self):
+        """Return the shared proxy managers keyed by proxy URL."""
+        return self._proxy_managers
+
+    @classmethod
+    def shared(cls):
+        """Return the process wide ConnectionPool instance."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+
+class PooledHTTPAdapter(adapters.HTTPAdapter):
+    """Requests HTTPAdapter using a shared ConnectionPool."""
+
+    def __init__(self, connection_pool, **kwargs):
+        """Initialize Class Properties.
+
+        Args:
+            connection_pool (ConnectionPool): The shared connection pool.
+        """
+        self.connection_pool = connection_pool
+        super(PooledHTTPAdapter, self).__init__(**kwargs)
+        # proxy managers are shared by all adapters
+        self.proxy_manager = connection_pool.proxy_managers
+
+    def close(self):
+        """Leave the shared pools open when a Session is closed."""
+
+    def init_poolmanager(self, *args, **kwargs):  # pylint: disable=W0613
+        """Use the shared pool manager instead of creating one per adapter."""
+
+    @property
+    def poolmanager(self):
+        """Return the shared urllib3 PoolManager."""
+        return self.connection_pool.pool_manager
+
+    @poolmanager.setter
+    def poolmanager(self, pool_manager):
+        """Ignore assignment, the shared pool manager is always used."""
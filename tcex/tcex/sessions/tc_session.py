@@ -6,7 +6,9 @@ import hmac
 import time
 import urllib3
 from urllib3.util.retry import Retry
-from requests import adapters, auth, Session
+from requests import auth, Request, Session
+
+from .connection_pool import ConnectionPool
 
 # disable ssl warning message
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -110,14 +112,34 @@ class TcSession(Session):
         """Return true if the current App is a service App."""
         return self.token.token is not None and self.token.token_expires is not None
 
-    def request(self, method, url, **kwargs):  # pylint: disable=arguments-differ
-        """Override request method disabling verify on token renewal if disabled on session."""
+    def _api_url(self, url):
+        """Return the full URL for a ThreatConnect API path, configuring auth if required."""
         if self.auth is None:
             self._configure_auth()
 
         if not url.startswith('https'):
             url = '{}{}'.format(self.args.tc_api_path, url)
-        return super(TcSession, self).request(method, url, **kwargs)
+        return url
+
+    def prepare(self, method, url, **kwargs):
+        """Return a signed PreparedRequest for the ThreatConnect API.
+
+        The request is prepared with the session headers and authorization, but not sent (e.g.,
+        to send the request using another HTTP client).
+
+        Args:
+            method (str): The HTTP method for the request.
+            url (str): The API path or full URL for the request.
+            **kwargs: Additional keyword arguments for requests.Request (e.g., params, json).
+
+        Returns:
+            requests.PreparedRequest: The prepared request.
+        """
+        return self.prepare_request(Request(method, self._api_url(url), **kwargs))
+
+    def request(self, method, url, **kwargs):  # pylint: disable=arguments-differ
+        """Override request method disabling verify on token renewal if disabled on session."""
+        return super(TcSession, self).request(method, self._api_url(url), **kwargs)
 
     def retry(self, retries=3, backoff_factor=0.3, status_forcelist=(500, 502, 504)):
         """Add retry to Requests Session
@@ -131,5 +153,5 @@ class TcSession(Session):
             backoff_factor=backoff_factor,
             status_forcelist=status_forcelist,
         )
-        # mount all https requests
-        self.mount('https://', adapters.HTTPAdapter(max_retries=retries))
+        # mount all https requests using the shared connection pool
+        self.mount('https://', ConnectionPool.shared().adapter(max_retries=retries))
@@ -43,6 +43,8 @@ class TcEx(object):
             signal.signal(signal.SIGTERM, self._signal_handler)
 
         # Property defaults
+        self._async_session = None
+        self._batch_poller = None
         self._config = kwargs.get('config', {})
         self._default_args = None
         self._error_codes = None
@@ -193,6 +195,35 @@ class TcEx(object):
         """Argparser args Namespace."""
         return self.inputs.args()
 
+    @property
+    def async_session(self):
+        """Return an instance of AsyncTcSession configured for the ThreatConnect API.
+
+        The AsyncTcSession requires the aiohttp module.
+        """
+        if self._async_session is None:
+            try:
+                from .sessions.async_tc_session import AsyncTcSession
+
+                self._async_session = AsyncTcSession(self)
+            except ImportError as e:
+                self.handle_error(105, [e])
+        return self._async_session
+
+    @property
+    def batch_poller(self):
+        """Return instance of BatchPoller shared by all Batch instances.
+
+        The poller is started on first access and polls all outstanding batch jobs in a single
+        background thread.
+        """
+        if self._batch_poller is None:
+            from .batch.batch_poller import BatchPoller
+
+            self._batch_poller = BatchPoller(self)
+            self._batch_poller.start()
+        return self._batch_poller
+
     def batch(
         self,
         owner,
@@ -576,9 +607,11 @@ class TcEx(object):
 
         .. Note:: Playbook methods can be accessed using ``tcex.playbook.<method>``.
         """
-        from .playbooks import Playbooks
+        if self._playbook is None:
+            from .playbooks import Playbooks
 
-        return Playbooks(self)
+            self._playbook = Playbooks(self)
+        return self._playbook
 
     @property
     def proxies(self):
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 """TcEx Framework KeyValue Module"""
+import threading
 from builtins import str
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import Utils
 
 try:
     from urllib import quote  # Python 2
@@ -9,16 +14,100 @@ except ImportError:
 
 
 class TcExKeyValue(object):
-    """Update Redis via ThreatConnect API Wrapper"""
+    """Update Redis via ThreatConnect API Wrapper
+
+    Bulk reads and writes (read_many/create_many) are sent concurrently on a bounded pool of
+    threads shared by all instances (e.g., service session contexts). The size of the pool is
+    set with the **max_workers** class attribute (e.g., ``TcExKeyValue.max_workers = 20``), a
+    value of 1 or less sends the requests sequentially. Read data is cached (read-through), so
+    repeated reads of the same key only make a single API request. Writes invalidate the cached
+    data for the key.
+    """
+
+    # the max number of concurrent API requests for bulk reads and writes (all instances)
+    max_workers = 10
+
+    # the executor is shared by all instances
+    _executor = None
+    _executor_lock = threading.Lock()
+    _executor_workers = None
 
-    def __init__(self, tcex):
+    def __init__(self, tcex, cache_size=1000):
         """Initialize the Class properties.
 
         Args:
             tcex (object): Instance of TcEx.
-            rhash (string): The REDIS hash.
+            cache_size (int, default:1000): The max number of keys in the read cache.
         """
         self.tcex = tcex
+        self.cache_size = cache_size
+
+        # properties
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cache_get(self, key):
+        """Return the cached data for the key or None if the key is not cached."""
+        with self._cache_lock:
+            data = self._cache.get(key)
+            if data is not None:
+                self._cache.move_to_end(key)
+            return data
+
+    def _cache_pop(self, key):
+        """Remove the cached data for the key."""
+        with self._cache_lock:
+            self._cache.pop(key, None)
+
+    def _cache_set(self, key, data):
+        """Add the data for the key to the cache, removing the least recently used keys."""
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = data
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _map(self, func, items):
+        """Return the results of func for each item, calling func concurrently.
+
+        Args:
+            func (callable): The method to call for each item.
+            items (list): The items to pass to the method.
+
+        Returns:
+            (list): The results in the order of the items.
+        """
+        max_workers = TcExKeyValue.max_workers
+        if len(items) <= 1 or max_workers <= 1:
+            return [func(i) for i in items]
+
+        # run with the caller thread name for thread based lookups (e.g., service tokens)
+        name = threading.current_thread().name
+
+        def execute(item):
+            """Call func with the worker thread renamed to the caller thread name."""
+            with Utils.thread_name(name):
+                return func(item)
+
+        with TcExKeyValue._executor_lock:
+            if TcExKeyValue._executor_workers != max_workers:
+                if TcExKeyValue._executor is not None:
+                    # the pool size was changed, requests already submitted are completed
+                    TcExKeyValue._executor.shutdown(wait=False)
+                TcExKeyValue._executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix='tcex-kv'
+                )
+                TcExKeyValue._executor_workers = max_workers
+            # submitted under the lock, the executor can not be shut down while submitting
+            futures = [TcExKeyValue._executor.submit(execute, item) for item in items]
+        return [future.result() for future in futures]
+
+    def clear_cache(self):
+        """Clear the read cache."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def create(self, key, value):
         """Create key/value pair in remote KV store.
@@ -30,29 +119,63 @@ class TcExKeyValue(object):
         Returns:
             (string): The response from the API call.
         """
-        key = quote(key, safe='~')
+        self._cache_pop(key)
         headers = {'content-type': 'application/octet-stream'}
-        url = '/internal/playbooks/keyValue/{}'.format(key)
+        url = '/internal/playbooks/keyValue/{}'.format(quote(key, safe='~'))
         r = self.tcex.session.put(url, data=value, headers=headers)
+        # invalidate again in case of a concurrent read during the write
+        self._cache_pop(key)
         return r.content
 
+    def create_many(self, mapping):
+        """Create multiple key/value pairs in remote KV store.
+
+        .. Note:: The API does not support bulk writes, the keys are written concurrently.
+
+        Args:
+            mapping (dict): The keys and values to store in remote KV store.
+
+        Returns:
+            (list): The responses from the API calls.
+        """
+        return self._map(lambda item: self.create(*item), list(mapping.items()))
+
     # def delete(self, key):
     #     """Delete is not supported in API Wrapper"""
     #     return None
 
-    def read(self, key):
+    def read(self, key, decode=True):
         """Read data from remote KV store for the provided key.
 
         Args:
             key (string): The key to read in remote KV store.
+            decode (bool, default:True): If False the response data is returned as bytes.
 
         Returns:
             (any): The response data from the remote KV store.
         """
-        key = quote(key, safe='~')
-        url = '/internal/playbooks/keyValue/{}'.format(key)
-        r = self.tcex.session.get(url)
-        data = r.content
-        if data is not None and not isinstance(data, str):
-            data = str(r.content, 'utf-8')
+        data = self._cache_get(key)
+        if data is None:
+            url = '/internal/playbooks/keyValue/{}'.format(quote(key, safe='~'))
+            r = self.tcex.session.get(url)
+            data = r.content
+            if r.ok and data is not None:
+                self._cache_set(key, data)
+        if decode and data is not None and not isinstance(data, str):
+            data = str(data, 'utf-8')
         return data
+
+    def read_many(self, keys):
+        """Read data from remote KV store for the provided keys.
+
+        .. Note:: The API does not support bulk reads, the keys are read concurrently.
+
+        Args:
+            keys (list): The keys to read in remote KV store.
+
+        Returns:
+            (list): The response data from the remote KV store in the order of the keys.
+        """
+        unique_keys = list(OrderedDict.fromkeys(keys))
+        data = dict(zip(unique_keys, self._map(self.read, unique_keys)))
+        return [data.get(key) for key in keys]
@@ -104,6 +104,10 @@ class TcExRedis(object):
         """
         return self.client.hset(self.key, field, value)
 
+    def create_many(self, mapping):
+        """Alias for hmset method."""
+        return self.hmset(mapping)
+
     def delete(self, field):
         """Alias for hdel method.
 
@@ -126,18 +130,19 @@ class TcExRedis(object):
         """
         return self.client.hdel(self.key, field)
 
-    def hget(self, field):
+    def hget(self, field, decode=True):
         """Read data from Redis for the provided key.
 
         Args:
             field (str): The field name (key) for the kv pair in Redis.
+            decode (bool, default:True): If False the response data is returned as bytes.
 
         Returns:
             str: The response data from Redis.
         """
         data = self.client.hget(self.key, field)
-        if data is not None and not isinstance(data, str):
-            data = str(self.client.hget(self.key, field), 'utf-8')
+        if decode and data is not None and not isinstance(data, str):
+            data = str(data, 'utf-8')
         return data
 
     def hgetall(self):
@@ -148,6 +153,36 @@ class TcExRedis(object):
         """
         return self.client.hgetall(self.key)
 
+    def hmget(self, fields):
+        """Read data from Redis for multiple fields of the current key in a single request.
+
+        Args:
+            fields (list): The field names (keys) for the kv pairs in Redis.
+
+        Returns:
+            list: The response data from Redis in the order of the fields.
+        """
+        data = []
+        for d in self.client.hmget(self.key, fields):
+            if d is not None and not isinstance(d, str):
+                d = str(d, 'utf-8')
+            data.append(d)
+        return data
+
+    def hmset(self, mapping):
+        """Create multiple key/value pairs in Redis in a single request (pipeline).
+
+        Args:
+            mapping (dict): The field names (keys) and values for the kv pairs in Redis.
+
+        Returns:
+            list: The responses from Redis.
+        """
+        pipe = self.client.pipeline(transaction=False)
+        for field, value in mapping.items():
+            pipe.hset(self.key, field, value)
+        return pipe.execute()
+
     def hset(self, field, value):
         """Create key/value pair in Redis.
 
@@ -160,9 +195,13 @@ class TcExRedis(object):
         """
         return self.client.hset(self.key, field, value)
 
-    def read(self, field):
+    def read(self, field, decode=True):
         """Alias for hget method."""
-        return self.hget(field)
+        return self.hget(field, decode)
+
+    def read_many(self, fields):
+        """Alias for hmget method."""
+        return self.hmget(fields)
 
     def rpush(self, key, values):
         """Append/Push values to the end of list ``name``.
@@ -36,7 +36,9 @@ class Tag(object):
         """
         return True
 
-    def groups(self, group_type=None, filters=None, owner=None, params=None):
+    def groups(
+        self, group_type=None, filters=None, owner=None, params=None, prefetch=None, ordered=True
+    ):
         """
         Gets all groups from a tag.
 
@@ -44,14 +46,30 @@ class Tag(object):
             filters:
             params:
             group_type:
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
         """
         group = self._tcex.ti.group(group_type)
         for g in self.tc_requests.groups_from_tag(
-            group, self.name, filters=filters, owner=owner, params=params
+            group,
+            self.name,
+            filters=filters,
+            owner=owner,
+            params=params,
+            prefetch=prefetch,
+            ordered=ordered,
         ):
             yield g
 
-    def indicators(self, indicator_type=None, filters=None, owner=None, params=None):
+    def indicators(
+        self,
+        indicator_type=None,
+        filters=None,
+        owner=None,
+        params=None,
+        prefetch=None,
+        ordered=True,
+    ):
         """
         Gets all indicators from a tag.
 
@@ -59,20 +77,40 @@ class Tag(object):
             params:
             filters:
             indicator_type:
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
         """
         indicator = self._tcex.ti.indicator(indicator_type)
         for i in self.tc_requests.indicators_from_tag(
-            indicator, self.name, filters=filters, owner=owner, params=params
+            indicator,
+            self.name,
+            filters=filters,
+            owner=owner,
+            params=params,
+            prefetch=prefetch,
+            ordered=ordered,
         ):
             yield i
 
-    def victims(self, filters=None, owner=None, params=None):
+    def victims(self, filters=None, owner=None, params=None, prefetch=None, ordered=True):
         """
         Gets all victims from a tag.
+
+        Args:
+            filters:
+            params:
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
         """
         victim = self._tcex.ti.victim(None)
         for v in self.tc_requests.victims_from_tag(
-            victim, self.name, filters=filters, owner=owner, params=params
+            victim,
+            self.name,
+            filters=filters,
+            owner=owner,
+            params=params,
+            prefetch=prefetch,
+            ordered=ordered,
         ):
             yield v
 
@@ -251,13 +251,15 @@ class TIMappings(object):
             params=params,
         )
 
-    def many(self, filters=None, params=None):
+    def many(self, filters=None, params=None, prefetch=None, ordered=True):
         """
         Gets the Indicator/Group/Victim or Security Labels
         Args:
             filters:
             owner:
             params: parameters to pass in to get the objects
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
 
         Yields: A Indicator/Group/Victim json
 
@@ -269,6 +271,8 @@ class TIMappings(object):
             owner=self.owner,
             filters=filters,
             params=params,
+            prefetch=prefetch,
+            ordered=ordered,
         ):
             yield i
 
@@ -295,13 +299,15 @@ class TIMappings(object):
             params=params,
         )
 
-    def tags(self, filters=None, params=None):
+    def tags(self, filters=None, params=None, prefetch=None, ordered=True):
         """
          Gets the tags from a Indicator/Group/Victim/Security Labels
          Args:
              filters:
              owner:
              params: parameters to pass in to get the objects
+             prefetch (int, optional): The number of pages to retrieve concurrently.
+             ordered (bool, default:True): If False results are yielded as pages complete.
 
          Yields: A tag json
 
@@ -317,6 +323,8 @@ class TIMappings(object):
             owner=self.owner,
             filters=filters,
             params=params,
+            prefetch=prefetch,
+            ordered=ordered,
         ):
             yield t
 
@@ -462,10 +470,15 @@ class TIMappings(object):
          """
         return self.label(label, action='DELETE')
 
-    def indicator_associations(self, params=None):
+    def indicator_associations(self, params=None, prefetch=None, ordered=True):
         """
          Gets the indicator association from a Indicator/Group/Victim
 
+         Args:
+             params: parameters to pass in to get the objects
+             prefetch (int, optional): The number of pages to retrieve concurrently.
+             ordered (bool, default:True): If False results are yielded as pages complete.
+
          Yields: Indicator Association
 
          """
@@ -476,14 +489,25 @@ class TIMappings(object):
             params = {}
 
         for ia in self.tc_requests.indicator_associations(
-            self.api_type, self.api_branch, self.unique_id, owner=self.owner, params=params
+            self.api_type,
+            self.api_branch,
+            self.unique_id,
+            owner=self.owner,
+            params=params,
+            prefetch=prefetch,
+            ordered=ordered,
         ):
             yield ia
 
-    def group_associations(self, params=None):
+    def group_associations(self, params=None, prefetch=None, ordered=True):
         """
          Gets the group association from a Indicator/Group/Victim
 
+         Args:
+             params: parameters to pass in to get the objects
+             prefetch (int, optional): The number of pages to retrieve concurrently.
+             ordered (bool, default:True): If False results are yielded as pages complete.
+
          Yields: Group Association
 
          """
@@ -494,7 +518,13 @@ class TIMappings(object):
             self._tcex.handle_error(910, [self.type])
 
         for ga in self.tc_requests.group_associations(
-            self.api_type, self.api_branch, self.unique_id, owner=self.owner, params=params
+            self.api_type,
+            self.api_branch,
+            self.unique_id,
+            owner=self.owner,
+            params=params,
+            prefetch=prefetch,
+            ordered=ordered,
         ):
             yield ga
 
@@ -4,9 +4,11 @@ from builtins import str
 import json
 from base64 import b64encode
 
-from requests import adapters, packages, Session
+from requests import packages, Session
 from requests.packages.urllib3.util.retry import Retry  # pylint: disable=E0401
 
+from ..sessions.connection_pool import ConnectionPool
+
 packages.urllib3.disable_warnings()  # pylint: disable=E1101
 
 
@@ -23,8 +25,8 @@ def session_retry(retries=3, backoff_factor=0.3, status_forcelist=(500, 502, 504
         backoff_factor=backoff_factor,
         status_forcelist=status_forcelist,
     )
-    # mount all https requests
-    session.mount('https://', adapters.HTTPAdapter(max_retries=retries))
+    # mount all https requests using the shared connection pool
+    session.mount('https://', ConnectionPool.shared().adapter(max_retries=retries))
     return session
 
 
@@ -5,6 +5,12 @@ try:
 except ImportError:
     from urllib.parse import quote  # Python
 import hashlib
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+from ..utils import Utils
 
 # import local modules for dynamic reference
 module = __import__(__name__)
@@ -22,6 +28,23 @@ class TiTcRequest:
         self.tcex = tcex
         self.result_limit = 10000
 
+        # properties
+        self._async_requests = None
+
+    @property
+    def async_requests(self):
+        """Return the AsyncTiTcRequest used by the concurrent methods (requires aiohttp).
+
+        The concurrent methods (e.g., single_concurrent) send the requests using the
+        AsyncTcSession and return when all requests have completed, so sync code can send many
+        requests concurrently without using asyncio.
+        """
+        if self._async_requests is None:
+            from .tcex_ti_tc_request_async import AsyncTiTcRequest
+
+            self._async_requests = AsyncTiTcRequest(self.tcex)
+        return self._async_requests
+
     def create(self, main_type, sub_type, data, owner):
         """
 
@@ -45,6 +68,24 @@ class TiTcRequest:
 
         return self.tcex.session.post(url, json=data, params={'owner': owner})
 
+    def create_concurrent(self, main_type, sub_type, data, owner, timeout=None):
+        """Create multiple Indicators/Groups/Victims concurrently.
+
+        Args:
+            main_type (str): The main type (e.g., indicators).
+            sub_type (str): The sub type (e.g., addresses).
+            data (list): The entity data of each entity.
+            owner (str): The ThreatConnect owner name.
+            timeout (int, optional): The number of seconds to wait for all responses.
+
+        Returns:
+            list: The AsyncResponse for each entity in the order of the data.
+        """
+        ti = self.async_requests
+        return self.tcex.async_session.run_all(
+            [ti.create(main_type, sub_type, d, owner) for d in data], timeout
+        )
+
     def delete(self, main_type, sub_type, unique_id, owner=None):
         """
         Deletes the Indicator/Group/Victim or Security Label
@@ -82,6 +123,24 @@ class TiTcRequest:
 
         return self.tcex.session.put(url, params=params, json=data)
 
+    def update_concurrent(self, main_type, sub_type, data, owner=None, timeout=None):
+        """Update multiple Indicators/Groups/Victims concurrently.
+
+        Args:
+            main_type (str): The main type (e.g., indicators).
+            sub_type (str): The sub type (e.g., addresses).
+            data (dict): The entity data keyed by the unique id of each entity.
+            owner (str, optional): The ThreatConnect owner name.
+            timeout (int, optional): The number of seconds to wait for all responses.
+
+        Returns:
+            list: The AsyncResponse for each entity in the order of the data.
+        """
+        ti = self.async_requests
+        return self.tcex.async_session.run_all(
+            [ti.update(main_type, sub_type, u, d, owner=owner) for u, d in data.items()], timeout
+        )
+
     def mine(self):
         """
         Get My owners
@@ -118,7 +177,43 @@ class TiTcRequest:
 
         return self.tcex.session.get(url, params=params)
 
-    def many(self, main_type, sub_type, api_entity, owner=None, filters=None, params=None):
+    def single_concurrent(
+        self, main_type, sub_type, unique_ids, owner=None, filters=None, params=None, timeout=None
+    ):
+        """Retrieve multiple Indicators/Groups/Victims concurrently.
+
+        Args:
+            main_type (str): The main type (e.g., indicators).
+            sub_type (str): The sub type (e.g., addresses).
+            unique_ids (list): The unique id of each entity.
+            owner (str, optional): The ThreatConnect owner name.
+            filters (Filters, optional): The filters for the request.
+            params (dict, optional): The query params for the request.
+            timeout (int, optional): The number of seconds to wait for all responses.
+
+        Returns:
+            list: The AsyncResponse for each entity in the order of the unique ids.
+        """
+        ti = self.async_requests
+        return self.tcex.async_session.run_all(
+            [
+                ti.single(main_type, sub_type, u, owner=owner, filters=filters, params=params)
+                for u in unique_ids
+            ],
+            timeout,
+        )
+
+    def many(
+        self,
+        main_type,
+        sub_type,
+        api_entity,
+        owner=None,
+        filters=None,
+        params=None,
+        prefetch=None,
+        ordered=True,
+    ):
         """
 
         Args:
@@ -128,6 +223,8 @@ class TiTcRequest:
             filters:
             owner:
             params:
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
 
         Returns:
 
@@ -143,30 +240,31 @@ class TiTcRequest:
         else:
             url = '/v2/{}/{}'.format(main_type, sub_type)
 
-        for i in self._iterate(url, params, api_entity):
+        for i in self._iterate(url, params, api_entity, prefetch, ordered):
             yield i
 
-    def _iterate(self, url, params, api_entity):
+    def _iterate(self, url, params, api_entity, prefetch=None, ordered=True):
         """
         Args:
             url:
             params:
             api_entity:
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
 
         Return:
         """
         params['resultLimit'] = self.result_limit
+        if prefetch:
+            for result in self._iterate_prefetch(url, params, api_entity, prefetch, ordered):
+                yield result
+            return
+
         should_iterate = True
         result_start = 0
         while should_iterate:
             # params['resultOffset'] = result_offset
-            params['resultStart'] = result_start
-            r = self.tcex.session.get(url, params=params)
-            if not self.success(r):
-                err = r.text or r.reason
-                self.tcex.handle_error(950, [r.status_code, err, r.url])
-
-            data = r.json().get('data', {}).get(api_entity, [])
+            data = self._page(url, params, result_start).get(api_entity, [])
 
             if len(data) < self.result_limit:
                 should_iterate = False
@@ -175,6 +273,98 @@ class TiTcRequest:
             for result in data:
                 yield result
 
+    def _iterate_prefetch(self, url, params, api_entity, prefetch, ordered=True):
+        """Yield results retrieving up to **prefetch** pages concurrently.
+
+        The resultCount of the first page is used to determine the remaining pages. At most
+        **prefetch** pages are retrieved ahead of the page being yielded.
+
+        Args:
+            url (str): The API path.
+            params (dict): The query params for the request.
+            api_entity (str): The data key of the results.
+            prefetch (int): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
+
+        Yields:
+            dict: The result data.
+        """
+        data = self._page(url, params, 0)
+        results = data.get(api_entity, [])
+        for result in results:
+            yield result
+
+        result_count = data.get('resultCount')
+        if len(results) < self.result_limit:
+            return
+        if result_count is None:
+            # the resultCount is not available, retrieve the remaining pages sequentially
+            result_start = self.result_limit
+            while True:
+                results = self._page(url, params, result_start).get(api_entity, [])
+                for result in results:
+                    yield result
+                if len(results) < self.result_limit:
+                    return
+                result_start += self.result_limit
+
+        # run with the caller thread name for thread based lookups (e.g., service tokens)
+        name = threading.current_thread().name
+
+        def page(result_start):
+            """Return a single page with the pool thread renamed to the caller thread name."""
+            with Utils.thread_name(name):
+                return self._page(url, params, result_start)
+
+        result_starts = iter(range(self.result_limit, result_count, self.result_limit))
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        futures = deque(
+            [
+                executor.submit(page, result_start)
+                for result_start in islice(result_starts, prefetch)
+            ]
+        )
+        try:
+            while futures:
+                if ordered:
+                    future = futures.popleft()
+                else:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    futures.remove(future)
+                results = future.result().get(api_entity, [])
+
+                # keep up to prefetch pages in flight
+                for result_start in islice(result_starts, 1):
+                    futures.append(executor.submit(page, result_start))
+
+                for result in results:
+                    yield result
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _page(self, url, params, result_start):
+        """Return the data of a single page of results.
+
+        Args:
+            url (str): The API path.
+            params (dict): The query params for the request.
+            result_start (int): The resultStart of the page.
+
+        Returns:
+            dict: The response data.
+        """
+        params = dict(params)
+        params['resultStart'] = result_start
+        r = self.tcex.session.get(url, params=params)
+        if not self.success(r):
+            err = r.text or r.reason
+            self.tcex.handle_error(950, [r.status_code, err, r.url])
+
+        return r.json().get('data', {})
+
     def request(
         self, main_type, sub_type, result_limit, result_start, owner=None, filters=None, params=None
     ):
@@ -511,7 +701,9 @@ class TiTcRequest:
         for result in data:
             yield result
 
-    def pivot_from_tag(self, target, tag_name, filters=None, owner=None, params=None):
+    def pivot_from_tag(
+        self, target, tag_name, filters=None, owner=None, params=None, prefetch=None, ordered=True
+    ):
         """
 
         Args:
@@ -520,6 +712,8 @@ class TiTcRequest:
             target:
             tag_name:
             params:
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
 
         Return:
 
@@ -538,10 +732,12 @@ class TiTcRequest:
             url = '/v2/tags/{}/{}/{}'.format(tag_name, api_type, sub_type)
         else:
             url = '/v2/tags/{}/{}/'.format(tag_name, api_type)
-        for i in self._iterate(url, params, api_entity):
+        for i in self._iterate(url, params, api_entity, prefetch, ordered):
             yield i
 
-    def groups_from_tag(self, group, tag_name, filters=None, owner=None, params=None):
+    def groups_from_tag(
+        self, group, tag_name, filters=None, owner=None, params=None, prefetch=None, ordered=True
+    ):
         """
 
         Args:
@@ -550,14 +746,33 @@ class TiTcRequest:
             tag_name:
             filters:
             params:
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
 
         Return:
 
         """
-        for t in self.pivot_from_tag(group, tag_name, filters=filters, owner=owner, params=params):
+        for t in self.pivot_from_tag(
+            group,
+            tag_name,
+            filters=filters,
+            owner=owner,
+            params=params,
+            prefetch=prefetch,
+            ordered=ordered,
+        ):
             yield t
 
-    def indicators_from_tag(self, indicator, tag_name, filters=None, owner=None, params=None):
+    def indicators_from_tag(
+        self,
+        indicator,
+        tag_name,
+        filters=None,
+        owner=None,
+        params=None,
+        prefetch=None,
+        ordered=True,
+    ):
         """
                 Args:
                     owner:
@@ -565,6 +780,8 @@ class TiTcRequest:
                     tag_name:
                     filters:
                     params:
+                    prefetch (int, optional): The number of pages to retrieve concurrently.
+                    ordered (bool, default:True): If False results are yielded as pages complete.
 
                 Return:
 
@@ -572,11 +789,19 @@ class TiTcRequest:
         params = params or {}
 
         for t in self.pivot_from_tag(
-            indicator, tag_name, filters=filters, owner=owner, params=params
+            indicator,
+            tag_name,
+            filters=filters,
+            owner=owner,
+            params=params,
+            prefetch=prefetch,
+            ordered=ordered,
         ):
             yield t
 
-    def victims_from_tag(self, victim, tag_name, filters=None, owner=None, params=None):
+    def victims_from_tag(
+        self, victim, tag_name, filters=None, owner=None, params=None, prefetch=None, ordered=True
+    ):
         """
 
         Args:
@@ -585,14 +810,26 @@ class TiTcRequest:
             tag_name:
             filters:
             params:
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
 
         Return:
 
         """
-        for t in self.pivot_from_tag(victim, tag_name, filters=filters, owner=owner, params=params):
+        for t in self.pivot_from_tag(
+            victim,
+            tag_name,
+            filters=filters,
+            owner=owner,
+            params=params,
+            prefetch=prefetch,
+            ordered=ordered,
+        ):
             yield t
 
-    def indicator_associations(self, main_type, sub_type, unique_id, owner=None, params=None):
+    def indicator_associations(
+        self, main_type, sub_type, unique_id, owner=None, params=None, prefetch=None, ordered=True
+    ):
         """
 
         Args:
@@ -601,6 +838,8 @@ class TiTcRequest:
             sub_type:
             unique_id:
             params:
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
 
         Return:
 
@@ -614,10 +853,12 @@ class TiTcRequest:
         else:
             url = '/v2/{}/{}/{}/indicators'.format(main_type, sub_type, unique_id)
 
-        for a in self._iterate(url, params, 'indicator'):
+        for a in self._iterate(url, params, 'indicator', prefetch, ordered):
             yield a
 
-    def group_associations(self, main_type, sub_type, unique_id, owner=None, params=None):
+    def group_associations(
+        self, main_type, sub_type, unique_id, owner=None, params=None, prefetch=None, ordered=True
+    ):
         """
 
         Args:
@@ -626,6 +867,8 @@ class TiTcRequest:
             sub_type:
             unique_id:
             params:
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
 
         Return:
 
@@ -639,7 +882,7 @@ class TiTcRequest:
         else:
             url = '/v2/{}/{}/{}/groups'.format(main_type, sub_type, unique_id)
 
-        for ga in self._iterate(url, params, 'group'):
+        for ga in self._iterate(url, params, 'group', prefetch, ordered):
             yield ga
 
     def victim_asset_associations(
@@ -1691,7 +1934,17 @@ class TiTcRequest:
 
         return self.tag(main_type, sub_type, unique_id, tag, owner=owner, params=params)
 
-    def tags(self, main_type, sub_type, unique_id, owner=None, filters=None, params=None):
+    def tags(
+        self,
+        main_type,
+        sub_type,
+        unique_id,
+        owner=None,
+        filters=None,
+        params=None,
+        prefetch=None,
+        ordered=True,
+    ):
         """
 
         Args:
@@ -1701,6 +1954,8 @@ class TiTcRequest:
             owner:
             filters:
             params:
+            prefetch (int, optional): The number of pages to retrieve concurrently.
+            ordered (bool, default:True): If False results are yielded as pages complete.
 
         Return:
 
@@ -1716,7 +1971,7 @@ class TiTcRequest:
         else:
             url = '/v2/{}/{}/{}/tags'.format(main_type, sub_type, unique_id)
 
-        for t in self._iterate(url, params, 'tag'):
+        for t in self._iterate(url, params, 'tag', prefetch, ordered):
             yield t
 
     def labels(self, main_type, sub_type, unique_id, owner=None, filters=None, params=None):
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""ThreatConnect Threat Intelligence asyncio Module"""
+
+
+class AsyncTiTcRequest:
+    """Awaitable equivalents of the common TiTcRequest API calls.
+
+    Requests are sent using the AsyncTcSession (``tcex.async_session``), which bounds the
+    number of concurrent requests.
+
+    .. code-block:: python
+
+        ti = AsyncTiTcRequest(tcex)
+
+        # async code
+        results = await asyncio.gather(
+            *[ti.single('indicators', 'addresses', ip) for ip in ips]
+        )
+
+        # sync code
+        results = tcex.async_session.run_all(
+            [ti.single('indicators', 'addresses', ip) for ip in ips]
+        )
+    """
+
+    def __init__(self, tcex, session=None):
+        """Initialize Class Properties.
+
+        Args:
+            tcex (obj): An instance of TcEx object.
+            session (AsyncTcSession, optional): The session for requests, defaults to
+                tcex.async_session.
+        """
+        self.tcex = tcex
+        self.result_limit = 10000
+        self.session = session or tcex.async_session
+
+    @staticmethod
+    def _url(main_type, sub_type, unique_id=None):
+        """Return the API path for the provided types."""
+        parts = [main_type, sub_type, unique_id]
+        return '/v2/{}'.format('/'.join([str(p) for p in parts if p is not None and p != '']))
+
+    async def create(self, main_type, sub_type, data, owner):
+        """Create an Indicator/Group/Victim.
+
+        Args:
+            main_type (str): The main type (e.g., indicators).
+            sub_type (str): The sub type (e.g., addresses).
+            data (dict): The entity data.
+            owner (str): The ThreatConnect owner name.
+
+        Returns:
+            AsyncResponse: The response from the ThreatConnect API.
+        """
+        return await self.session.post(
+            self._url(main_type, sub_type), json=data, params={'owner': owner}
+        )
+
+    async def delete(self, main_type, sub_type, unique_id, owner=None):
+        """Delete an Indicator/Group/Victim.
+
+        Args:
+            main_type (str): The main type (e.g., indicators).
+            sub_type (str): The sub type (e.g., addresses).
+            unique_id (str): The unique id of the entity.
+            owner (str, optional): The ThreatConnect owner name.
+
+        Returns:
+            AsyncResponse: The response from the ThreatConnect API.
+        """
+        params = {'owner': owner} if owner else {}
+        return await self.session.delete(self._url(main_type, sub_type, unique_id), params=params)
+
+    async def many(self, main_type, sub_type, api_entity, owner=None, filters=None, params=None):
+        """Yield all entities of the provided type, retrieving pages of result_limit entities.
+
+        Args:
+            main_type (str): The main type (e.g., indicators).
+            sub_type (str): The sub type (e.g., addresses).
+            api_entity (str): The data key of the entities in the response (e.g., address).
+            owner (str, optional): The ThreatConnect owner name.
+            filters (Filters, optional): The filters for the request.
+            params (dict, optional): The query params for the request.
+
+        Yields:
+            dict: The entity data.
+        """
+        params = dict(params or {})
+        if owner:
+            params['owner'] = owner
+        if filters and filters.filters:
+            params['filters'] = filters.filters_string
+        params['resultLimit'] = self.result_limit
+
+        url = self._url(main_type, sub_type)
+        result_start = 0
+        while True:
+            params['resultStart'] = result_start
+            r = await self.session.get(url, params=dict(params))
+            if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
+                err = r.text or r.reason
+                self.tcex.handle_error(950, [r.status_code, err, r.url])
+
+            data = r.json().get('data', {}).get(api_entity, [])
+            for result in data:
+                yield result
+
+            if len(data) < self.result_limit:
+                break
+            result_start += self.result_limit
+
+    async def single(self, main_type, sub_type, unique_id, owner=None, filters=None, params=None):
+        """Retrieve a single Indicator/Group/Victim.
+
+        Args:
+            main_type (str): The main type (e.g., indicators).
+            sub_type (str): The sub type (e.g., addresses).
+            unique_id (str): The unique id of the entity.
+            owner (str, optional): The ThreatConnect owner name.
+            filters (Filters, optional): The filters for the request.
+            params (dict, optional): The query params for the request.
+
+        Returns:
+            AsyncResponse: The response from the ThreatConnect API.
+        """
+        params = dict(params or {})
+        if owner:
+            params['owner'] = owner
+        if filters and filters.filters:
+            params['filters'] = filters.filters_string
+        return await self.session.get(self._url(main_type, sub_type, unique_id), params=params)
+
+    async def update(self, main_type, sub_type, unique_id, data, owner=None):
+        """Update an Indicator/Group/Victim.
+
+        Args:
+            main_type (str): The main type (e.g., indicators).
+            sub_type (str): The sub type (e.g., addresses).
+            unique_id (str): The unique id of the entity.
+            data (dict): The entity data.
+            owner (str, optional): The ThreatConnect owner name.
+
+        Returns:
+            AsyncResponse: The response from the ThreatConnect API.
+        """
+        params = {'owner': owner} if owner else {}
+        return await self.session.put(
+            self._url(main_type, sub_type, unique_id), params=params, json=data
+        )
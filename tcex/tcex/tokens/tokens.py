@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 """TcEx Framework Service module"""
+import heapq
+import itertools
 import threading
 import time
 
 # from requests import exceptions, get
 from requests import exceptions, Session
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ..sessions.connection_pool import ConnectionPool
+
 
 def retry_session(retries=3, backoff_factor=0.8, status_forcelist=(500, 502, 504)):
     """Add retry to Requests Session
@@ -22,8 +25,8 @@ def retry_session(retries=3, backoff_factor=0.8, status_forcelist=(500, 502, 504
         backoff_factor=backoff_factor,
         status_forcelist=status_forcelist,
     )
-    # mount all https requests
-    session.mount('https://', HTTPAdapter(max_retries=retries))
+    # mount all https requests using the shared connection pool
+    session.mount('https://', ConnectionPool.shared().adapter(max_retries=retries))
     return session
 
 
@@ -38,6 +41,7 @@ class Tokens(object):
 
     def __init__(self, token_url, sleep_interval, verify, logger):
         """Initialize the Class properties."""
+        # lock for updates to token_map/thread_map (reads use the current map without locking)
         self.lock = threading.Lock()
         # tcex logger
         self.log = logger
@@ -47,8 +51,10 @@ class Tokens(object):
         self.shutdown = False
         # token monitor sleep interval
         self.sleep_interval = sleep_interval
-        # token map for storing keys -> tokens -> threads
+        # token map for storing keys -> tokens -> threads (replaced, not modified, on update)
         self.token_map = {}
+        # reverse index for storing thread names -> keys (replaced, not modified, on update)
+        self.thread_map = {}
         # base url for token renewal
         self.token_url = token_url
         # amount of seconds to pad before token renewal
@@ -56,6 +62,12 @@ class Tokens(object):
         # ssl verification setting for TC token renewal
         self.verify = verify
 
+        # min-heap of (token_expires, sequence, key) for token renewal
+        self._expirations = []
+        self._expirations_sequence = itertools.count()
+        # event to wake the token renewal monitor when a token is registered
+        self._renewal_event = threading.Event()
+
         # start token renewal process
         self.token_renewal()
 
@@ -63,21 +75,62 @@ class Tokens(object):
     def key(self):
         """Return the current key"""
         key = 'MainThread'  # default Python parent thread name
-        # self.log.trace('in key - thread_name: {}'.format(self.thread_name))
-        if self.thread_name in self.token_map:
+        thread_name = self.thread_name
+        # self.log.trace('in key - thread_name: {}'.format(thread_name))
+        if thread_name in self.token_map:
             # for Job, Playbook, and ApiService Apps the key is the thread name.
-            key = self.thread_name
-        else:
-            # for Trigger and Webhook Apps the key is ConfigId. find ConfigId using array of
-            # registered thread names.
-            for k, d in self.token_map.items():
-                if self.thread_name in d.get('thread_names', []):
-                    key = k
-                    break
-            else:  # pragma: no cover
-                self.log.trace('Thread name not found, defaulting to {}'.format(key))
+            key = thread_name
+        elif thread_name in self.thread_map:
+            # for Trigger and Webhook Apps the key is ConfigId registered for the thread name.
+            key = self.thread_map[thread_name]
+        else:  # pragma: no cover
+            self.log.trace('Thread name not found, defaulting to %s', key)
         return key
 
+    def _push_expiration(self, key, expires):
+        """Add a token expiration to the renewal heap and wake the renewal monitor."""
+        with self.lock:
+            heapq.heappush(
+                self._expirations, (int(expires), next(self._expirations_sequence), key)
+            )
+        self._renewal_event.set()
+
+    def _remove_token(self, key):
+        """Replace the token_map/thread_map with copies that do not contain the key.
+
+        Args:
+            key (str): The key used to identify a token.
+
+        Returns:
+            bool: True if the token was removed.
+        """
+        with self.lock:
+            if key not in self.token_map:
+                return False
+            token_map = dict(self.token_map)
+            token_data = token_map.pop(key)
+            thread_map = dict(self.thread_map)
+            for thread_name in token_data.get('thread_names', []):
+                if thread_map.get(thread_name) == key:
+                    del thread_map[thread_name]
+            self.token_map = token_map
+            self.thread_map = thread_map
+        return True
+
+    def _update_token(self, key, **kwargs):
+        """Replace the token_map with a copy containing the updated token data.
+
+        Args:
+            key (str): The key used to identify a token.
+            **kwargs: The token data to update (e.g., token, token_expires).
+        """
+        with self.lock:
+            token_map = dict(self.token_map)
+            token_data = dict(token_map.get(key, {}))
+            token_data.update(kwargs)
+            token_map[key] = token_data
+            self.token_map = token_map
+
     @staticmethod
     def printable_token(token):
         """Return a printable token
@@ -101,7 +154,15 @@ class Tokens(object):
             key (str): The key to use to identify a token.
             thread_name (str): The thread to register to a key.
         """
-        self.token_map.setdefault(key, {}).setdefault('thread_names', []).append(thread_name)
+        with self.lock:
+            token_map = dict(self.token_map)
+            token_data = dict(token_map.get(key, {}))
+            token_data['thread_names'] = token_data.get('thread_names', []) + [thread_name]
+            token_map[key] = token_data
+            thread_map = dict(self.thread_map)
+            thread_map[thread_name] = key
+            self.token_map = token_map
+            self.thread_map = thread_map
         self.log.info('Token thread registered -  key: {}, thread: {}'.format(key, thread_name))
 
     def register_token(self, key, token, expires):
@@ -120,7 +181,11 @@ class Tokens(object):
             )
             return
 
-        self.token_map[key] = {'thread_names': [], 'token': token, 'token_expires': int(expires)}
+        with self.lock:
+            token_map = dict(self.token_map)
+            token_map[key] = {'thread_names': [], 'token': token, 'token_expires': int(expires)}
+            self.token_map = token_map
+        self._push_expiration(key, expires)
         self.log.info(
             'Token registered - key: {}, token: {}, expiration {}'.format(
                 key, self.printable_token(token), expires
@@ -179,19 +244,19 @@ class Tokens(object):
     @token.setter
     def token(self, token):
         """Set token for current thread."""
-        # TODO: add lock.acquire / lock.release
-        self.token_map.setdefault(self.key, {})['token'] = token
+        self._update_token(self.key, token=token)
 
     @property
     def token_expires(self):
         """Return token_expires for current thread."""
-        # TODO: add lock.acquire / lock.release
         return self.token_map.get(self.key, {}).get('token_expires')
 
     @token_expires.setter
     def token_expires(self, expires):
         """Set token expires for current thread."""
-        self.token_map.setdefault(self.key, {})['token_expires'] = int(expires)
+        key = self.key
+        self._update_token(key, token_expires=int(expires))
+        self._push_expiration(key, expires)
 
     def token_renewal(self):
         """Start token renewal monitor thread."""
@@ -201,46 +266,63 @@ class Tokens(object):
         t.start()
 
     def token_renewal_monitor(self):
-        """Monitor token expiration and renew when required."""
+        """Monitor token expiration and renew when required.
+
+        Token expirations are stored in a min-heap, so only tokens within the renewal window are
+        processed. Heap entries for tokens that have been renewed or unregistered are skipped.
+        """
         while True:
-            for key, token_data in dict(self.token_map).items():
+            self._renewal_event.clear()
+            renew = []
+            with self.lock:
+                renew_before = int(time.time()) + self.token_window
+                while self._expirations and self._expirations[0][0] < renew_before:
+                    expires, _, key = heapq.heappop(self._expirations)
+                    token_data = self.token_map.get(key)
+                    if token_data is None or token_data.get('token_expires') != expires:
+                        continue  # stale entry
+                    if key not in [k for k, _ in renew]:
+                        renew.append((key, token_data))
+
                 # calculate the time left to sleep
-                sleep_seconds = (
-                    token_data.get('token_expires') - int(time.time()) - self.token_window
-                )
+                sleep_seconds = self.sleep_interval
+                if self._expirations:
+                    sleep_seconds = min(
+                        sleep_seconds, max(self._expirations[0][0] - renew_before, 1)
+                    )
+
+            for key, token_data in renew:
                 self.log.debug(
-                    'token status - key: {}, token: {}, expires: {}, sleep-seconds: {}'.format(
+                    'token status - key: %s, token: %s, expires: %s',
+                    key,
+                    self.printable_token(token_data.get('token')),
+                    token_data.get('token_expires'),
+                )
+
+                # renew token data
+                try:
+                    api_token_data = self.renew_token(token_data.get('token'))
+                    if key not in self.token_map:  # pragma: no cover
+                        continue  # token unregistered during renewal
+                    self._update_token(
                         key,
-                        self.printable_token(token_data.get('token')),
-                        token_data.get('token_expires'),
-                        sleep_seconds,
+                        token=api_token_data['apiToken'],
+                        token_expires=int(api_token_data['apiTokenExpires']),
                     )
-                )
+                    self._push_expiration(key, api_token_data['apiTokenExpires'])
+                    self.log.info(
+                        'Token renewed - key: {}, token: {}, expires: {}'.format(
+                            key,
+                            self.printable_token(api_token_data['apiToken']),
+                            api_token_data['apiTokenExpires'],
+                        )
+                    )
+                except RuntimeError as e:
+                    self.log.error(e)
+                    if self._remove_token(key):
+                        self.log.error('Failed token removed - key: {}'.format(key))
 
-                if sleep_seconds < 0:
-                    # renew token data
-                    with self.lock:
-                        try:
-                            api_token_data = self.renew_token(token_data.get('token'))
-                            self.token_map[key]['token'] = api_token_data['apiToken']
-                            self.token_map[key]['token_expires'] = int(
-                                api_token_data['apiTokenExpires']
-                            )
-                            self.log.info(
-                                'Token renewed - key: {}, token: {}, expires: {}'.format(
-                                    key,
-                                    self.printable_token(api_token_data['apiToken']),
-                                    api_token_data['apiTokenExpires'],
-                                )
-                            )
-                        except RuntimeError as e:
-                            self.log.error(e)
-                            try:
-                                del self.token_map[key]
-                                self.log.error('Failed token removed - key: {}'.format(key))
-                            except KeyError:  # pragma: no cover
-                                pass
-            time.sleep(self.sleep_interval)
+            self._renewal_event.wait(sleep_seconds)
             if self.shutdown:
                 break
 
@@ -251,13 +333,20 @@ class Tokens(object):
             key (str): The key to use to identify a token.
             thread_name (str): The thread to unregister from a key.
         """
-        try:
-            self.token_map[key]['thread_names'].remove(thread_name)
-            self.log.info(
-                'Token thread unregistered -  key: {}, thread: {}'.format(key, thread_name)
-            )
-        except (KeyError, ValueError):  # pragma: no cover
-            pass
+        with self.lock:
+            thread_names = self.token_map.get(key, {}).get('thread_names', [])
+            if thread_name not in thread_names:  # pragma: no cover
+                return
+            token_map = dict(self.token_map)
+            token_data = dict(token_map[key])
+            token_data['thread_names'] = [t for t in thread_names if t != thread_name]
+            token_map[key] = token_data
+            thread_map = dict(self.thread_map)
+            if thread_map.get(thread_name) == key:
+                del thread_map[thread_name]
+            self.token_map = token_map
+            self.thread_map = thread_map
+        self.log.info('Token thread unregistered -  key: {}, thread: {}'.format(key, thread_name))
 
     def unregister_token(self, key):
         """Unregister a token.
@@ -265,8 +354,5 @@ class Tokens(object):
         Args:
             key (str): The key used to identify a token.
         """
-        try:
-            del self.token_map[key]
+        if self._remove_token(key):
             self.log.info('Token unregistered - key: {}'.format(key))
-        except KeyError:
-            pass
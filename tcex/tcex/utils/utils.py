@@ -2,15 +2,19 @@
 """TcEx Utilities Module"""
 from datetime import datetime
 import calendar
+import functools
 import math
 import os
 import re
+import threading
 import time
 import uuid
+from contextlib import contextmanager
 
 from pytz import timezone
 import pytz
 from dateutil import parser
+from dateutil import tz as dateutil_tz
 from dateutil.relativedelta import relativedelta
 from tzlocal import get_localzone
 import parsedatetime as pdt
@@ -19,6 +23,16 @@ import parsedatetime as pdt
 class Utils:
     """TcEx framework Utils module"""
 
+    # strict ISO 8601 date/datetime (e.g. 2017-11-08, 2017-11-08T16:52:42.400306+00:00)
+    _iso_8601 = re.compile(
+        r'^([0-9]{4})-([0-9]{2})-([0-9]{2})'
+        r'(?:[T ]([0-9]{2}):([0-9]{2})(?::([0-9]{2})(?:\.([0-9]{1,6}))?)?'
+        r'(Z|[+-][0-9]{2}(?::?[0-9]{2})?)?)?$'
+    )
+    # unix time (e.g. 1510686617, 1510686617.298753, or 1510686617298 with milliseconds)
+    _unix_time = re.compile(r'^[0-9]{9,10}(?:\.[0-9]{0,6})?$')
+    _unix_time_ms = re.compile(r'^[0-9]{11,16}$')
+
     def __init__(self, tcex=None):
         """Initialize the Class properties.
 
@@ -65,7 +79,89 @@ class Utils:
         return dt_value
 
     @staticmethod
-    def _replace_timezone(dateutil_parser):
+    @functools.lru_cache(maxsize=8192)
+    def _format_datetime_strict(time_input, tz, date_format):
+        """Return the formatted datetime for unix time and strict ISO 8601 inputs.
+
+        The results only depend on the input, so they are cached for repeated inputs.
+
+        Args:
+            time_input (string): The time input string.
+            tz (string): The time zone for the returned data.
+            date_format (string): The strftime format to use, ISO by default.
+
+        Returns:
+            (string): Formatted datetime string or None if the input is not unix time or ISO 8601.
+        """
+        dt_value = Utils.unix_time_to_datetime(time_input, tz)
+        if dt_value is None:
+            dt_value = Utils._iso_to_datetime(time_input)
+            if dt_value is None:
+                return None
+            dt_value = Utils._convert_timezone(dt_value, tz)
+        return Utils._format(dt_value, date_format)
+
+    @staticmethod
+    def _convert_timezone(dt, tz):
+        """Return the datetime in the provided time zone (naive datetimes are local time)."""
+        # don't convert timezone if dt timezone already in the correct timezone
+        if tz is not None and tz != dt.tzname():
+            if dt.tzinfo is None:
+                dt = Utils._replace_timezone(dt)
+            dt = dt.astimezone(timezone(tz))
+        return dt
+
+    @staticmethod
+    def _format(dt_value, date_format):
+        """Return the datetime formatted with the strftime format, ISO by default."""
+        if date_format == '%s':
+            return calendar.timegm(dt_value.timetuple())
+        if date_format:
+            return dt_value.strftime(date_format)
+        return dt_value.isoformat()
+
+    @staticmethod
+    def _iso_to_datetime(time_input):
+        """Return the datetime for a strict ISO 8601 input or None.
+
+        The timezone info matches dateutil (tzutc or tzoffset).
+        """
+        if not isinstance(time_input, str):
+            return None
+        match = Utils._iso_8601.match(time_input)
+        if match is None:
+            return None
+
+        year, month, day, hour, minute, second, fraction, offset = match.groups()
+        tzinfo = None
+        if offset is not None:
+            offset_seconds = 0
+            if offset != 'Z':
+                digits = offset[1:].replace(':', '')
+                offset_seconds = int(digits[:2]) * 3600 + int(digits[2:] or 0) * 60
+                if offset.startswith('-'):
+                    offset_seconds = -offset_seconds
+            tzinfo = dateutil_tz.UTC
+            if offset_seconds:
+                tzinfo = dateutil_tz.tzoffset(None, offset_seconds)
+        try:
+            return datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour or 0),
+                int(minute or 0),
+                int(second or 0),
+                int((fraction or '0').ljust(6, '0')),
+                tzinfo,
+            )
+        except ValueError:
+            return None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _local_timezone():
+        """Return the local timezone (resolved once)."""
         try:
             # try to get the timezone from tzlocal
             tzinfo = timezone(get_localzone().zone)
@@ -76,7 +172,11 @@ class Utils:
             except pytz.exceptions.UnknownTimeZoneError:
                 # seeing as all else has failed: use UTC as the timezone
                 tzinfo = timezone('UTC')
-        return tzinfo.localize(dateutil_parser)
+        return tzinfo
+
+    @staticmethod
+    def _replace_timezone(dateutil_parser):
+        return Utils._local_timezone().localize(dateutil_parser)
 
     def date_to_datetime(self, time_input, tz=None):
         """ Convert ISO 8601 and other date strings to datetime.datetime type.
@@ -88,15 +188,13 @@ class Utils:
         Returns:
             (datetime.datetime): Python datetime.datetime object.
         """
-        dt = None
+        # strict ISO 8601 input without the dateutil parser
+        dt = self._iso_to_datetime(time_input)
         try:
-            # dt = parser.parse(time_input, fuzzy_with_tokens=True)[0]
-            dt = parser.parse(time_input)
-            # don't convert timezone if dt timezone already in the correct timezone
-            if tz is not None and tz != dt.tzname():
-                if dt.tzinfo is None:
-                    dt = self._replace_timezone(dt)
-                dt = dt.astimezone(timezone(tz))
+            if dt is None:
+                # dt = parser.parse(time_input, fuzzy_with_tokens=True)[0]
+                dt = parser.parse(time_input)
+            dt = self._convert_timezone(dt, tz)
         except IndexError:  # pragma: no cover
             pass
         except TypeError:
@@ -126,19 +224,38 @@ class Utils:
         Returns:
             (string): Formatted datetime string.
         """
+        # handle timestamp and ISO 8601 input (cached for repeated inputs)
+        try:
+            dt_value = self._format_datetime_strict(time_input, tz, date_format)
+        except TypeError:
+            # unhashable input
+            dt_value = None
+        if dt_value is not None:
+            return dt_value
 
-        # handle timestamp (e.g. 1510686617 or 1510686617.298753)
-        dt_value = self.any_to_datetime(time_input, tz)
+        # handle other formatted date and human readable relative time
+        return self._format(self.any_to_datetime(time_input, tz), date_format)
 
-        # format date
-        if date_format == '%s':
-            dt_value = calendar.timegm(dt_value.timetuple())
-        elif date_format:
-            dt_value = dt_value.strftime(date_format)
-        else:
-            dt_value = dt_value.isoformat()
+    def format_datetimes(self, time_inputs, tz=None, date_format=None):
+        """Return timestamps for multiple inputs (e.g. a column of dates).
 
-        return dt_value
+        Each unique input is converted once. None and empty string inputs are returned as None.
+
+        Args:
+            time_inputs (list): The time input strings (see :py:meth:`format_datetime`).
+            tz (string): The time zone for the returned data.
+            date_format (string): The strftime format to use, ISO by default.
+
+        Returns:
+            (list): Formatted datetime strings in the order of the inputs.
+        """
+        time_inputs = list(time_inputs)
+        formatted = {
+            time_input: self.format_datetime(time_input, tz, date_format)
+            for time_input in set(time_inputs)
+            if time_input is not None and time_input != ''
+        }
+        return [formatted.get(time_input) for time_input in time_inputs]
 
     def human_date_to_datetime(self, time_input, tz=None, source_datetime=None):
         """ Convert human readable date (e.g. 30 days ago) to datetime.datetime using
@@ -283,6 +400,34 @@ class Utils:
             'total_microseconds': total_microseconds,
         }
 
+    @staticmethod
+    @contextmanager
+    def thread_name(name):
+        """Rename the current thread for the duration of the context.
+
+        Tokens, service sessions, and thread log files are looked up by the thread name. Work run
+        on a pool thread for another thread (e.g., a service session) is run under the name of
+        that thread. The pool thread name is restored on exit.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            name = threading.current_thread().name
+            with Utils.thread_name(name):
+                ...
+
+        Args:
+            name (str): The thread name.
+        """
+        thread = threading.current_thread()
+        thread_name = thread.name
+        thread.name = name
+        try:
+            yield
+        finally:
+            thread.name = thread_name
+
     @staticmethod
     def to_bool(value):
         """Convert string value to bool."""
@@ -308,14 +453,16 @@ class Utils:
             (datetime.datetime): Python datetime.datetime object.
         """
         dt = None
-        if re.compile(r'^[0-9]{11,16}$').findall(str(time_input)):
+        time_input_str = str(time_input)
+        if Utils._unix_time_ms.match(time_input_str):
             # handle timestamp with milliseconds and no "."
-            time_input_length = len(str(time_input)) - 10
+            time_input_length = len(time_input_str) - 10
             dec = math.pow(10, time_input_length)
             time_input = float(time_input) / dec
+            time_input_str = str(time_input)
 
-        if re.compile(r'^[0-9]{9,10}(?:\.[0-9]{0,6})?$').findall(str(time_input)):
-            dt = datetime.fromtimestamp(float(time_input), tz=timezone('UTC'))
+        if Utils._unix_time.match(time_input_str):
+            dt = datetime.fromtimestamp(float(time_input), tz=pytz.utc)
             # don't covert timezone if dt timezone already in the correct timezone
             if tz is not None and tz != dt.tzname():
                 dt = dt.astimezone(timezone(tz))
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Batch Module."""
+import os
+
+from tcex.batch.batch_checkpoint import BatchCheckpoint
+
+
+class TestBatchCheckpoint:
+    """Test the TcEx Batch Module."""
+
+    @staticmethod
+    def test_journal(tmpdir):
+        """Test the checkpoint state is reloaded and a partial last event is discarded"""
+        fqfn = os.path.join(str(tmpdir), 'batch-checkpoint')
+        checkpoint = BatchCheckpoint(fqfn)
+        checkpoint.submitted(1, ['xid-1', 'xid-2'])
+        checkpoint.submitted(2, ['xid-3'])
+        checkpoint.completed(1)
+        with open(fqfn, 'ab') as fh:
+            fh.write(b'{"event": "submitted", "batch_id": 3, "xi')
+
+        checkpoint = BatchCheckpoint(fqfn)
+        assert checkpoint.pending == [2]
+        assert len(checkpoint) == 3
+        assert 'xid-1' in checkpoint and not checkpoint.is_pending('xid-1')
+        assert checkpoint.is_pending('xid-3')
+
+        # the next event is written after the discarded event
+        checkpoint.completed(2)
+        assert BatchCheckpoint(fqfn).pending == []
+
+        checkpoint.delete()
+        assert not os.path.isfile(fqfn)
+        assert len(BatchCheckpoint(fqfn)) == 0
+
+    @staticmethod
+    def test_submit_all_resume(tcex):
+        """Test submit_all skips groups and indicators submitted by a previous run"""
+        batch = tcex.batch(owner='TCI')
+        batch.checkpoint = 'batch-checkpoint-pytest-resume'
+        xids = [batch.generate_xid(['pytest', 'address', 'checkpoint', i]) for i in range(10)]
+
+        # record the first 5 indicators as submitted by a previous run
+        batch.checkpoint.submitted(-1, xids[:5])
+        batch.checkpoint.completed(-1)
+        for i, xid in enumerate(xids):
+            batch.address(ip='1.11.114.{}'.format(i), rating='5.0', confidence='100', xid=xid)
+
+        batch_status = batch.submit_all()
+        assert sum([bs.get('successCount') for bs in batch_status]) == 5
+        assert not os.path.isfile(batch.checkpoint.fqfn)
+
+    @staticmethod
+    def test_submit_all_no_poll(tcex):
+        """Test batch jobs submitted without polling are polled by the next submit_all"""
+        batch = tcex.batch(owner='TCI')
+        batch.checkpoint = 'batch-checkpoint-pytest-no-poll'
+        for i in range(5):
+            batch.address(ip='1.11.115.{}'.format(i), rating='5.0', confidence='100')
+
+        batch.submit_all(poll=False)
+        assert len(batch.checkpoint.pending) == 1
+        assert os.path.isfile(batch.checkpoint.fqfn)
+
+        batch_status = batch.submit_all()
+        assert sum([bs.get('successCount') for bs in batch_status]) == 5
+        assert not os.path.isfile(batch.checkpoint.fqfn)
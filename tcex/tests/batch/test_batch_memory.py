@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Batch Module."""
+import tracemalloc
+
+import pytest
+from tcex.batch.group import Adversary
+from tcex.batch.indicator import Address
+
+
+class TestBatchMemory:
+    """Test the TcEx Batch Module."""
+
+    @staticmethod
+    def bytes_per_object(factory, count=10000):
+        """Return the average number of bytes allocated per object."""
+        tracemalloc.start()
+        objects = [factory(i) for i in range(count)]  # noqa: F841; pylint: disable=W0612
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return current / count
+
+    @pytest.mark.parametrize(
+        'name,factory,max_bytes',
+        [
+            # prior to __slots__/lazy collections an Address used ~850 bytes
+            ('address', lambda i: Address('1.1.1.{}'.format(i), xid='address-{}'.format(i)), 500),
+            # prior to __slots__/lazy collections an Adversary used ~710 bytes
+            ('adversary', lambda i: Adversary('adv-{}'.format(i), xid='adv-{}'.format(i)), 450),
+        ],
+    )
+    def test_bytes_per_entity(self, name, factory, max_bytes):
+        """Test the memory used per batch entity"""
+        bytes_per_object = self.bytes_per_object(factory)
+        assert bytes_per_object < max_bytes, '{}: {:.0f} bytes per object'.format(
+            name, bytes_per_object
+        )
+
+    @staticmethod
+    def test_slots():
+        """Test batch entities do not allocate an instance dict"""
+        ti = Address('1.1.1.1')
+        assert not hasattr(ti, '__dict__')
+        assert ti.data == {'summary': '1.1.1.1', 'type': 'Address', 'xid': ti.xid}
+        ti.tag('PyTest')
+        assert ti.data.get('tag') == [{'name': 'PyTest'}]
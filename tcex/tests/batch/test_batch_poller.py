@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Batch Poller Module."""
+import pytest
+
+from tcex.batch.batch_poller import BatchPoller
+
+
+class MockResponse:
+    """Mock response for the batch status endpoint."""
+
+    def __init__(self, data, status_code=200):
+        """Initialize class properties."""
+        self.data = data
+        self.headers = {'content-type': 'application/json'}
+        self.ok = status_code < 400
+        self.status_code = status_code
+        self.text = str(data)
+
+    def json(self):
+        """Return response data."""
+        return self.data
+
+
+class MockSession:
+    """Mock session for the /v2/batch/{id} endpoint.
+
+    Each batch job completes after the provided number of polls.
+    """
+
+    def __init__(self, polls_to_complete):
+        """Initialize class properties."""
+        self.polls = {}
+        self.polls_to_complete = polls_to_complete
+
+    def get(self, url, params=None):  # pylint: disable=W0613
+        """Return the batch status for the batch id in the url."""
+        batch_id = int(url.split('/')[-1])
+        self.polls[batch_id] = self.polls.get(batch_id, 0) + 1
+        status = 'Running'
+        if self.polls[batch_id] >= self.polls_to_complete[batch_id]:
+            status = 'Completed'
+        data = {'status': 'Success', 'data': {'batchStatus': {'id': batch_id, 'status': status}}}
+        return MockResponse(data)
+
+
+class MockClock:
+    """Mock clock that only moves when advanced."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+    def advance(self, seconds):
+        """Move the clock forward."""
+        self.now += seconds
+
+
+class TestBatchPoller:
+    """Test the TcEx Batch Poller Module."""
+
+    @staticmethod
+    def _run(poller, clock):
+        """Run the poller until all batches are complete, returning the poll times."""
+        poll_times = []
+        while True:
+            wait = poller.run_pending()
+            if wait is None:
+                break
+            poll_times.append(clock() + wait)
+            clock.advance(wait)
+        return poll_times
+
+    def test_poller(self, tcex, monkeypatch):
+        """Test polling multiple batches with per batch back off"""
+        clock = MockClock()
+        session = MockSession({1: 1, 2: 3, 3: 2})
+        monkeypatch.setattr(tcex, '_session', session)
+        poller = BatchPoller(tcex, retry_seconds=5, back_off=2.5, max_interval=20, clock=clock)
+
+        completed = []
+        futures = {}
+        for batch_id in [1, 2, 3]:
+            futures[batch_id] = poller.add(batch_id, callback=completed.append)
+        assert sorted(poller.pending) == [1, 2, 3]
+
+        poll_times = self._run(poller, clock)
+        # first poll at 5s, batch 3 at 5 + 7s, batch 2 at 5 + 7 + 10s
+        assert poll_times == [5, 12, 22]
+        assert session.polls == {1: 1, 2: 3, 3: 2}
+        assert poller.pending == []
+        assert len(completed) == 3
+        for batch_id, future in futures.items():
+            status = future.result().get('data', {}).get('batchStatus', {})
+            assert status.get('id') == batch_id
+            assert status.get('status') == 'Completed'
+
+    def test_poller_timeout(self, tcex, monkeypatch):
+        """Test poll timeout of a batch that never completes"""
+        clock = MockClock()
+        monkeypatch.setattr(tcex, '_session', MockSession({1: 100}))
+        poller = BatchPoller(tcex, clock=clock)
+
+        future = poller.add(1, timeout=60)
+        self._run(poller, clock)
+        with pytest.raises(RuntimeError) as e:
+            future.result()
+        assert e.value.args[0] == 550
+        assert clock() >= 60
+
+    @staticmethod
+    def test_poller_not_started(tcex):
+        """Test a batch poll times out if the shared poller is not running"""
+        batch = tcex.batch(owner='TCI')
+        batch.poller = BatchPoller(tcex, max_interval=0)
+        batch._poll_interval = 0
+        with pytest.raises(RuntimeError) as e:
+            batch.poll(1, timeout=0)
+        assert e.value.args[0] == 550
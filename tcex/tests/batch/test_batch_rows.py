@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Batch Module."""
+import csv
+import io
+
+
+class TestBatchRows:
+    """Test the TcEx Batch Module."""
+
+    @staticmethod
+    def _rows():
+        """Return CSV rows of file hashes."""
+        fh = io.StringIO()
+        writer = csv.writer(fh)
+        writer.writerow(['md5', 'sha256', 'score', 'confidence', 'seen', 'id'])
+        for i in range(25):
+            sha256 = '{:064d}'.format(i) if i % 2 else ''
+            writer.writerow(
+                ['{:032d}'.format(i), sha256, i % 5, i * 4, '2017-03-0{}'.format(i % 9 + 1), i]
+            )
+        fh.seek(0)
+        return list(csv.DictReader(fh))
+
+    def test_rows_match_objects(self, tcex):
+        """Test indicators added from rows match the Indicator objects"""
+        mapping = {
+            'md5': 'md5',
+            'sha256': 'sha256',
+            'rating': 'score',
+            'confidence': 'confidence',
+            'date_added': 'seen',
+            'xid': 'id',
+        }
+        batch = tcex.batch(owner='TCI')
+        assert batch.add_indicators_from_rows(self._rows(), 'File', mapping, chunk_size=10) == 25
+
+        batch_objects = tcex.batch(owner='TCI')
+        for row in self._rows():
+            batch_objects.file(
+                md5=row.get('md5'),
+                sha256=row.get('sha256') or None,
+                rating=row.get('score'),
+                confidence=row.get('confidence'),
+                date_added=row.get('seen'),
+                xid=row.get('id'),
+            )
+        assert batch.data == batch_objects.data
+
+    @staticmethod
+    def test_rows_save(tcex):
+        """Test indicators from rows of sequences saved to the shelf with generated xids"""
+        rows = [['pytest-host-{}.com'.format(i % 10), '5'] for i in range(25)]
+        batch = tcex.batch(owner='TCI')
+        count = batch.add_indicators_from_rows(
+            rows, 'Host', {'summary': 0, 'rating': 1}, chunk_size=7, save=True
+        )
+        # duplicate rows are only added once
+        assert count == 10
+        assert len(batch.indicators) == 0
+        assert len(batch.indicators_shelf) == 10
+
+        xid = batch.generate_xid(['Host', 'pytest-host-0.com'])
+        assert batch.indicators_shelf[xid] == {
+            'summary': 'pytest-host-0.com',
+            'type': 'Host',
+            'rating': 5.0,
+            'xid': xid,
+        }
+        batch.close()
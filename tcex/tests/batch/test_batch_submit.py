@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Batch Module."""
+import io
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+class TestBatchSubmit:
+    """Test the TcEx Batch Module."""
+
+    @staticmethod
+    def test_submit_all_pipelined(tcex):
+        """Test pipelined submit of multiple chunks"""
+        batch = tcex.batch(owner='TCI')
+        batch._batch_max_chunk = 10
+        for i in range(25):
+            xid = batch.generate_xid(['pytest', 'address', 'pipeline', i])
+            ti = batch.address(ip='1.11.112.{}'.format(i), rating='5.0', confidence='100', xid=xid)
+            ti.tag(name='PyTestPipeline')
+            if i % 2 == 0:
+                batch.save(ti)
+        batch_status = batch.submit_all(max_in_flight=2)
+        assert len(batch_status) == 3
+        assert [bs.get('status') for bs in batch_status] == ['Completed'] * 3
+        assert sum([bs.get('successCount') for bs in batch_status]) == 25
+
+    @staticmethod
+    def test_submit_all_saved_associations(tcex):
+        """Test submit of saved groups and indicators with associations"""
+        batch = tcex.batch(owner='TCI')
+        adversary_xids = []
+        for i in range(3):
+            xid = batch.generate_xid(['pytest', 'adversary', 'saved', i])
+            ti = batch.adversary(name='pytest-adversary-saved-{}'.format(i), xid=xid)
+            if adversary_xids:
+                ti.association(adversary_xids[-1])
+            adversary_xids.append(xid)
+            batch.save(ti)
+        for i in range(3):
+            xid = batch.generate_xid(['pytest', 'host', 'saved', i])
+            ti = batch.host(hostname='pytest-host-saved-{}.com'.format(i), xid=xid)
+            ti.association(adversary_xids[-1])
+            batch.save(ti)
+        assert len(batch) == 6
+        batch_status = batch.submit_all()
+        assert batch_status[0].get('status') == 'Completed'
+        assert batch_status[0].get('successCount') == 6
+        assert len(batch) == 0
+        batch.close()
+
+    @staticmethod
+    def test_data_late_association(tcex):
+        """Test an association added to a queued indicator after the first chunk is planned"""
+        batch = tcex.batch(owner='TCI')
+        batch._batch_max_chunk = 3
+        hosts = []
+        for i in range(6):
+            xid = batch.generate_xid(['pytest', 'host', 'late', i])
+            hosts.append(batch.host(hostname='pytest-host-late-{}.com'.format(i), xid=xid))
+        xid = batch.generate_xid(['pytest', 'adversary', 'late'])
+        batch.adversary(name='pytest-adversary-late', xid=xid)
+
+        data = batch.data
+        assert [ti.get('xid') for ti in data.get('indicator')] == [h.xid for h in hosts[:3]]
+
+        # the association is added to the planner before the next chunk is planned
+        hosts[5].association(xid)
+        data = batch.data
+        assert [g.get('xid') for g in data.get('group')] == [xid]
+        assert [ti.get('xid') for ti in data.get('indicator')] == [hosts[5].xid, hosts[3].xid]
+        assert len(batch) == 1
+
+    @staticmethod
+    def test_data_deprecated(tcex):
+        """Test the deprecated data helpers return the planned groups and indicators"""
+        batch = tcex.batch(owner='TCI')
+        adversary_xid = batch.generate_xid(['pytest', 'adversary', 'deprecated'])
+        batch.adversary(name='pytest-adversary-deprecated', xid=adversary_xid)
+        incident_xids = []
+        for i in range(2):
+            xid = batch.generate_xid(['pytest', 'incident', 'deprecated', i])
+            ti = batch.incident(name='pytest-incident-deprecated-{}'.format(i), xid=xid)
+            ti.association(adversary_xid)
+            incident_xids.append(xid)
+        host_xid = batch.generate_xid(['pytest', 'host', 'deprecated'])
+        batch.host(hostname='pytest-host-deprecated.com', xid=host_xid).association(adversary_xid)
+        event_xid = batch.generate_xid(['pytest', 'event', 'deprecated'])
+        batch.event(name='pytest-event-deprecated', xid=event_xid)
+
+        with pytest.warns(DeprecationWarning):
+            groups = batch.data_group_association(incident_xids[1])
+        assert sorted([g.get('xid') for g in groups]) == sorted([adversary_xid] + incident_xids)
+        with pytest.warns(DeprecationWarning):
+            groups, entity_count = batch.data_groups(batch.groups, 0)
+        assert [g.get('xid') for g in groups] == [event_xid]
+        assert entity_count == 1
+        with pytest.warns(DeprecationWarning):
+            indicators, entity_count = batch.data_indicators(batch.indicators, entity_count)
+        assert [i.get('xid') for i in indicators] == [host_xid]
+        assert entity_count == 2
+        assert len(batch) == 0
+
+    @staticmethod
+    def test_poll_interval_per_job(tcex, monkeypatch):
+        """Test concurrently polled jobs start with the poll interval of their own chunk"""
+        batch = tcex.batch(owner='TCI')
+        for batch_id, entities in [(1, 3000), (2, 100)]:
+            batch._chunk_info[batch_id] = {
+                'bytes': entities * 100,
+                'entities': entities,
+                'max_chunk': 5000,
+                'submit_time': time.time(),
+            }
+
+        # both jobs compute the initial interval before either completes
+        barrier = threading.Barrier(2, timeout=5)
+        sleeps = {}
+
+        def sleep(seconds):
+            """Record the first poll interval of each job."""
+            sleeps.setdefault(threading.current_thread().name, seconds)
+            barrier.wait()
+
+        def get(url, params=None):  # pylint: disable=W0613
+            """Return a completed batch status."""
+            batch_id = int(url.split('/')[-1])
+            batch_status = {'id': batch_id, 'status': 'Completed', 'successCount': 1}
+            data = {'status': 'Success', 'data': {'batchStatus': batch_status}}
+            response = type('Response', (), {})()
+            response.headers = {'content-type': 'application/json'}
+            response.json = lambda: data
+            response.ok = True
+            return response
+
+        monkeypatch.setattr('tcex.batch.batch.time.sleep', sleep)
+        monkeypatch.setattr(tcex.session, 'get', get)
+
+        def poll(batch_id):
+            """Poll the job, returning the first poll interval."""
+            threading.current_thread().name = 'pytest-poll-{}'.format(batch_id)
+            batch.poll(batch_id)
+            return sleeps.get(threading.current_thread().name)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert list(executor.map(poll, [1, 2])) == [10, 5]
+
+    @staticmethod
+    def _batch_data(batch):
+        """Add the same groups and indicators to a batch."""
+        for i in range(5):
+            xid = batch.generate_xid(['pytest', 'incident', 'stream', i])
+            ti = batch.incident(name='pytest-incident-stream-{}'.format(i), xid=xid)
+            ti.attribute(attr_type='Description', attr_value='Example #{}'.format(i))
+            ti.tag(name='PyTestStream')
+            if i % 2 == 0:
+                batch.save(ti)
+        for i in range(10):
+            xid = batch.generate_xid(['pytest', 'file', 'stream', i])
+            ti = batch.file(md5='{:032d}'.format(i), rating='5.0', confidence='100', xid=xid)
+            ti.occurrence(file_name='drop{}.exe'.format(i), date='2017-03-03T18:00:00-06:00')
+            ti.security_label(name='PYTEST', description='Pytest Label Description')
+            if i % 2 == 0:
+                batch.save(ti)
+
+    def test_write_data(self, tcex):
+        """Test streamed batch data matches the batch data dict"""
+        batch = tcex.batch(owner='TCI')
+        batch._batch_max_chunk = 4
+        self._batch_data(batch)
+        batch_stream = tcex.batch(owner='TCI')
+        batch_stream._batch_max_chunk = 4
+        self._batch_data(batch_stream)
+
+        while len(batch) > 0:
+            data = batch.data
+            fh = io.BytesIO()
+            group_count, indicator_count = batch_stream.write_data(fh)
+            assert fh.getvalue() == json.dumps(data).encode('utf-8')
+            assert group_count == len(data.get('group'))
+            assert indicator_count == len(data.get('indicator'))
+        assert len(batch_stream) == 0
+
+    @staticmethod
+    def test_submit_all_max_size(tcex):
+        """Test submit of chunks limited by payload size with adaptive chunk size"""
+        batch = tcex.batch(owner='TCI')
+        batch.adaptive_chunk = True
+        batch.batch_max_size = 4096
+        for i in range(50):
+            xid = batch.generate_xid(['pytest', 'address', 'max_size', i])
+            ti = batch.address(ip='1.11.113.{}'.format(i), rating='5.0', confidence='100', xid=xid)
+            ti.tag(name='PyTestMaxSize')
+        batch_status = batch.submit_all()
+        assert len(batch_status) > 1
+        assert sum([bs.get('successCount') for bs in batch_status]) == 50
+        chunk_stats = batch.chunk_stats
+        assert chunk_stats.get('total_chunks') == len(batch_status)
+        assert chunk_stats.get('total_entities') == 50
+        assert chunk_stats.get('chunk_size') is not None
+
+    @staticmethod
+    def test_submit_files(tcex):
+        """Test concurrent upload of Document and Report files from bytes, files, and generators"""
+        batch = tcex.batch(owner='TCI')
+        batch.file_upload_workers = 3
+
+        def file_chunks():
+            """Return file content in chunks."""
+            for i in range(3):
+                yield 'pytest chunk {}\n'.format(i)
+
+        xids = []
+        file_contents = [b'pytest bytes', io.BytesIO(b'pytest file'), file_chunks]
+        for i, file_content in enumerate(file_contents):
+            xid = batch.generate_xid(['pytest', 'document', 'upload', i])
+            if callable(file_content):
+                file_content = file_content()
+            batch.document(
+                'pytest-document-upload-{}'.format(i),
+                'pytest-{}.txt'.format(i),
+                file_content=file_content,
+                xid=xid,
+            )
+            xids.append(xid)
+        batch_status = batch.submit_all()
+        assert batch_status[0].get('successCount') == 3
+        upload_status = batch_status[0].get('uploadStatus')
+        assert [us.get('xid') for us in upload_status] == xids
+        assert all([us.get('uploaded') for us in upload_status])
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Batch Module."""
+from tcex.batch.chunk_planner import ChunkPlanner
+
+
+class TestChunkPlanner:
+    """Test the TcEx Batch Module."""
+
+    @staticmethod
+    def _chunks(planner, limit):
+        """Return all planned chunks."""
+        chunks = []
+        while len(planner) > 0:
+            groups, indicators = planner.plan(limit)
+            assert len(groups) + len(indicators) <= limit
+            chunks.append(groups + indicators)
+        return chunks
+
+    def test_components(self):
+        """Test associated groups and indicators are packed in the same chunk"""
+        planner = ChunkPlanner()
+        for i in range(4):
+            # the association can be added before the group
+            planner.add('indicator-{}'.format(i), 'indicator', ['group-{}'.format(i)])
+            planner.add('group-{}'.format(i), 'group', ['adversary-{}'.format(i % 2)])
+        planner.add('adversary-0', 'group')
+        planner.add('adversary-1', 'group')
+        for i in range(6):
+            planner.add('host-{}'.format(i), 'indicator')
+
+        chunks = self._chunks(planner, 6)
+        assert len(chunks) == 3
+        for chunk in chunks[:2]:
+            # each component (the adversary, 2 groups, and 2 indicators) is in a single chunk
+            adversary = [xid for xid in chunk if xid.startswith('adversary')][0]
+            i = int(adversary.split('-')[1])
+            assert sorted([xid for xid in chunk if not xid.startswith('host')]) == [
+                adversary,
+                'group-{}'.format(i),
+                'group-{}'.format(i + 2),
+                'indicator-{}'.format(i),
+                'indicator-{}'.format(i + 2),
+            ]
+        assert sorted(chunks[2]) == ['host-{}'.format(i) for i in range(2, 6)]
+
+    def test_long_chain(self):
+        """Test a long association chain is split across chunks without recursion"""
+        planner = ChunkPlanner()
+        for i in range(20000):
+            planner.add('group-{}'.format(i), 'group', ['group-{}'.format(i + 1)])
+        planner.add('indicator', 'indicator', ['group-0'])
+
+        chunks = self._chunks(planner, 5000)
+        assert [len(chunk) for chunk in chunks] == [5000, 5000, 5000, 5000, 1]
+        assert chunks[-1] == ['indicator']
+
+    @staticmethod
+    def test_restore():
+        """Test xids returned to the planner are planned for the next chunk"""
+        planner = ChunkPlanner()
+        planner.add('group', 'group', ['adversary'])
+        planner.add('adversary', 'group')
+        planner.add('host', 'indicator')
+        groups, indicators = planner.plan(3)
+        assert sorted(groups) == ['adversary', 'group'] and indicators == ['host']
+
+        planner.restore('host', 'indicator')
+        planner.restore('adversary', 'group')
+        assert len(planner) == 2
+        groups, indicators = planner.plan(1)
+        assert groups == ['adversary'] and indicators == []
+        assert planner.plan(1) == ([], ['host'])
+        assert len(planner) == 0
+
+    @staticmethod
+    def test_take():
+        """Test all xids in the component of an xid are removed and returned"""
+        planner = ChunkPlanner()
+        planner.add('group', 'group', ['adversary'])
+        planner.add('adversary', 'group')
+        planner.add('host', 'indicator', ['adversary'])
+        planner.add('address', 'indicator')
+        groups, indicators = planner.take('group')
+        assert sorted(groups) == ['adversary', 'group'] and indicators == ['host']
+        assert planner.take('group') == ([], [])
+        assert planner.take('address') == ([], ['address'])
+        assert len(planner) == 0
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Batch Module."""
+from tcex.batch.chunk_sizer import ChunkSizer
+
+
+class TestChunkSizer:
+    """Test the TcEx Batch Module."""
+
+    @staticmethod
+    def test_window():
+        """Test the chunk size only changes once per window of jobs"""
+        sizer = ChunkSizer(adaptive=True, min_chunk=100, window=3)
+        sizer.record(5000, 1000, 10000, 10, 1000, 0)
+        sizer.record(5000, 1000, 10000, 10, 1000, 0)
+        assert sizer.chunk_size(5000) == 1000
+        sizer.record(5000, 1000, 10000, 10, 1000, 0)
+        assert sizer.chunk_size(5000) == 750
+
+    @staticmethod
+    def test_noise():
+        """Test a single slow job does not reverse direction when the window improves"""
+        sizer = ChunkSizer(adaptive=True, min_chunk=100, window=3)
+        for seconds in [10, 10, 10]:
+            sizer.record(5000, 1000, 10000, seconds, 1000, 0)
+        assert sizer.chunk_size(5000) == 750
+        # one slow job (e.g. completed just after a poll) in an otherwise faster window
+        for seconds in [5, 12, 5]:
+            sizer.record(5000, 750, 7500, seconds, 1000, 0)
+        assert sizer.chunk_size(5000) == 562
+        # throughput over the window dropped, reverse direction
+        for seconds in [20, 20, 20]:
+            sizer.record(5000, 562, 5620, seconds, 1000, 0)
+        assert sizer.chunk_size(5000) == 702
+
+    @staticmethod
+    def test_ceiling():
+        """Test the chunk size is limited by the ceiling when the chunk was submitted"""
+        sizer = ChunkSizer(adaptive=True, min_chunk=100, window=1)
+        sizer.record(800, 1000, 10000, 10, 1000, 0)
+        assert sizer.chunk_size(5000) == 600
+        assert sizer.chunk_size(500) == 500
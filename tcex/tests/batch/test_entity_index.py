@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Batch Module."""
+import pytest
+from tcex.batch.group import Adversary
+from tcex.batch.indicator import Address
+
+
+class NoScanList(list):
+    """A children list that fails the test if the children are scanned for a lookup."""
+
+    def __contains__(self, item):
+        """Fail on a membership scan."""
+        raise AssertionError('children were scanned')
+
+    def __iter__(self):
+        """Fail on an iteration scan."""
+        raise AssertionError('children were scanned')
+
+    def index(self, *args):  # pylint: disable=W0221
+        """Fail on an index scan."""
+        raise AssertionError('children were scanned')
+
+
+class TestEntityIndex:
+    """Test the TcEx Batch Module."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'factory', [lambda: Address('1.1.1.1', xid='address'), lambda: Adversary('adv', xid='adv')]
+    )
+    def test_index_lookup(factory):
+        """Test attributes/tags are found with the index without scanning the children"""
+        entity = factory()
+        attributes = [entity.attribute('Description', 'value {}'.format(i)) for i in range(5000)]
+        tags = [entity.tag('tag {}'.format(i)) for i in range(5000)]
+
+        # pylint: disable=protected-access
+        entity._attributes = NoScanList(entity._attributes)
+        entity._tags = NoScanList(entity._tags)
+        for i in [0, 2500, 4999]:
+            assert entity.attribute('Description', 'value {}'.format(i)) is attributes[i]
+            assert entity.tag('tag {}'.format(i)) is tags[i]
+        entity.attribute('Description', 'value 5000')
+        entity.tag('tag 5000')
+
+        entity._attributes = list(entity._attributes[:])
+        entity._tags = list(entity._tags[:])
+        assert len(entity.data.get('attribute')) == 5001
+        assert len(entity.data.get('tag')) == 5001
+
+    @staticmethod
+    def test_unique():
+        """Test attribute, tag, and security label uniqueness and order"""
+        indicator = Address('1.1.1.1', xid='address')
+        attr = indicator.attribute('Description', 'one')
+        assert indicator.attribute('Description', 'one') is attr
+        assert indicator.attribute('Description', 'two', unique='Type') is attr
+        assert indicator.attribute('Description', 'one', unique=False) is not attr
+        indicator.attribute('Source', 'one')
+        assert [a.get('type') for a in indicator.data.get('attribute')] == [
+            'Description',
+            'Description',
+            'Source',
+        ]
+
+        # group unique Type replaces the first attribute of the type
+        group = Adversary('adv', xid='adv')
+        group.attribute('Description', 'one')
+        group.attribute('Source', 'one')
+        attr = group.attribute('Description', 'two', unique='Type')
+        assert group.attribute('Description', 'two') is attr
+        assert [a.get('value') for a in group.data.get('attribute')] == ['one', 'two']
+
+        for entity in [indicator, group]:
+            tag = entity.tag('Tag', formatter=str.lower)
+            assert entity.tag('tag') is tag
+            assert entity.tag('Tag', formatter=str.lower) is not tag
+            label = entity.security_label('TLP:RED')
+            assert entity.security_label('TLP:RED', 'updated') is label
+            assert [t.get('name') for t in entity.data.get('tag')] == ['tag', 'tag']
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Batch Module."""
+import io
+import os
+
+from tcex.batch.spill_store import SpillStore
+
+
+class TestSpillStore:
+    """Test the TcEx Batch Module."""
+
+    @staticmethod
+    def test_compact(tmp_path):
+        """Test replaced and deleted records are reclaimed by compact"""
+        store = SpillStore(str(tmp_path), segment_size=512)
+        for i in range(20):
+            store['xid-{}'.format(i)] = {'name': 'pytest-{}'.format(i), 'type': 'Adversary'}
+        segments = len([f for f in os.listdir(str(tmp_path)) if f.endswith('.json')])
+        assert segments > 2
+
+        # replace every record and delete half of them
+        for i in range(20):
+            store['xid-{}'.format(i)] = {'name': 'pytest-new-{}'.format(i), 'type': 'Adversary'}
+        for i in range(0, 20, 2):
+            del store['xid-{}'.format(i)]
+        store.compact()
+
+        files = [f for f in os.listdir(str(tmp_path)) if f.endswith('.json')]
+        assert len(files) <= segments
+        assert len(store) == 10
+        assert store['xid-1'].get('name') == 'pytest-new-1'
+        assert store.pop_many(['xid-19', 'xid-3']) == [
+            {'name': 'pytest-new-19', 'type': 'Adversary', 'xid': 'xid-19'},
+            {'name': 'pytest-new-3', 'type': 'Adversary', 'xid': 'xid-3'},
+        ]
+        store.close(delete=True)
+
+    @staticmethod
+    def test_reload_file_content(tmp_path):
+        """Test Document and Report file content is reloaded with a saved store"""
+        store = SpillStore(str(tmp_path))
+
+        def file_chunks():
+            """Return file content in chunks."""
+            for i in range(3):
+                yield 'pytest chunk {}\n'.format(i)
+
+        file_contents = {
+            'document-bytes': b'pytest bytes',
+            'document-file': io.BytesIO(b'pytest file'),
+            'document-generator': file_chunks(),
+            'report-callback': lambda xid: 'pytest {}'.format(xid).encode('utf-8'),
+        }
+        for xid, file_content in file_contents.items():
+            store[xid] = {'name': xid, 'type': 'Document', 'fileContent': file_content}
+        del store['document-bytes']
+        store.close()
+
+        store = SpillStore(str(tmp_path))
+        assert sorted(store) == ['document-file', 'document-generator', 'report-callback']
+        file_content = {}
+        for data in store.pop_iter(list(store)):
+            file_content[data.get('xid')] = data.get('fileContent')(data.get('xid'))
+        assert file_content == {
+            'document-file': b'pytest file',
+            'document-generator': b'pytest chunk 0\npytest chunk 1\npytest chunk 2\n',
+            'report-callback': b'pytest report-callback',
+        }
+        # the file content of the deleted record was not saved
+        assert len(os.listdir(os.path.join(str(tmp_path), 'files'))) == 4
+        store.close(delete=True)
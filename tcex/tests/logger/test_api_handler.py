@@ -1,6 +1,36 @@
 # -*- coding: utf-8 -*-
 """Test the TcEx Batch Module."""
+import logging
+import threading
+
 from tcex import TcEx
+from tcex.logger.api_handler import ApiHandler, ApiHandlerFormatter
+
+
+class MockResponse(object):
+    """Mock API response."""
+
+    def __init__(self, status_code):
+        """Initialize Class properties."""
+        self.ok = status_code < 400
+        self.status_code = status_code
+
+
+class MockSession(object):
+    """Mock session recording the log events sent to the API."""
+
+    def __init__(self, failures=0):
+        """Initialize Class properties."""
+        self.entries = []
+        self.failures = failures
+
+    def post(self, url, headers=None, json=None):  # pylint: disable=W0613
+        """Record the log events."""
+        if self.failures:
+            self.failures -= 1
+            return MockResponse(503)
+        self.entries.extend(json)
+        return MockResponse(201)
 
 
 class TestApiHandler:
@@ -20,3 +50,68 @@ class TestApiHandler:
             tcex.log.info('INFO LOGGING')
             tcex.log.warning('WARNING LOGGING')
             tcex.log.error('ERROR LOGGING')
+
+    @staticmethod
+    def test_api_handler_threads():
+        """Test API logging handler with records from worker threads"""
+        session = MockSession(failures=1)
+        handler = ApiHandler(session, flush_limit=10, max_queue=1000, backoff_factor=0)
+        handler.setFormatter(ApiHandlerFormatter())
+        log = logging.getLogger('test-api-handler')
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+
+        def work():
+            """Log from a worker thread."""
+            for i in range(100):
+                log.info('message {}'.format(i))
+
+        threads = [threading.Thread(target=work) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        handler.close()
+        log.removeHandler(handler)
+
+        assert len(session.entries) == 500
+        assert handler.dropped == 0
+
+    @staticmethod
+    def test_api_handler_dropped():
+        """Test API logging handler drops records when the queue is full"""
+        session = MockSession()
+        handler = ApiHandler(session, flush_limit=1000, flush_interval=60, max_queue=10)
+        handler.setFormatter(ApiHandlerFormatter())
+        log = logging.getLogger('test-api-handler-dropped')
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+
+        for i in range(25):
+            log.info('message {}'.format(i))
+        handler.close()
+        log.removeHandler(handler)
+
+        assert len(session.entries) == 10
+        assert handler.dropped == 15
+
+    @staticmethod
+    def test_api_handler_flush():
+        """Test flush returns once the queued records are sent by the sender thread"""
+        session = MockSession()
+        handler = ApiHandler(session, flush_limit=1000, flush_interval=60)
+        handler.setFormatter(ApiHandlerFormatter())
+        log = logging.getLogger('test-api-handler-flush')
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+
+        for i in range(3):
+            for j in range(5):
+                log.info('message {}'.format(i * 5 + j))
+            handler.flush(timeout=5)
+            assert len(session.entries) == (i + 1) * 5
+        assert handler._sender.is_alive()  # pylint: disable=W0212
+
+        handler.close()
+        log.removeHandler(handler)
+        assert not handler._sender.is_alive()  # pylint: disable=W0212
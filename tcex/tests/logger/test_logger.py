@@ -2,10 +2,25 @@
 """Test the TcEx Batch Module."""
 import os
 
+from tcex.logger import LazyArg, TruncatedArg
+
 # define thread logfile
 logfile = os.path.join('pytest', 'pytest.log')
 
 
+class FormatCounter(object):
+    """A log argument that counts the number of times it is formatted."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.count = 0
+
+    def __str__(self):
+        """Return the string value and count the format."""
+        self.count += 1
+        return 'payload'
+
+
 class TestLogs:
     """Test the TcEx Batch Module."""
 
@@ -27,3 +42,30 @@ class TestLogs:
 
         # simple assert to ensure the log file was created
         assert os.path.exists(os.path.join(tcex.default_args.tc_log_path, tc_log_file))
+
+    def test_lazy_args(self, tcex):  # pylint: disable=no-self-use
+        """Test log arguments are not formatted below the handler levels"""
+        calls = []
+        payload = FormatCounter()
+
+        tcex.logger.update_handler_level('info')
+        try:
+            tcex.log.debug('payload: %s', LazyArg(lambda: calls.append(payload)))
+            tcex.log.debug('payload: %s', TruncatedArg(payload))
+            assert not calls
+            assert payload.count == 0
+            assert not tcex.log.is_debug
+        finally:
+            tcex.logger.update_handler_level('trace')
+
+        # formatted by each handler
+        tcex.log.trace('payload: %s', LazyArg(lambda: calls.append(payload)))
+        tcex.log.trace('payload: %s', TruncatedArg(payload))
+        assert calls
+        assert payload.count > 0
+
+    @staticmethod
+    def test_truncated_arg():
+        """Test truncated log arguments"""
+        assert str(TruncatedArg('x' * 10, max_length=5)) == 'xxxxx... (10 characters)'
+        assert str(TruncatedArg(lambda: 'abc')) == 'abc'
@@ -34,3 +34,34 @@ class TestApiHandler:
 
         # simple assert to ensure the log file was created
         assert os.path.exists(os.path.join(tcex.default_args.tc_log_path, tc_log_file))
+
+    def test_thread_file_handler_sessions(self, tc_log_file, tcex):
+        """Test records are routed to the log file of each thread."""
+        names = ['pytest-session-{}'.format(i) for i in range(10)]
+
+        def logging_session(name):
+            """Log to a session log file."""
+            tcex.logger.add_thread_file_handler(
+                name=name,
+                filename=tc_log_file.replace('.log', '-{}.log'.format(name)),
+                level='info',
+                path=tcex.default_args.tc_log_path,
+            )
+            for _ in range(0, 5):
+                tcex.log.info('SESSION LOGGING {}'.format(name))
+            tcex.logger.remove_handler_by_name(handler_name=name)
+
+        threads = [threading.Thread(name=n, target=logging_session, args=(n,)) for n in names]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for name in names:
+            filename = os.path.join(
+                tcex.default_args.tc_log_path, tc_log_file.replace('.log', '-{}.log'.format(name))
+            )
+            with open(filename, 'r') as fh:
+                lines = [line for line in fh.read().splitlines() if 'SESSION LOGGING' in line]
+            assert len(lines) == 5
+            assert all([line.find(name) > 0 for line in lines])
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 """Test the TcEx Batch Module."""
+import json
+
 import pytest
 
 
@@ -332,3 +334,38 @@ class TestEmbedded:
 
         tcex.playbook.delete(variable)
         assert tcex.playbook.read(variable) is None
+
+    @staticmethod
+    def test_embedded_many(tcex):
+        """Test playbook embedded variables resolved in a single pass"""
+        values = {}
+        for i in range(100):
+            variable = '#App:0001:many.{}!String'.format(i)
+            tcex.playbook.create_string(variable, 'value {}'.format(i))
+            values[variable] = 'value {}'.format(i)
+        tcex.playbook.create_string_array('#App:0001:many.array!StringArray', ['one', 'two'])
+
+        embedded_value = ', '.join(list(values) + list(values))
+        embedded_value += ', "#App:0001:many.array!StringArray"'
+        resolved_value = ', '.join(list(values.values()) + list(values.values()))
+        resolved_value += ', ["one", "two"]'
+        assert tcex.playbook.read(embedded_value) == resolved_value
+
+        for variable in values:
+            tcex.playbook.delete(variable)
+        tcex.playbook.delete('#App:0001:many.array!StringArray')
+
+    @pytest.mark.parametrize(
+        'value,embedded_value',
+        [
+            # the JSON escaped newline is embedded as a newline
+            ('one\ntwo\n', 'one\ntwo\n'),
+            # a backslash before a digit is not a group reference
+            (r'C:\1\temp', r'C:\1\temp'),
+            # a JSON unicode escape is not an invalid escape
+            ('caf\u00e9', r'caf\u00e9'),
+        ],
+    )
+    def test_embedded_unescape(self, tcex, value, embedded_value):
+        """Test backslashes in embedded String values"""
+        assert tcex.playbook._embedded_unescape(json.dumps(value)[1:-1]) == embedded_value
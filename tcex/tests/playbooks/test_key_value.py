@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx KeyValue Module."""
+import threading
+import time
+
+from tcex.tcex_key_value import TcExKeyValue
+
+
+class MockResponse:
+    """Mock response for the key value endpoint."""
+
+    def __init__(self, content, status_code=200):
+        """Initialize class properties."""
+        self.content = content
+        self.ok = status_code < 400
+        self.status_code = status_code
+
+
+class MockSession:
+    """Mock session for the /internal/playbooks/keyValue/{key} endpoint."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.data = {}
+        self.gets = 0
+        self.active = 0
+        self.lock = threading.Lock()
+        self.peak = 0
+        self.threads = set()
+
+    def get(self, url):
+        """Return the value for the key in the url."""
+        with self.lock:
+            self.gets += 1
+        time.sleep(0.01)
+        return MockResponse(self.data.get(url, b''))
+
+    def put(self, url, data, headers=None):  # pylint: disable=W0613
+        """Store the value for the key in the url."""
+        with self.lock:
+            self.threads.add(threading.current_thread().name)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        self.data[url] = data.encode('utf-8')
+        with self.lock:
+            self.active -= 1
+        return MockResponse(b'OK')
+
+
+class TestKeyValue:
+    """Test the TcEx KeyValue Module."""
+
+    @staticmethod
+    def test_create_read_many(tcex, monkeypatch):
+        """Test concurrent bulk writes and cached reads"""
+        session = MockSession()
+        monkeypatch.setattr(tcex, '_session', session)
+        monkeypatch.setattr(TcExKeyValue, 'max_workers', 10)
+        kv = TcExKeyValue(tcex)
+
+        data = {'#App:0001:k{}!String'.format(i): 'v{}'.format(i) for i in range(50)}
+        start = time.time()
+        kv.create_many(data)
+        assert time.time() - start < 0.25
+        # writes are sent with the caller thread name (e.g., service session tokens)
+        assert session.threads == {threading.current_thread().name}
+        # the worker thread names are restored after each request
+        caller = threading.current_thread()
+        assert [t for t in threading.enumerate() if t.name == caller.name] == [caller]
+
+        # repeated keys are only read once
+        assert kv.read_many(list(data) * 2) == list(data.values()) * 2
+        assert kv.read('#App:0001:k1!String') == 'v1'
+        assert kv.read('#App:0001:k1!String', decode=False) == b'v1'
+        assert session.gets == 50
+
+        # writes invalidate the cached data
+        kv.create('#App:0001:k1!String', 'updated')
+        assert kv.read('#App:0001:k1!String') == 'updated'
+        assert session.gets == 51
+
+    @staticmethod
+    def test_max_workers(tcex, monkeypatch):
+        """Test the shared pool is resized when the max workers setting changes"""
+        session = MockSession()
+        monkeypatch.setattr(tcex, '_session', session)
+        monkeypatch.setattr(TcExKeyValue, 'max_workers', 2)
+
+        # the setting applies to all instances
+        TcExKeyValue(tcex).create_many({'#App:0001:k{}!String'.format(i): 'v' for i in range(10)})
+        assert session.peak == 2
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """Test the TcEx Batch Module."""
 
+import base64
+import tempfile
+
 import pytest
 
 from ..tcex_init import tcex
@@ -75,3 +78,53 @@ class TestUtils:
 
         tcex.playbook.delete(variable)
         assert tcex.playbook.read(variable) is None
+
+    def test_context(self):
+        """Test playbook contexts are isolated per session"""
+        variable = '#App:0004:thirteen!String'
+        contexts = [tcex.playbook.context('session-{}'.format(i), [variable]) for i in range(3)]
+        for i, playbook in enumerate(contexts):
+            assert playbook.db.key == 'session-{}'.format(i)
+            assert playbook.output_variables.get('thirteen') == {'variable': variable}
+            assert playbook._variable_parse is tcex.playbook._variable_parse
+            playbook.create_string(variable, str(i))
+
+        for i, playbook in enumerate(contexts):
+            assert playbook.read_string(variable) == str(i)
+            playbook.delete(variable)
+        assert tcex.playbook.db.key != contexts[0].db.key
+
+    def test_read_create_many(self):
+        """Test playbook bulk create and read"""
+        data = {'#App:0005:s{}!String'.format(i): 'value {}'.format(i) for i in range(20)}
+        data['#App:0005:a!StringArray'] = ['one', 'two']
+        tcex.playbook.create_many(data)
+
+        keys = list(data) + ['not a variable', None]
+        assert tcex.playbook.read_many(keys) == list(data.values()) + ['not a variable', None]
+
+        for variable in data:
+            tcex.playbook.delete(variable)
+        assert tcex.playbook.read_many(list(data)) == [None] * len(data)
+
+    def test_binary_stream(self):
+        """Test playbook binary data is stored in the standard format and read in chunks"""
+        variable = '#App:0006:binary!Binary'
+        value = bytes(bytearray(range(256))) * 4096
+        tcex.playbook.create_binary(variable, value)
+        assert tcex.playbook.read_binary(variable, b64decode=False) == base64.b64encode(
+            value
+        ).decode('utf-8')
+        assert tcex.playbook.read_binary(variable) == value
+        assert tcex.playbook.read_binary_buffer(variable) == bytearray(value)
+
+        # file input and spooled file output
+        with tempfile.TemporaryFile() as fh:
+            fh.write(value)
+            fh.seek(0)
+            tcex.playbook.create_binary(variable, fh)
+        with tcex.playbook.read_binary_buffer(variable, max_size=1024) as fh:
+            assert fh.read() == value
+
+        tcex.playbook.delete(variable)
+        assert tcex.playbook.read_binary_buffer(variable) is None
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Service Message Dispatcher Module."""
+import threading
+import time
+
+from tcex.services import MessageDispatcher
+
+
+class TestMessageDispatcher:
+    """Test the TcEx Service Message Dispatcher Module."""
+
+    @staticmethod
+    def _target(started, event):
+        """Return a target that signals when it starts and blocks until the event is set."""
+
+        def target(*args):  # pylint: disable=W0613
+            """Signal the start and wait for the event."""
+            started.set()
+            event.wait(5)
+
+        return target
+
+    @staticmethod
+    def test_bounded_workers(tcex):
+        """Test messages run on a bounded pool with the thread named by session"""
+        dispatcher = MessageDispatcher(tcex, max_workers=4, max_queue=100)
+        names = []
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def target(session_id):
+            """Record the concurrency and thread name."""
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+                names.append(threading.current_thread().name == session_id)
+            time.sleep(0.01)
+            with lock:
+                state['active'] -= 1
+
+        for i in range(40):
+            assert dispatcher.submit('session-{}'.format(i), target, ('session-{}'.format(i),))
+        dispatcher.stop()
+
+        assert len(names) == 40 and all(names)
+        assert state.get('peak') <= 4
+        assert threading.active_count() < 40
+        assert dispatcher.metrics.get('execution ms') >= 10
+
+    @staticmethod
+    def test_command_limits(tcex):
+        """Test the per command concurrency limit"""
+        dispatcher = MessageDispatcher(tcex, max_workers=8, command_limits={'runservice': 2})
+        lock = threading.Lock()
+        state = {'active': 0, 'count': 0, 'peak': 0}
+
+        def target():
+            """Record the concurrency."""
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.01)
+            with lock:
+                state['active'] -= 1
+                state['count'] += 1
+
+        for i in range(20):
+            dispatcher.submit('session-{}'.format(i), target, (), command='RunService')
+        dispatcher.stop()
+
+        assert state.get('count') == 20
+        assert state.get('peak') == 2
+
+    def test_reject(self, tcex):
+        """Test the reject callback is called when the queue is full"""
+        rejected = []
+        event = threading.Event()
+        started = threading.Event()
+        target = self._target(started, event)
+        dispatcher = MessageDispatcher(
+            tcex,
+            max_workers=1,
+            max_queue=1,
+            overflow='reject',
+            reject_callback=lambda name, command, args: rejected.append(args[0]),
+        )
+
+        # the first message blocks the worker and the second fills the queue
+        dispatcher.submit('session-0', target, (), command='runservice')
+        assert started.wait(5)
+        assert dispatcher.submit('session-1', target, (), command='runservice')
+        assert not dispatcher.submit('session-2', target, ({'requestKey': '2'},))
+        event.set()
+        dispatcher.stop()
+
+        assert rejected == [{'requestKey': '2'}]
+        assert dispatcher.metrics.get('rejected') == 1
+
+    def test_reject_deferred(self, tcex):
+        """Test messages deferred by the command limit count against the max queue size"""
+        rejected = []
+        event = threading.Event()
+        started = threading.Event()
+        target = self._target(started, event)
+        dispatcher = MessageDispatcher(
+            tcex,
+            max_workers=2,
+            max_queue=5,
+            overflow='reject',
+            command_limits={'runservice': 1},
+            reject_callback=lambda name, command, args: rejected.append(name),
+        )
+
+        # the first message blocks the command slot, the next 5 messages are deferred
+        dispatcher.submit('session-0', target, (), command='runservice')
+        assert started.wait(5)
+        for i in range(1, 20):
+            dispatcher.submit('session-{}'.format(i), target, (), command='runservice')
+
+        assert dispatcher.metrics.get('queue depth') == 5
+        assert rejected == ['session-{}'.format(i) for i in range(6, 20)]
+        event.set()
+        dispatcher.stop()
+
+        assert dispatcher.metrics.get('rejected') == 14
+        assert dispatcher.metrics.get('running') == 0
+
+    @staticmethod
+    def test_stop(tcex):
+        """Test queued messages are processed on stop and later messages are dropped"""
+        dispatcher = MessageDispatcher(tcex, max_workers=2)
+        completed = []
+        for i in range(10):
+            dispatcher.submit('session-{}'.format(i), completed.append, (i,))
+        dispatcher.stop()
+
+        assert sorted(completed) == list(range(10))
+        assert not dispatcher.submit('session-10', completed.append, (10,))
+        assert dispatcher.metrics.get('queue depth') == 0
+        assert len(completed) == 10
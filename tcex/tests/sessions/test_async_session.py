@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Async Session Module."""
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+from tcex.tcex_ti.tcex_ti_tc_request import TiTcRequest  # noqa: E402 pylint: disable=C0413
+from tcex.tcex_ti.tcex_ti_tc_request_async import (  # noqa: E402 pylint: disable=C0413
+    AsyncTiTcRequest,
+)
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    """Local stand-in for the ThreatConnect indicators endpoints."""
+
+    failures = {}
+    protocol_version = 'HTTP/1.1'
+
+    def _send(self, status_code, data):
+        """Send a JSON response."""
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        """Handle a request."""
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        if not self.headers.get('Authorization', '').startswith('TC'):
+            return self._send(401, {'status': 'Failure'})
+
+        # fail the first request for a path (retry testing)
+        if self.failures.get(url.path):
+            self.failures[url.path] -= 1
+            return self._send(502, {'status': 'Failure'})
+
+        match = re.match(r'^/v2/indicators/addresses(?:/(.+))?$', url.path)
+        if match is None:
+            return self._send(404, {'status': 'Failure'})
+
+        if match.group(1) is not None:
+            # single, update
+            address = {'ip': match.group(1)}
+            if self.command == 'PUT':
+                address.update(json.loads(self.rfile.read(int(self.headers['Content-Length']))))
+            return self._send(200, {'status': 'Success', 'data': {'address': address}})
+
+        if self.command == 'POST':
+            # create
+            address = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            address['owner'] = params.get('owner')[0]
+            return self._send(201, {'status': 'Success', 'data': {'address': address}})
+
+        # many (25 indicators)
+        result_start = int(params.get('resultStart')[0])
+        result_limit = int(params.get('resultLimit')[0])
+        result_end = min(result_start + result_limit, 25)
+        addresses = [{'ip': '10.0.0.{}'.format(i)} for i in range(result_start, result_end)]
+        return self._send(200, {'status': 'Success', 'data': {'address': addresses}})
+
+    do_GET = _handle
+    do_POST = _handle
+    do_PUT = _handle
+
+    def log_message(self, format, *args):  # pylint: disable=W0622
+        """Disable logging."""
+
+
+class MockApiServer(ThreadingMixIn, HTTPServer):
+    """Threaded local stand-in API server."""
+
+    daemon_threads = True
+
+
+# pylint: disable=W0201
+class TestAsyncSession:
+    """Test the TcEx Async Session Module."""
+
+    def setup_class(self):
+        """Configure setup before all tests."""
+        self.server = MockApiServer(('127.0.0.1', 0), MockApiHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.api_path = 'http://127.0.0.1:{}'.format(self.server.server_port)
+
+    def teardown_class(self):
+        """Stop the stand-in server."""
+        self.server.shutdown()
+
+    def _ti(self, tcex):
+        """Return an AsyncTiTcRequest using the stand-in server."""
+        tcex.default_args.tc_api_path = self.api_path
+        tcex.async_session.backoff_factor = 0
+        return AsyncTiTcRequest(tcex)
+
+    def test_single(self, tcex):
+        """Test concurrent single requests from sync code"""
+        ti = self._ti(tcex)
+        MockApiHandler.failures['/v2/indicators/addresses/10.0.0.1'] = 1
+        ips = ['10.0.0.{}'.format(i) for i in range(50)]
+        responses = tcex.async_session.run_all(
+            [ti.single('indicators', 'addresses', ip) for ip in ips]
+        )
+        assert [r.status_code for r in responses] == [200] * 50
+        assert [r.json().get('data').get('address').get('ip') for r in responses] == ips
+        tcex.async_session.close()
+
+    def test_create_update(self, tcex):
+        """Test create and update"""
+        ti = self._ti(tcex)
+        r = tcex.async_session.run(
+            ti.create('indicators', 'addresses', {'ip': '10.0.0.1', 'rating': 5}, 'TCI')
+        )
+        assert r.status_code == 201
+        assert r.json().get('data').get('address').get('owner') == 'TCI'
+
+        r = tcex.async_session.run(
+            ti.update('indicators', 'addresses', '10.0.0.1', {'rating': 3}, owner='TCI')
+        )
+        assert r.ok
+        assert r.json().get('data').get('address') == {'ip': '10.0.0.1', 'rating': 3}
+        tcex.async_session.close()
+
+    def test_many(self, tcex):
+        """Test paginated many"""
+        ti = self._ti(tcex)
+        ti.result_limit = 10
+
+        async def many():
+            """Collect all indicators."""
+            return [i async for i in ti.many('indicators', 'addresses', 'address', owner='TCI')]
+
+        addresses = tcex.async_session.run(many())
+        assert [a.get('ip') for a in addresses] == ['10.0.0.{}'.format(i) for i in range(25)]
+        tcex.async_session.close()
+
+    def test_caller_thread_name(self, tcex, monkeypatch):
+        """Test requests are signed under the thread name that called run (service tokens)"""
+        ti = self._ti(tcex)
+        names = []
+        prepare = tcex.session.prepare
+
+        def record(*args, **kwargs):
+            """Record the thread name the request is signed under."""
+            names.append(threading.current_thread().name)
+            return prepare(*args, **kwargs)
+
+        monkeypatch.setattr(tcex.session, 'prepare', record)
+        ips = ['10.0.0.{}'.format(i) for i in range(5)]
+        thread = threading.Thread(
+            target=tcex.async_session.run_all,
+            args=([ti.single('indicators', 'addresses', ip) for ip in ips],),
+            name='pytest-session',
+        )
+        thread.start()
+        thread.join()
+        assert names == ['pytest-session'] * 5
+        tcex.async_session.close()
+
+    def test_sync_wrappers(self, tcex):
+        """Test the TiTcRequest concurrent methods wrapping the async client"""
+        self._ti(tcex)
+        ti = TiTcRequest(tcex)
+        ips = ['10.0.0.{}'.format(i) for i in range(20)]
+        responses = ti.single_concurrent('indicators', 'addresses', ips, owner='TCI')
+        assert [r.json().get('data').get('address').get('ip') for r in responses] == ips
+
+        data = [{'ip': ip} for ip in ips]
+        responses = ti.create_concurrent('indicators', 'addresses', data, 'TCI')
+        assert [r.status_code for r in responses] == [201] * 20
+
+        data = {ip: {'rating': 3} for ip in ips}
+        responses = ti.update_concurrent('indicators', 'addresses', data)
+        assert [r.json().get('data').get('address').get('rating') for r in responses] == [3] * 20
+        tcex.async_session.close()
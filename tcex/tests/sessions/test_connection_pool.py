@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Connection Pool Module."""
+from concurrent.futures import ThreadPoolExecutor
+
+from tcex.sessions import ConnectionPool
+from tcex.tcex_request import session_retry
+
+
+class TestConnectionPool:
+    """Test the TcEx Connection Pool Module."""
+
+    @staticmethod
+    def test_shared_pool(tcex):
+        """Test connections are reused across sessions"""
+        connection_pool = ConnectionPool.shared()
+        # restore the process wide settings for the other tests
+        settings = {
+            'num_pools': connection_pool.num_pools,
+            'maxsize': connection_pool.maxsize,
+            'block': connection_pool.block,
+        }
+        connection_pool.configure(maxsize=4, block=True)
+        try:
+            session = session_retry()
+            assert (
+                session.get_adapter('https://').poolmanager
+                is tcex.session.get_adapter('https://').poolmanager
+            )
+
+            def get_owners(i):  # pylint: disable=W0613
+                """Get owners."""
+                return tcex.session.get('/v2/owners').status_code
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                status_codes = list(executor.map(get_owners, range(40)))
+            assert status_codes == [200] * 40
+
+            metrics = [m for k, m in connection_pool.metrics.items() if k.startswith('https://')]
+            assert sum([m.get('checkouts') for m in metrics]) >= 40
+            assert all([m.get('new_connections') <= 4 for m in metrics])
+            assert all([m.get('in_use') == 0 for m in metrics])
+
+            # closing a session leaves the shared pool open
+            session.close()
+            assert connection_pool.metrics
+        finally:
+            connection_pool.configure(**settings)
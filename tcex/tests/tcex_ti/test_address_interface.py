@@ -110,6 +110,21 @@ class TestAddressIndicators:
         else:
             assert False
 
+    def test_address_many_prefetch(self):
+        """Test address many with prefetched pages."""
+        addresses = ['14.111.14.15', '17.15.30.41']
+        for ip in addresses:
+            self.address_create(ip)
+
+        ti = self.ti.indicator(indicator_type='Address', owner=tcex.args.tc_owner)
+        ti.tc_requests.result_limit = 5
+        sequential = [a.get('id') for a in ti.many()]
+        ordered = [a.get('id') for a in ti.many(prefetch=3)]
+        unordered = [a.get('id') for a in ti.many(prefetch=3, ordered=False)]
+        assert len(sequential) >= len(addresses)
+        assert ordered == sequential
+        assert sorted(unordered) == sorted(sequential)
+
     def test_address_get_include(self, ip='40.30.20.10'):
         """Test address get."""
         self.address_create(ip)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Threat Intel Module."""
+import threading
+
+from tcex.tcex_ti.tcex_ti_tc_request import TiTcRequest
+
+
+class MockResponse:
+    """Mock response for a page of indicators."""
+
+    def __init__(self, data):
+        """Initialize class properties."""
+        self.data = data
+        self.ok = True
+
+    def json(self):
+        """Return the response data."""
+        return {'status': 'Success', 'data': self.data}
+
+
+class MockTcEx:
+    """Mock TcEx with a session returning 25 indicators in pages."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.lock = threading.Lock()
+        self.session = self
+        self.threads = set()
+
+    def get(self, url, params=None):  # pylint: disable=W0613
+        """Return the page of indicators for the resultStart."""
+        with self.lock:
+            self.threads.add(threading.current_thread().name)
+        start = params.get('resultStart')
+        results = [{'id': i} for i in range(start, min(start + 5, 25))]
+        return MockResponse({'resultCount': 25, 'indicator': results})
+
+
+class TestTcRequestPrefetch:
+    """Test the TcEx Threat Intel Module."""
+
+    @staticmethod
+    def test_prefetch_thread_name():
+        """Test prefetched pages are retrieved with the caller thread name (service tokens)"""
+        tcex = MockTcEx()
+        tc_requests = TiTcRequest(tcex)
+        tc_requests.result_limit = 5
+
+        results = tc_requests._iterate(  # pylint: disable=W0212
+            '/v2/indicators', {}, 'indicator', prefetch=3
+        )
+        assert [r.get('id') for r in results] == list(range(25))
+        assert tcex.threads == {threading.current_thread().name}
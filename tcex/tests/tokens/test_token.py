@@ -53,6 +53,24 @@ class TestLogs:
         args = tcex.args  # noqa: F841; pylint: disable=unused-variable
         tcex.token.unregister_token('zzzzzz')  # hit except on unregister_token()
 
+    def test_register_thread_index(self, tcex):
+        """Test the thread name to key index."""
+        token_key = 'thread-index'
+        tcex.token.register_token(key=token_key, token='token', expires=int(time.time()) + 999)
+
+        keys = []
+        t = threading.Thread(
+            name='pytest-token-index',
+            target=lambda: keys.append(self.token_thread_key(tcex, token_key)),
+        )
+        t.start()
+        t.join()
+
+        assert keys == [(token_key, 'MainThread')]
+        assert 'pytest-token-index' not in tcex.token.thread_map
+        tcex.token.unregister_token(token_key)
+        assert token_key not in tcex.token.token_map
+
     def test_register_token_fail(self, tcex, tc_service_token):
         """Test thread file handler."""
         args = tcex.args  # noqa: F841; pylint: disable=unused-variable
@@ -137,6 +155,13 @@ class TestLogs:
 
         tcex.token.unregister_thread(key, self.thread_name)
 
+    def token_thread_key(self, tcex, key):
+        """Return the token key while registered and after unregistering the thread."""
+        tcex.token.register_thread(key, self.thread_name)
+        registered_key = tcex.token.key
+        tcex.token.unregister_thread(key, self.thread_name)
+        return registered_key, tcex.token.key
+
     def token_thread_pass(self, tcex, key, sleep=True, register_thread=True):
         """Test token is pass."""
         if register_thread:
@@ -84,6 +84,17 @@ class TestUtils:
         # TODO: replace with regex or date calculated differently
         assert str(dt).startswith(results)
 
+    def test_format_datetimes(self, tcex):
+        """Test format datetimes with repeated and empty values"""
+        date_format = '%Y-%m-%dT%H:%M:%SZ'
+        dates = ['2017-11-08T16:52:42Z', None, '', '2017-11-08T11:22:42.4-05:30']
+        assert tcex.utils.format_datetimes(dates * 2, tz='UTC', date_format=date_format) == [
+            '2017-11-08T16:52:42Z',
+            None,
+            None,
+            '2017-11-08T16:52:42Z',
+        ] * 2
+
     @pytest.mark.parametrize(
         'date,tz,pattern',
         [
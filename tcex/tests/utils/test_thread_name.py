@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""Test the TcEx Utils Module."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from tcex.utils import Utils
+
+
+class TestThreadName:
+    """Test the TcEx Utils Module."""
+
+    @staticmethod
+    def test_thread_name():
+        """Test a pool thread runs under the caller thread name and is restored"""
+        name = threading.current_thread().name
+
+        def execute(fail):
+            """Return the thread name inside the context."""
+            with Utils.thread_name(name):
+                if fail:
+                    raise RuntimeError(threading.current_thread().name)
+                return threading.current_thread().name
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='pytest-pool') as executor:
+            assert executor.submit(execute, False).result() == name
+            error = executor.submit(execute, True).exception()
+            assert str(error) == name
+            # the pool thread name is restored, also after an exception
+            worker_name = executor.submit(lambda: threading.current_thread().name).result()
+            assert worker_name.startswith('pytest-pool')